@@ -0,0 +1,107 @@
+# ============================================================================================
+#                   BENCHMARK: Batch Report Generation (warm worker processes)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Benchmark - Batch Reports'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# ============================================================================================
+
+"""
+Builds the same set of small per-entity reports (title, parameter table, a DataFrame table with
+heatmap and optionally a chart) with `ReportBatch` for several numbers of worker processes,
+and prints the reports per second and the speedup over the serial loop (`--workers 0`).
+
+Usage:
+------
+    python benchmarks/bench_batch_reports.py --reports 2000 --workers 0 1 2 4 8
+    python benchmarks/bench_batch_reports.py --reports 500 --charts
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from tool_reporter_lib import ReportHTML, ReportBatch
+
+# --------------------------------------------------------------------------------------------
+#                                  BENCHMARK FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def build_entity_report(entity_id: int, use_chart: bool = False) -> ReportHTML:
+    """Builds the report of one entity (module level, so the job can be pickled)."""
+    rng = np.random.default_rng(entity_id)
+    df  = pd.DataFrame(rng.normal(size = (50, 4)), columns = ['A', 'B', 'C', 'D'])
+
+    report = ReportHTML(title = f'Entity {entity_id}', sub_title = 'Nightly', use_title_background = False)
+    report.add_param_value_table({'Entity': entity_id, 'Rows': len(df), 'Mean A': f'{df.A.mean():.3f}'})
+    report.add_dataframe_table(df, highlight_columns = ['A', 'B'], round = 3)
+
+    if use_chart:
+        import matplotlib.pyplot as plt
+        plt.figure(figsize = (6, 3))
+        plt.plot(df.A.cumsum())
+        report.add_chart(plt)
+        plt.close('all')
+
+    return report
+
+# --------------------------------------------------------------------------------------------
+
+def run_benchmark(reports: int = 2000, workers: list[int] = [0, 1, 2, 4], use_chart: bool = False) -> dict:
+    """
+    Generates the reports once per number of workers (0 = serial, in this process).
+
+    Returns
+    -------
+    dict
+        Seconds and reports per second per number of workers, and the speedup over serial.
+    """
+    jobs   = [partial(build_entity_report, i, use_chart) for i in range(reports)]
+    result = {'reports': reports, 'cpus': os.cpu_count(), 'workers': {}}
+
+    for max_workers in workers:
+        folder_path = tempfile.mkdtemp(prefix = 'bench_batch_')
+        try:
+            with ReportBatch(max_workers) as batch:
+                t_start = time.perf_counter()
+                batch.generate(jobs, folder_path = folder_path)
+                seconds = time.perf_counter() - t_start
+        finally:
+            shutil.rmtree(folder_path)
+
+        result['workers'][max_workers] = {'s': seconds, 'reports_per_s': reports / seconds}
+
+    if 0 in result['workers']:
+        for res in result['workers'].values():
+            res['speedup'] = result['workers'][0]['s'] / res['s']
+    return result
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Batch report generation benchmark.')
+    parser.add_argument('--reports', type = int, default = 2000)
+    parser.add_argument('--workers', type = int, nargs = '+', default = [0, 1, 2, 4])
+    parser.add_argument('--charts',  action = 'store_true', help = 'add a chart to every report')
+    args = parser.parse_args()
+
+    result = run_benchmark(args.reports, args.workers, args.charts)
+
+    print(f"Reports:            {result['reports']} (CPUs: {result['cpus']})")
+    for max_workers, res in result['workers'].items():
+        speedup = f"{res['speedup']:>6.2f} x" if 'speedup' in res else ''
+        print(f"{f'{max_workers} workers:':<20}{res['s']:>8.2f} s {res['reports_per_s']:>10,.0f} reports/s {speedup}")
+
+# ============================================================================================
@@ -0,0 +1,122 @@
+# ============================================================================================
+#                   BENCHMARK: DataFrame Table Engines (fast vs pandas Styler)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Benchmark - DF Table Engines'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+#                     : Added the virtual scrolling table (columnar JSON) to the comparison
+# ============================================================================================
+
+"""
+Compares the 'fast' and 'styler' engines of `get_table_dataframe_element` on the same DataFrame
+(with heatmap columns and rounding): time, cells per second, html size, and checks that both
+engines produce the same cell texts. The virtual scrolling table (`--virtual`, html of the
+visible rows is rendered by the browser) is measured on the same DataFrame.
+
+Usage:
+------
+    python benchmarks/bench_df_table_engines.py --rows 20000 --columns 5
+    python benchmarks/bench_df_table_engines.py --rows 1000000 --columns 3 --no-styler --virtual
+"""
+
+import argparse
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from tool_reporter_lib.elements.report_element_table_df import get_table_dataframe_element
+from tool_reporter_lib.elements.report_element_table_df_virtual import get_table_dataframe_virtual_element
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+CELL_TEXT_PATTERN: re.Pattern = re.compile(r'<t[dh][^>]*>([^<]*)</t[dh]>')
+
+# --------------------------------------------------------------------------------------------
+#                                  BENCHMARK FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _make_dataframe(rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    """Builds a synthetic DataFrame with a few NaN values in every column."""
+    rng  = np.random.default_rng(seed)
+    data = rng.normal(size = (rows, columns))
+    data[rng.random(size = data.shape) < 0.01] = np.nan
+    return pd.DataFrame(data, columns = [f'col_{i}' for i in range(columns)])
+
+# --------------------------------------------------------------------------------------------
+
+def _render(df: pd.DataFrame, engine: str, highlight_columns: list[str], round: int) -> tuple[float, str]:
+    """Renders the table with the engine ('virtual' for the virtual table), returns the time and the html."""
+    t_start = time.perf_counter()
+    if engine == 'virtual':
+        html = get_table_dataframe_virtual_element(df, highlight_columns, round).body_content
+    else:
+        html = get_table_dataframe_element(df, highlight_columns, round, engine = engine).body_content
+    return time.perf_counter() - t_start, html
+
+# --------------------------------------------------------------------------------------------
+
+def run_benchmark(  rows       : int  = 20_000, 
+                    columns    : int  = 5, 
+                    highlighted: int  = 3, 
+                    round      : int  = 3, 
+                    styler     : bool = True, 
+                    virtual    : bool = False,
+                        ) -> dict:
+    """
+    Renders the same DataFrame with the engines ('styler' optional, too slow for millions of
+    cells) and optionally as a virtual table.
+
+    Returns
+    -------
+    dict
+        Seconds, cells per second and html size (MB) per engine, the speedup of 'fast' over
+        'styler' and whether their cell texts match.
+    """
+    df                = _make_dataframe(rows, columns)
+    highlight_columns = list(df.columns[:highlighted])
+    cells             = rows * columns
+    engines           = (['styler'] if styler else []) + ['fast'] + (['virtual'] if virtual else [])
+    result            = {'rows': rows, 'columns': columns, 'engines': {}}
+    html_tables       = {}
+
+    for engine in engines:
+        seconds, html_tables[engine] = _render(df, engine, highlight_columns, round)
+        result['engines'][engine]    = {'s'          : seconds,
+                                        'cells_per_s': cells / seconds,
+                                        'mb'         : len(html_tables[engine].encode('utf-8')) / 2**20, }
+
+    if styler:
+        result['speedup']              = result['engines']['styler']['s'] / result['engines']['fast']['s']
+        result['identical_cell_texts'] = (CELL_TEXT_PATTERN.findall(html_tables['styler']) 
+                                          == CELL_TEXT_PATTERN.findall(html_tables['fast']))
+    return result
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'DataFrame table engines benchmark.')
+    parser.add_argument('--rows',        type = int, default = 20_000)
+    parser.add_argument('--columns',     type = int, default = 5)
+    parser.add_argument('--highlighted', type = int, default = 3)
+    parser.add_argument('--round',       type = int, default = 3)
+    parser.add_argument('--no-styler',   action = 'store_true', help = 'skip the (slow) styler engine')
+    parser.add_argument('--virtual',     action = 'store_true', help = 'also render the virtual scrolling table')
+    args = parser.parse_args()
+
+    result = run_benchmark(args.rows, args.columns, args.highlighted, args.round, not args.no_styler, args.virtual)
+
+    print(f"Rows x Columns:     {result['rows']} x {result['columns']}")
+    for engine, res in result['engines'].items():
+        print(f"{engine + ':':<20}{res['s']:>8.3f} s {res['cells_per_s']:>14,.0f} cells/s {res['mb']:>8.2f} MB")
+    if 'speedup' in result:
+        print(f"Speedup (fast):     {result['speedup']:>8.1f} x")
+        print(f"Identical texts:    {result['identical_cell_texts']}")
+
+# ============================================================================================
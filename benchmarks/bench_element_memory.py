@@ -0,0 +1,106 @@
+# ============================================================================================
+#                   BENCHMARK: ReportElement Memory Footprint
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Benchmark - Element Memory'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# ============================================================================================
+
+"""
+Measures the memory of N report elements with `tracemalloc`: the slotted `ReportElement`
+against a plain `__dict__` based class with the pre-v0.1.0 layout (type, body_content,
+style_content attributes).
+
+Two workloads are measured:
+    - empty   : bare elements, only the per-element overhead.
+    - text    : small text elements from `get_text_element`, body strings included.
+
+Usage:
+------
+    python benchmarks/bench_element_memory.py --elements 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from tool_reporter_lib.elements.report_element import ReportElement, ReportElementTypes
+from tool_reporter_lib.elements.report_element_text import get_text_element
+
+# --------------------------------------------------------------------------------------------
+#                              REFERENCE (BEFORE) ELEMENT:
+# --------------------------------------------------------------------------------------------
+
+class _DictReportElement:
+    """The pre-v0.1.0 ReportElement layout: a plain class with a per-instance __dict__."""
+
+    def __init__(self) -> None:
+        self.type         : ReportElementTypes = ReportElementTypes.NONE
+        self.body_content : str = ''
+        self.style_content: str = ''
+
+# --------------------------------------------------------------------------------------------
+
+def _text_dict_element(text: str) -> _DictReportElement:
+    """Same content as `get_text_element`, stored in the reference class."""
+    element              = _DictReportElement()
+    element.type         = ReportElementTypes.TEXT
+    element.body_content = get_text_element(text).body_content
+    return element
+
+# --------------------------------------------------------------------------------------------
+#                                  BENCHMARK FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _measure(factory, amount: int) -> int:
+    """Returns the bytes allocated (and kept) by `amount` elements built by `factory(i)`."""
+    gc.collect()
+    tracemalloc.start()
+    elements = [factory(i) for i in range(amount)]
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del elements
+    return current
+
+# --------------------------------------------------------------------------------------------
+
+def run_benchmark(amount: int = 100_000) -> dict:
+    """
+    Runs both workloads for both element classes.
+
+    Returns
+    -------
+    dict
+        Bytes per element for each workload and class.
+    """
+    res = {'elements': amount}
+
+    res['empty_dict_bytes']  = _measure(lambda i: _DictReportElement(), amount) / amount
+    res['empty_slots_bytes'] = _measure(lambda i: ReportElement(), amount) / amount
+    res['text_dict_bytes']   = _measure(lambda i: _text_dict_element(f'Text {i}'), amount) / amount
+    res['text_slots_bytes']  = _measure(lambda i: get_text_element(f'Text {i}'), amount) / amount
+
+    return res
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'ReportElement memory benchmark.')
+    parser.add_argument('--elements', type = int, default = 100_000)
+    args = parser.parse_args()
+
+    result = run_benchmark(args.elements)
+
+    print(f"Elements: {result['elements']:,}")
+    print(f"{'':<16}{'__dict__ (before)':>20}{'__slots__ (after)':>20}{'saved':>10}")
+    for workload in ['empty', 'text']:
+        before = result[f'{workload}_dict_bytes']
+        after  = result[f'{workload}_slots_bytes']
+        print(f"{workload + ' [B/elem]':<16}{before:>20.1f}{after:>20.1f}{1 - after / before:>10.0%}")
+
+# ============================================================================================
@@ -0,0 +1,110 @@
+# ============================================================================================
+#                   BENCHMARK: DataFrame Heatmap Coloring (per-cell vs vectorized)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Benchmark - Heatmap Colors'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# ============================================================================================
+
+"""
+Compares the per-cell heatmap coloring (`Series.apply(value_to_color)`, the path used by
+`_style_dataframe` before v0.1.0) with the vectorized `values_to_colors`, and checks that both
+produce identical colors.
+
+Usage:
+------
+    python benchmarks/bench_heatmap_colors.py --rows 50000 --columns 3
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from tool_reporter_lib.elements.value_to_color import value_to_color, values_to_colors
+
+# --------------------------------------------------------------------------------------------
+#                                  BENCHMARK FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _make_dataframe(rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    """Builds a synthetic DataFrame with a few NaN values in every column."""
+    rng  = np.random.default_rng(seed)
+    data = rng.normal(size = (rows, columns))
+    data[rng.random(size = data.shape) < 0.01] = np.nan
+    return pd.DataFrame(data, columns = [f'col_{i}' for i in range(columns)])
+
+# --------------------------------------------------------------------------------------------
+
+def _color_per_cell(df: pd.DataFrame, colormap_name: str, used_part: float) -> list:
+    """Reference path: one `value_to_color` call per cell."""
+    res = []
+    for col in df.columns:
+        res.append(df[col].apply(value_to_color, args = (df[col].min(), df[col].max(), colormap_name, '#ff0000', used_part)))
+    return res
+
+# --------------------------------------------------------------------------------------------
+
+def _color_vectorized(df: pd.DataFrame, colormap_name: str, used_part: float) -> list:
+    """Batched path: one `values_to_colors` call per column."""
+    res = []
+    for col in df.columns:
+        res.append(values_to_colors(df[col].to_numpy(), df[col].min(), df[col].max(), colormap_name, '#ff0000', used_part))
+    return res
+
+# --------------------------------------------------------------------------------------------
+
+def run_benchmark(rows: int = 50_000, columns: int = 3, colormap_name: str = 'coolwarm', used_part: float = 0.6) -> dict:
+    """
+    Runs both coloring paths on the same DataFrame.
+
+    Returns
+    -------
+    dict
+        Rows per second for both paths, the speedup and whether the colors match.
+    """
+    df = _make_dataframe(rows, columns)
+
+    t_start      = time.perf_counter()
+    per_cell     = _color_per_cell(df, colormap_name, used_part)
+    t_per_cell   = time.perf_counter() - t_start
+
+    t_start      = time.perf_counter()
+    vectorized   = _color_vectorized(df, colormap_name, used_part)
+    t_vectorized = time.perf_counter() - t_start
+
+    identical = all(list(a) == list(b) for a, b in zip(per_cell, vectorized))
+
+    return {
+        'rows'                 : rows,
+        'columns'              : columns,
+        'per_cell_rows_per_s'  : rows / t_per_cell,
+        'vectorized_rows_per_s': rows / t_vectorized,
+        'speedup'              : t_per_cell / t_vectorized,
+        'identical_colors'     : identical,
+    }
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Heatmap coloring benchmark.')
+    parser.add_argument('--rows',     type = int, default = 50_000)
+    parser.add_argument('--columns',  type = int, default = 3)
+    parser.add_argument('--colormap', type = str, default = 'coolwarm')
+    args = parser.parse_args()
+
+    result = run_benchmark(args.rows, args.columns, args.colormap)
+
+    print(f"Rows x Columns:     {result['rows']} x {result['columns']}")
+    print(f"Per-cell (before):  {result['per_cell_rows_per_s']:>14,.0f} rows/s")
+    print(f"Vectorized (after): {result['vectorized_rows_per_s']:>14,.0f} rows/s")
+    print(f"Speedup:            {result['speedup']:>14.1f} x")
+    print(f"Identical colors:   {result['identical_colors']}")
+
+# ============================================================================================
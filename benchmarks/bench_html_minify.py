@@ -0,0 +1,130 @@
+# ============================================================================================
+#                   BENCHMARK: Streaming HTML Minifier
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Benchmark - HTML Minify'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# ============================================================================================
+
+"""
+Builds a report of about `--size-mb` MB (text, console text, parameter tables, DataFrame
+tables with heatmap, code blocks, show / hide regions; charts with `--charts`), then minifies
+its html chunks (as streamed by `save()`) with `HtmlMinifier` and prints the bytes saved and
+the throughput in MB/s. With `--legacy` the whole-document `get_clean_HTML_code()` is timed
+on the same html for reference.
+
+Usage:
+------
+    python benchmarks/bench_html_minify.py --size-mb 100
+    python benchmarks/bench_html_minify.py --size-mb 20 --charts --legacy
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from tool_reporter_lib import ReportHTML
+from tool_reporter_lib.utils.report_minify import HtmlMinifier
+from tool_reporter_lib.utils.report_utils import get_clean_HTML_code
+
+# --------------------------------------------------------------------------------------------
+#                                  BENCHMARK FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def build_report_chunks(size_mb: float = 100, use_charts: bool = False) -> list[str]:
+    """
+    Renders one set of elements and repeats it until the report has about `size_mb` MB,
+    returns the html chunks of the report (elements are rendered once, not timed).
+    """
+    rng    = np.random.default_rng(0)
+    df     = pd.DataFrame(rng.normal(size = (200, 6)), columns = list('ABCDEF'))
+    report = ReportHTML(title = 'Minify Benchmark', sub_title = 'Benchmark', use_title_background = False)
+
+    report.add_showhide_region_open('Details')
+    report.add_title('Section')
+    report.add_text('Some text\n    with indented lines.')
+    report.add_text_console(df.describe().to_string())
+    report.add_param_value_table({f'Param {i}': f'Value {i}' for i in range(20)})
+    report.add_dataframe_table(df, highlight_columns = ['A', 'B'], round = 3)
+    report.add_code(build_report_chunks)
+    report.add_alert_box('Check the values.', 'w')
+    report.add_showhide_region_close()
+
+    if use_charts:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        plt.figure(figsize = (8, 3))
+        plt.plot(df.A.cumsum())
+        report.add_chart(plt)
+        plt.close('all')
+
+    unit      = report.elements_list[2:]
+    unit_size = sum(len(element.get_body_str()) + len(element.get_style_str()) for element in unit)
+    repeats   = max(1, int(size_mb * 2**20 / unit_size))
+
+    report.elements_list = report.elements_list[:2] + unit * repeats
+    return list(report._iter_html_chunks())
+
+# --------------------------------------------------------------------------------------------
+
+def run_benchmark(size_mb: float = 100, use_charts: bool = False, use_legacy: bool = False) -> dict:
+    """
+    Minifies the html chunks of the report.
+
+    Returns
+    -------
+    dict
+        Input and output bytes, seconds and MB/s of the streaming minifier (and of the legacy
+        whole-document cleaner with use_legacy).
+    """
+    chunks   = build_report_chunks(size_mb, use_charts)
+    in_bytes = sum(len(chunk.encode('utf-8')) for chunk in chunks)
+    res      = {'chunks': len(chunks), 'in_bytes': in_bytes}
+
+    minifier  = HtmlMinifier()
+    out_bytes = 0
+    t_start   = time.perf_counter()
+    for chunk in chunks:
+        out_bytes += len(minifier.feed(chunk).encode('utf-8'))
+    out_bytes += len(minifier.close().encode('utf-8'))
+    seconds   = time.perf_counter() - t_start
+
+    res['streaming'] = {'s': seconds, 'out_bytes': out_bytes, 'mb_per_s': in_bytes / 2**20 / seconds}
+
+    if use_legacy:
+        html_code = ''.join(chunks)
+        t_start   = time.perf_counter()
+        out_bytes = len(get_clean_HTML_code(html_code).encode('utf-8'))
+        seconds   = time.perf_counter() - t_start
+        res['legacy'] = {'s': seconds, 'out_bytes': out_bytes, 'mb_per_s': in_bytes / 2**20 / seconds}
+
+    return res
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Streaming html minifier benchmark.')
+    parser.add_argument('--size-mb', type = float, default = 100)
+    parser.add_argument('--charts',  action = 'store_true', help = 'add a chart to every element set')
+    parser.add_argument('--legacy',  action = 'store_true', help = 'time get_clean_HTML_code too (whole document)')
+    args = parser.parse_args()
+
+    result = run_benchmark(args.size_mb, args.charts, args.legacy)
+
+    print(f"Report:  {result['in_bytes'] / 2**20:,.1f} MB in {result['chunks']:,} chunks")
+    print(f"{'':<12}{'out [MB]':>12}{'saved':>10}{'time [s]':>10}{'MB/s':>10}")
+    for name in ['streaming', 'legacy']:
+        if name in result:
+            res = result[name]
+            print(f"{name:<12}{res['out_bytes'] / 2**20:>12,.1f}{1 - res['out_bytes'] / result['in_bytes']:>10.1%}"
+                  f"{res['s']:>10.2f}{res['mb_per_s']:>10.1f}")
+
+# ============================================================================================
@@ -0,0 +1,119 @@
+# ============================================================================================
+#                   BENCHMARK: Package Import Time (python -X importtime)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Benchmark - Import Time'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# ============================================================================================
+
+"""
+Measures the import time of `tool_reporter_lib` in fresh interpreters with `python -X importtime`,
+and lists the heavy dependencies (matplotlib, pandas, numpy, keyring, webbrowser) loaded by the
+import. They must be loaded lazily, on the first chart / table / save.
+
+With `--max-ms` the script is a regression guard: it exits with code 1 if the median cumulative
+import time is above the limit, or if a heavy dependency is loaded by the import.
+
+Usage:
+------
+    python benchmarks/bench_import_time.py --runs 5
+    python benchmarks/bench_import_time.py --runs 5 --max-ms 150
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+PACKAGE_NAME: str = 'tool_reporter_lib'
+SRC_PATH    : str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+HEAVY_MODULES: list[str] = ['matplotlib', 'pandas', 'numpy', 'keyring', 'webbrowser']
+
+# --------------------------------------------------------------------------------------------
+#                                  BENCHMARK FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _import_once() -> tuple[float, list[str]]:
+    """
+    Imports the package in a fresh interpreter.
+
+    Returns the cumulative import time of the package in ms, and the heavy modules it loaded.
+    """
+    env = {**os.environ, 'PYTHONPATH': SRC_PATH + os.pathsep + os.environ.get('PYTHONPATH', '')}
+    res = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {PACKAGE_NAME}'],
+                         env = env, capture_output = True, text = True, check = True)
+
+    cumulative_us = None
+    loaded        = set()
+
+    # stderr lines: "import time: <self us> | <cumulative us> | <indent><module>"
+    for line in res.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)', line)
+        if not match:
+            continue
+        module = match.group(4)
+        if module == PACKAGE_NAME:
+            cumulative_us = int(match.group(2))
+        if module.split('.')[0] in HEAVY_MODULES:
+            loaded.add(module.split('.')[0])
+
+    return cumulative_us / 1000, sorted(loaded)
+
+# --------------------------------------------------------------------------------------------
+
+def run_benchmark(runs: int = 5) -> dict:
+    """
+    Imports the package `runs` times, each in a fresh interpreter.
+
+    Returns
+    -------
+    dict
+        Median and min import time in ms, and the heavy modules loaded by the import.
+    """
+    times  = []
+    loaded = set()
+
+    for _ in range(runs):
+        import_ms, heavy = _import_once()
+        times.append(import_ms)
+        loaded.update(heavy)
+
+    return {
+        'runs'         : runs,
+        'median_ms'    : statistics.median(times),
+        'min_ms'       : min(times),
+        'heavy_loaded' : sorted(loaded),
+    }
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Package import time benchmark.')
+    parser.add_argument('--runs',   type = int,   default = 5)
+    parser.add_argument('--max-ms', type = float, default = None, help = 'fail if the median is above')
+    args = parser.parse_args()
+
+    result = run_benchmark(args.runs)
+
+    print(f"Runs:            {result['runs']}")
+    print(f"Median import:   {result['median_ms']:>8.1f} ms")
+    print(f"Min import:      {result['min_ms']:>8.1f} ms")
+    print(f"Heavy modules:   {', '.join(result['heavy_loaded']) or '-'}")
+
+    if args.max_ms is not None:
+        if result['median_ms'] > args.max_ms or result['heavy_loaded']:
+            print(f"FAILED: limit {args.max_ms} ms, no heavy modules allowed.")
+            sys.exit(1)
+        print('OK')
+
+# ============================================================================================
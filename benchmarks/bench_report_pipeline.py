@@ -0,0 +1,264 @@
+# ============================================================================================
+#                   BENCHMARK: Report Build and Save Pipeline (end to end)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Benchmark - Report Pipeline'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# ============================================================================================
+
+"""
+End to end benchmark of `ReportHTML` on reproducible synthetic workloads:
+
+    - text      : N text elements                         (`_get_html_str` / writer)
+    - charts    : N line charts via `add_chart`            (`get_chart_element`, savefig)
+    - dataframe : large DataFrames with `highlight_columns` (`_style_dataframe`, Styler)
+    - showhide  : nested show/hide regions with param tables
+
+Every workload runs in a fresh interpreter (so the peak RSS belongs to the workload only) and
+reports the build time (`add_*` calls), the save time (HTML assembly and file write), the peak
+RSS and the output file size.
+
+The results can be stored as a baseline (`--save-baseline`) and compared to it (`--check`):
+the check fails (exit code 1) if a time grows above `--time-tolerance` times the baseline, or
+the peak RSS / output size above `--size-tolerance` times the baseline.
+
+Usage:
+------
+    python benchmarks/bench_report_pipeline.py
+    python benchmarks/bench_report_pipeline.py --save-baseline
+    python benchmarks/bench_report_pipeline.py --check --workloads text dataframe
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+BENCHMARKS_PATH: str = os.path.dirname(os.path.abspath(__file__))
+SRC_PATH       : str = os.path.join(os.path.dirname(BENCHMARKS_PATH), 'src')
+BASELINE_PATH  : str = os.path.join(BENCHMARKS_PATH, 'baseline_report_pipeline.json')
+
+WORKLOADS: list[str] = ['text', 'charts', 'dataframe', 'showhide']
+
+# Default workload sizes (scaled by --scale):
+WORKLOAD_SIZES: dict[str, int] = {
+    'text'     : 50000,     # text elements
+    'charts'   : 20,        # charts
+    'dataframe': 5000,      # rows of each of the 3 tables (6 columns, 3 highlighted)
+    'showhide' : 4000,      # regions, nested 4 levels deep
+    }
+
+# --------------------------------------------------------------------------------------------
+#                                  WORKLOAD BUILDERS:
+# --------------------------------------------------------------------------------------------
+
+def _build_text(report, size: int) -> None:
+    """N text elements with a few lines each."""
+    for i in range(size):
+        report.add_text(f'Paragraph {i}: ' + 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 4)
+
+# --------------------------------------------------------------------------------------------
+
+def _build_charts(report, size: int) -> None:
+    """N line charts of random walks, added with `add_chart`."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    for i in range(size):
+        plt.figure(figsize = (8, 3), dpi = 100)
+        plt.plot(np.cumsum(rng.normal(size = 1000)))
+        plt.title(f'Chart {i}')
+        report.add_chart(plt)
+        plt.close('all')
+
+# --------------------------------------------------------------------------------------------
+
+def _build_dataframe(report, size: int) -> None:
+    """3 DataFrames of `size` rows, 6 columns with NaN values, 3 highlighted, rounded."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    for i in range(3):
+        data = rng.normal(size = (size, 6))
+        data[rng.random(size = data.shape) < 0.01] = np.nan
+        df   = pd.DataFrame(data, columns = [f'col_{c}' for c in range(6)])
+        report.add_dataframe_table(df, highlight_columns = ['col_0', 'col_2', 'col_4'], round = 3)
+
+# --------------------------------------------------------------------------------------------
+
+def _build_showhide(report, size: int) -> None:
+    """`size` show/hide regions, nested 4 levels deep, each with a text and a param table."""
+    depth = 4
+    for i in range(size // depth):
+        for level in range(depth):
+            report.add_showhide_region_open(f'Region {i}.{level}')
+            report.add_text(f'Region {i} level {level}')
+            report.add_param_value_table({f'param_{p}': p * 1.5 for p in range(10)})
+        for level in range(depth):
+            report.add_showhide_region_close()
+
+# --------------------------------------------------------------------------------------------
+
+_WORKLOAD_BUILDERS = {
+    'text'     : _build_text,
+    'charts'   : _build_charts,
+    'dataframe': _build_dataframe,
+    'showhide' : _build_showhide,
+    }
+
+# --------------------------------------------------------------------------------------------
+#                                  BENCHMARK FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _run_workload_in_process(workload: str, size: int) -> dict:
+    """
+    Runs one workload in the current process (called in the worker interpreter).
+    """
+    import random
+    random.seed(0)
+
+    from tool_reporter_lib import ReportHTML, Reports_Settings
+
+    with tempfile.TemporaryDirectory() as folder_path:
+        Reports_Settings.set_folder_path(folder_path)
+
+        t_start = time.perf_counter()
+        report  = ReportHTML(f'Benchmark {workload}', file_name = f'bench_{workload}', open_saved_file = False)
+        _WORKLOAD_BUILDERS[workload](report, size)
+        t_build = time.perf_counter() - t_start
+
+        t_start = time.perf_counter()
+        report.save()
+        t_save  = time.perf_counter() - t_start
+
+        output_bytes = os.path.getsize(report._file_path)
+
+    # ru_maxrss: kilobytes on Linux, bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss = peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+    return {
+        'workload'    : workload,
+        'size'        : size,
+        'build_s'     : t_build,
+        'save_s'      : t_save,
+        'total_s'     : t_build + t_save,
+        'peak_rss_mb' : peak_rss / 2**20,
+        'output_mb'   : output_bytes / 2**20,
+    }
+
+# --------------------------------------------------------------------------------------------
+
+def run_workload(workload: str, size: int) -> dict:
+    """
+    Runs one workload in a fresh interpreter and returns its measurements.
+    """
+    env = {**os.environ, 'PYTHONPATH': SRC_PATH + os.pathsep + os.environ.get('PYTHONPATH', '')}
+    res = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', workload, '--size', str(size)],
+                         env = env, capture_output = True, text = True, check = True)
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+# --------------------------------------------------------------------------------------------
+
+def run_benchmark(workloads: list[str] = WORKLOADS, scale: float = 1.0) -> dict:
+    """
+    Runs the workloads, each in a fresh interpreter.
+
+    Returns
+    -------
+    dict
+        Environment info and the measurements of every workload.
+    """
+    return {
+        'python'   : platform.python_version(),
+        'platform' : platform.platform(),
+        'scale'    : scale,
+        'workloads': {w: run_workload(w, max(1, int(WORKLOAD_SIZES[w] * scale))) for w in workloads},
+    }
+
+# --------------------------------------------------------------------------------------------
+
+def compare_to_baseline( result        : dict,
+                         baseline      : dict,
+                         time_tolerance: float = 1.5,
+                         size_tolerance: float = 1.2,
+                            ) -> list[str]:
+    """
+    Compares the results with the baseline, returns the list of regressions (empty if none).
+    """
+    regressions = []
+
+    for workload, current in result['workloads'].items():
+        base = baseline['workloads'].get(workload)
+        if base is None or base['size'] != current['size']:
+            continue
+
+        for key, tolerance in [('build_s', time_tolerance), ('save_s', time_tolerance),
+                               ('peak_rss_mb', size_tolerance), ('output_mb', size_tolerance)]:
+            if current[key] > base[key] * tolerance:
+                regressions.append(f'{workload}.{key}: {current[key]:.3f} > {base[key]:.3f} x {tolerance}')
+
+    return regressions
+
+# --------------------------------------------------------------------------------------------
+
+def _print_result(result: dict) -> None:
+    """Prints the results as a table."""
+    print(f"Python {result['python']} @ {result['platform']} (scale {result['scale']})")
+    print(f"{'workload':<11}{'size':>7}{'build [s]':>11}{'save [s]':>10}{'total [s]':>11}{'peak RSS [MB]':>15}{'output [MB]':>13}")
+    for res in result['workloads'].values():
+        print(f"{res['workload']:<11}{res['size']:>7}{res['build_s']:>11.3f}{res['save_s']:>10.3f}"
+              f"{res['total_s']:>11.3f}{res['peak_rss_mb']:>15.1f}{res['output_mb']:>13.2f}")
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Report build and save pipeline benchmark.')
+    parser.add_argument('--workloads',      nargs = '+', default = WORKLOADS, choices = WORKLOADS)
+    parser.add_argument('--scale',          type = float, default = 1.0, help = 'multiplies the workload sizes')
+    parser.add_argument('--save-baseline',  action = 'store_true', help = f'store the results to {os.path.basename(BASELINE_PATH)}')
+    parser.add_argument('--check',          action = 'store_true', help = 'compare the results with the baseline')
+    parser.add_argument('--time-tolerance', type = float, default = 1.5)
+    parser.add_argument('--size-tolerance', type = float, default = 1.2)
+    parser.add_argument('--worker',         choices = WORKLOADS, help = argparse.SUPPRESS)
+    parser.add_argument('--size',           type = int, help = argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_run_workload_in_process(args.worker, args.size)))
+        sys.exit(0)
+
+    result = run_benchmark(args.workloads, args.scale)
+    _print_result(result)
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w') as file:
+            json.dump(result, file, indent = 4)
+        print(f'Baseline saved: {BASELINE_PATH}')
+
+    if args.check:
+        with open(BASELINE_PATH, 'r') as file:
+            baseline = json.load(file)
+        regressions = compare_to_baseline(result, baseline, args.time_tolerance, args.size_tolerance)
+        for regression in regressions:
+            print(f'REGRESSION: {regression}')
+        print('FAILED' if regressions else 'OK')
+        sys.exit(1 if regressions else 0)
+
+# ============================================================================================
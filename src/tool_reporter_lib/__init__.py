@@ -64,7 +64,7 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 # ============================================================================================
 
 from .utils.report_settings import Reports_Settings
-Reports_Settings.activate_default_report_path()   # Set Default Report Path from the Settings.
+# The default report path (system keyring) is activated on the first save, not at import.
 
 # ============================================================================================
 #
@@ -73,5 +73,6 @@ Reports_Settings.activate_default_report_path()   # Set Default Report Path from
 # ============================================================================================
 
 from .report_generator import ReportHTML
+from .report_batch import ReportBatch, generate_reports
 
 # ============================================================================================
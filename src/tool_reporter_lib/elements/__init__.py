@@ -44,8 +44,9 @@ List of available report element functions, each generating a different componen
 """
 
 from .report_element_alert_box         import get_alert_box_element
-from .report_element_chart             import get_chart_element
+from .report_element_chart             import get_chart_element, get_chart_base64, get_chart_image, get_chart_image_bytes, get_chart_element_from_base64, get_chart_element_from_asset
 from .report_element_code              import get_code_element
+from .report_code_highlight            import highlight_python_code, clear_code_highlight_cache
 from .report_element_footer            import get_footer_element
 from .report_element_header_title      import get_header_title
 from .report_element_horizontal_line   import get_horizontal_line_element
@@ -54,6 +55,7 @@ from .report_element_showhide          import get_showhide_region_open_element,
 from .report_element_space             import get_space_element
 from .report_element_style             import get_style_element
 from .report_element_table_df          import get_table_dataframe_element
+from .report_element_table_df_virtual  import get_table_dataframe_virtual_element
 from .report_element_text              import get_text_element
 from .report_element_text_console      import get_text_console_element
 from .report_element_title             import get_title_element
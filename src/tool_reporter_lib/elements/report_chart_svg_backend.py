@@ -0,0 +1,127 @@
+# ============================================================================================
+#                   Reporter - Chart SVG Backend (per call SVG settings)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-17'
+_name_:           str = 'Reporter - Chart SVG Backend'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-17 : Initial Release
+# ============================================================================================
+
+"""
+matplotlib backend used by the inline SVG charts (`savefig(backend = CHART_SVG_BACKEND)`).
+
+The path simplification threshold and the id hash salt are arguments of `print_svg()`, not
+matplotlib rcParams, so a chart never sees (or leaves behind) the settings of another chart.
+Imported by `savefig()` on the first SVG chart only.
+"""
+
+import codecs
+import copy
+import hashlib
+
+from typing import Optional
+
+from matplotlib import cbook
+from matplotlib.backends.backend_mixed import MixedModeRenderer
+from matplotlib.backends.backend_svg import FigureCanvasSVG, RendererSVG
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+# The `savefig()` backend name of this module:
+CHART_SVG_BACKEND: str = f'module://{__name__}'
+
+# Salt of the generated element ids (clip paths, patches), fixed for a reproducible output:
+CHART_SVG_HASH_SALT: str = 'tool_reporter_lib'
+
+# ============================================================================================
+#                                SVG RENDERER CLASS
+# ============================================================================================
+
+class RendererChartSVG(RendererSVG):
+    """
+    SVG renderer with its own path simplification threshold (None for the paths' own) and id
+    hash salt, instead of `path.simplify_threshold` and `svg.hashsalt` of the rcParams.
+    """
+
+    def __init__(   self,
+                    *args,
+                    simplify_threshold: Optional[float] = None,
+                    hashsalt          : str             = CHART_SVG_HASH_SALT,
+                    **kwargs,
+                        ) -> None:
+        self._simplify_threshold: Optional[float] = simplify_threshold
+        self._hashsalt          : str             = hashsalt
+        super().__init__(*args, **kwargs)
+
+    # --------------------------------------------------------------------------------------------
+
+    def _make_id(self, type: str, content) -> str:
+        """
+        Returns the id of a definition, the hash of the salt and the content.
+        """
+        digest = hashlib.sha256()
+        digest.update(self._hashsalt.encode('utf-8'))
+        digest.update(str(content).encode('utf-8'))
+        return f'{type}{digest.hexdigest()[:10]}'
+
+    # --------------------------------------------------------------------------------------------
+
+    def _convert_path(self, path, transform = None, clip = None, simplify = None, sketch = None) -> str:
+        """
+        Converts the path to svg path data, simplified with the threshold of the renderer.
+        """
+        if simplify and self._simplify_threshold is not None:
+            path                    = copy.copy(path)
+            path.should_simplify    = True
+            path.simplify_threshold = self._simplify_threshold
+        return super()._convert_path(path, transform, clip, simplify, sketch)
+
+# ============================================================================================
+#                                SVG CANVAS CLASS
+# ============================================================================================
+
+class FigureCanvasChartSVG(FigureCanvasSVG):
+    """
+    SVG canvas rendering with `RendererChartSVG`, `print_svg()` takes its settings.
+    """
+
+    def print_svg(  self,
+                    filename,
+                    *,
+                    bbox_inches_restore = None,
+                    metadata            = None,
+                    simplify_threshold  : Optional[float] = None,
+                    hashsalt            : str             = CHART_SVG_HASH_SALT,
+                    **kwargs,
+                        ) -> None:
+        """
+        Writes the figure as SVG like `FigureCanvasSVG.print_svg()`, with the simplification
+        threshold and the id hash salt of this call. The other `print_figure()` arguments of the
+        raster formats (dpi, facecolor, ...) are not used, like by matplotlib's own backends.
+        """
+        with cbook.open_file_cm(filename, 'w', encoding = 'utf-8') as fh:
+            if not cbook.file_requires_unicode(fh):
+                fh = codecs.getwriter('utf-8')(fh)
+
+            dpi = self.figure.dpi
+            self.figure.dpi = 72
+            width, height = self.figure.get_size_inches()
+
+            renderer = MixedModeRenderer(   self.figure, width, height, dpi,
+                                            RendererChartSVG(   width * 72, height * 72, fh,
+                                                                image_dpi          = dpi,
+                                                                metadata           = metadata,
+                                                                simplify_threshold = simplify_threshold,
+                                                                hashsalt           = hashsalt),
+                                            bbox_inches_restore = bbox_inches_restore)
+            self.figure.draw(renderer)
+            renderer.finalize()
+
+# The canvas class looked up by `savefig(backend = ...)`:
+FigureCanvas = FigureCanvasChartSVG
+
+# ============================================================================================
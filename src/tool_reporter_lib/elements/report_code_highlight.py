@@ -0,0 +1,186 @@
+import builtins
+import hashlib
+import html
+import io
+import keyword
+import threading
+import tokenize
+
+from collections import OrderedDict
+from typing import Optional
+
+# ============================================================================================
+# Meta Information
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'report code highlight'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release: offline Python highlighting (tokenize), cached by source hash.
+# ============================================================================================
+
+# --- TODO : ---------------------------------------------------------------------------------
+# - Other languages (the CDN highlight.js is still available for them).
+# --------------------------------------------------------------------------------------------
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+CODE_HIGHLIGHT_CACHE_MAX_SIZE: int = 256
+
+# highlight.js class names and the colors of its 'vs' theme, so both highlighters look the same:
+CODE_HIGHLIGHT_STYLE: str = '''
+pre code.hljs {display: block; overflow-x: auto; padding: 1em;}
+.hljs {background: #fff; color: #000;}
+.hljs-comment {color: #008000;}
+.hljs-keyword, .hljs-built_in {color: #0000ff;}
+.hljs-literal, .hljs-string, .hljs-title {color: #a31515;}
+.hljs-meta {color: #2b91af;}
+'''
+
+_LITERALS: frozenset[str] = frozenset(['True', 'False', 'None'])
+_KEYWORDS: frozenset[str] = frozenset(keyword.kwlist) - _LITERALS
+_BUILTINS: frozenset[str] = frozenset(name for name in dir(builtins) if not name.startswith('_')) - _KEYWORDS - _LITERALS
+
+_STRING_TOKENS: frozenset[int] = frozenset(getattr(tokenize, name) for name in
+                                           ['STRING', 'FSTRING_START', 'FSTRING_MIDDLE', 'FSTRING_END']
+                                           if hasattr(tokenize, name))
+
+_TOKEN_CLASSES: dict[int, str] = {tokenize.NUMBER: 'number', tokenize.COMMENT: 'comment'}
+
+# Tokens after which an '@' starts a decorator:
+_LINE_START_TOKENS: frozenset[int] = frozenset([tokenize.NEWLINE, tokenize.NL, tokenize.INDENT, tokenize.DEDENT])
+
+# --- CACHE: ---------------------------------------------------------------------------------
+# Highlighted html per sha256 of the source, least recently used first:
+_code_highlight_cache     : OrderedDict    = OrderedDict()
+_code_highlight_cache_lock: threading.Lock = threading.Lock()
+
+# --------------------------------------------------------------------------------------------
+#                                  HIGHLIGHTING FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def highlight_python_code(code: str) -> str:
+    """
+    Returns the Python code as html escaped text with `<span class="hljs-...">` tokens (keywords,
+    built-ins, literals, strings, numbers, comments, function / class names and decorators),
+    styled by `CODE_HIGHLIGHT_STYLE`.
+
+    The result is cached by the sha256 of the code (at most `CODE_HIGHLIGHT_CACHE_MAX_SIZE`
+    sources, least recently used are evicted). Code that can not be tokenized (not Python, or
+    inconsistent indentation) is returned escaped, without spans.
+
+    Parameters
+    ----------
+    code : str
+        The source code.
+
+    Returns
+    -------
+    str
+        The highlighted html, to be placed in `<pre><code class="hljs">`.
+
+    Example
+    -------
+    >>> highlight_python_code('x = None  # nothing')
+    'x = <span class="hljs-literal">None</span>  <span class="hljs-comment"># nothing</span>'
+    """
+    key = hashlib.sha256(code.encode('utf-8', 'surrogatepass')).digest()
+
+    with _code_highlight_cache_lock:
+        res = _code_highlight_cache.get(key)
+        if res is not None:
+            _code_highlight_cache.move_to_end(key)
+            return res
+
+    res = _highlight_python_tokens(code)
+
+    with _code_highlight_cache_lock:
+        _code_highlight_cache[key] = res
+        while len(_code_highlight_cache) > CODE_HIGHLIGHT_CACHE_MAX_SIZE:
+            _code_highlight_cache.popitem(last = False)
+
+    return res
+
+# --------------------------------------------------------------------------------------------
+
+def clear_code_highlight_cache() -> None:
+    """
+    Removes all highlighted sources from the cache.
+    """
+    with _code_highlight_cache_lock:
+        _code_highlight_cache.clear()
+
+# --------------------------------------------------------------------------------------------
+#                                  SUPPORTING FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _highlight_python_tokens(code: str) -> str:
+    """
+    Tokenizes the code and wraps the highlighted tokens in spans, the text between the tokens
+    (whitespace, line continuations) is copied unchanged.
+    """
+    # Offset of every line start, tokenize positions are (line number, column):
+    line_offsets = [0]
+    for line in io.StringIO(code).readlines():
+        line_offsets.append(line_offsets[-1] + len(line))
+
+    parts     : list[str] = []
+    position  : int       = 0
+    prev_name : str       = ''      # the previous token, if it was a name
+    line_start: bool      = True    # the token is the first of a logical line
+    decorator : bool      = False   # inside '@name.name'
+
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(code).readline):
+            is_op_at  = token.type == tokenize.OP and token.string == '@'
+            is_op_dot = token.type == tokenize.OP and token.string == '.'
+            decorator = (is_op_at and line_start) or (decorator and (token.type == tokenize.NAME or is_op_dot))
+
+            if decorator:
+                css_class = 'meta'
+            elif token.type == tokenize.NAME:
+                css_class = _get_name_class(token.string, prev_name)
+            elif token.type in _STRING_TOKENS:
+                css_class = 'string'
+            else:
+                css_class = _TOKEN_CLASSES.get(token.type)
+
+            if token.type not in (tokenize.NL, tokenize.COMMENT):
+                line_start = token.type in _LINE_START_TOKENS
+                prev_name  = token.string if token.type == tokenize.NAME else ''
+
+            if css_class is None:
+                continue
+
+            start = line_offsets[token.start[0] - 1] + token.start[1]
+            end   = line_offsets[token.end[0] - 1]   + token.end[1]
+            parts.append(html.escape(code[position:start], quote = False))
+            parts.append(f'<span class="hljs-{css_class}">{html.escape(code[start:end], quote = False)}</span>')
+            position = end
+
+    except (tokenize.TokenError, SyntaxError):
+        return html.escape(code, quote = False)
+
+    parts.append(html.escape(code[position:], quote = False))
+    return ''.join(parts)
+
+# --------------------------------------------------------------------------------------------
+
+def _get_name_class(name: str, prev_name: str) -> Optional[str]:
+    """
+    Returns the highlight class of a name token (None for plain names).
+    """
+    if name in _KEYWORDS:
+        return 'keyword'
+    if name in _LITERALS:
+        return 'literal'
+    if prev_name == 'def':
+        return 'title function_'
+    if prev_name == 'class':
+        return 'title class_'
+    if name in _BUILTINS:
+        return 'built_in'
+    return None
+
+# --------------------------------------------------------------------------------------------
@@ -1,14 +1,20 @@
 from enum import Enum
+from typing import Callable, Optional
 
 # ============================================================================================
 # Meta Information
-__version__:      str = '0.0.2'
-__version_date__: str = '2024-08-13'
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_:           str = 'Report Element'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}' 
 
 # Version History
 # v0.0.2 @ 2024-08-13 : Initial Release
+# v0.1.0 @ 2026-10-16 : Added deferred (lazy) rendering of the element content.
+#                     : ReportElement uses __slots__ (no per-instance __dict__).
+#                     : Added DFTABLE_VIRTUAL element type.
+#                     : A deferred element without style (STYLED_ELEMENT_TYPES) is not rendered for
+#                     : its style, get_transient_body_str() builds its body without keeping it.
 # ============================================================================================
 
 # --------------------------------------------------------------------------------------------
@@ -35,6 +41,8 @@ class ReportElementTypes(Enum):
         Space element for formatting.
     DFTABLE : str
         DataFrame table.
+    DFTABLE_VIRTUAL : str
+        DataFrame table with virtual scrolling (rows rendered by the browser).
     OTHER : str
         Placeholder for other element types.
     FOOTER : str
@@ -71,6 +79,7 @@ class ReportElementTypes(Enum):
     STYLE:                      str = 'style'
     SPACE:                      str = 'space'
     DFTABLE:                    str = 'df_table'
+    DFTABLE_VIRTUAL:            str = 'df_table_virtual'
     OTHER:                      str = 'other'
     FOOTER:                     str = 'footer'
     CODE:                       str = 'code'
@@ -110,10 +119,22 @@ def get_report_element_type_str(element_type: ReportElementTypes) -> str:
 #                                 REPORT ELEMENT:
 # --------------------------------------------------------------------------------------------
 
+# Shared empty content, most elements never set a style:
+_EMPTY_CONTENT: str = ''
+
+# Element types whose builders set a style, the other builders only produce a body:
+STYLED_ELEMENT_TYPES: frozenset[ReportElementTypes] = frozenset({ReportElementTypes.STYLE,
+                                                                 ReportElementTypes.HEAD_TITLE_ON_BACKGROUND})
+
 class ReportElement:
     """
     Represents an element in the report, which can have different types (e.g., text, chart, image).
 
+    An element can be deferred (lazy): it keeps the builder function and its inputs, and
+    renders its content only when the body or style is requested for the first time. The
+    rendered content is memoized, so the builder runs at most once. The style of a deferred
+    element whose type is not in `STYLED_ELEMENT_TYPES` is empty, it does not render it.
+
     Attributes
     ----------
     type : ReportElementTypes
@@ -122,9 +143,15 @@ class ReportElement:
         The body content of the element in string format.
     style_content : str
         The style content of the element in string format.
+    is_rendered : bool
+        False while a deferred element has not been rendered yet.
     
     Methods
     -------
+    deferred(element_type, builder, *args, **kwargs) -> ReportElement
+        Creates a lazy element, rendered by `builder(*args, **kwargs)` on first use.
+    render() -> None
+        Renders a deferred element now (no-op for rendered elements).
     __str__() -> str
         Returns a human-readable description of the element type.
     __repr__() -> str
@@ -133,15 +160,110 @@ class ReportElement:
         Returns the style string for the element.
     get_body_str() -> str
         Returns the body string for the element.
+    get_transient_body_str() -> str
+        Returns the body string, a deferred element is built without keeping the body.
     """
 
+    # Reports can hold tens of thousands of elements, slots keep each one small (no __dict__).
+    __slots__ = ('type', '_body_content', '_style_content', '_deferred_builder')
+
     def __init__(self) -> None:
         """
         Initialize a new ReportElement with default type as NONE.
         """
         self.type: ReportElementTypes = ReportElementTypes.NONE        
-        self.body_content:  str = ''
-        self.style_content: str = ''
+        self._body_content    : str = _EMPTY_CONTENT
+        self._style_content   : str = _EMPTY_CONTENT
+        self._deferred_builder: Optional[tuple[Callable[..., 'ReportElement'], tuple, dict]] = None
+
+    @classmethod
+    def deferred(   cls, 
+                    element_type: ReportElementTypes, 
+                    builder     : Callable[..., 'ReportElement'], 
+                    *args, 
+                    **kwargs, 
+                        ) -> 'ReportElement':
+        """
+        Creates a deferred (lazy) element, rendered by `builder(*args, **kwargs)` on first use.
+
+        ⚠️ The builder inputs are kept by reference until the element is rendered.
+
+        Parameters
+        ----------
+        element_type : ReportElementTypes
+            Type of the element that the builder returns.
+        builder : Callable[..., ReportElement]
+            One of the `get_*_element` functions.
+        *args, **kwargs
+            The builder inputs.
+
+        Returns
+        -------
+        ReportElement
+            The not yet rendered element.
+
+        Example
+        -------
+        >>> element = ReportElement.deferred(ReportElementTypes.TEXT, get_text_element, 'My Text')
+        >>> element.is_rendered
+        False
+        """
+        res                   = cls()
+        res.type              = element_type
+        res._deferred_builder = (builder, args, kwargs)
+        return res
+
+    @property
+    def is_rendered(self) -> bool:
+        """
+        False while a deferred element has not been rendered yet.
+        """
+        return self._deferred_builder is None
+
+    def render(self) -> None:
+        """
+        Renders a deferred element by calling its builder, and releases the builder inputs.
+        Does nothing if the element is already rendered.
+        """
+        if self._deferred_builder is None:
+            return
+        
+        builder, args, kwargs  = self._deferred_builder
+        self._deferred_builder = None
+        
+        built               = builder(*args, **kwargs)
+        self.type           = built.type
+        self._body_content  = built.get_body_str()
+        self._style_content = built.get_style_str()
+
+    @property
+    def body_content(self) -> str:
+        """
+        The body content of the element, a deferred element is rendered on first access.
+        """
+        self.render()
+        return self._body_content
+
+    @body_content.setter
+    def body_content(self, value: str) -> None:
+        self.render()
+        self._body_content = value
+
+    @property
+    def style_content(self) -> str:
+        """
+        The style content of the element, a deferred element is rendered on first access (only
+        if its type has a style, see `STYLED_ELEMENT_TYPES`).
+        """
+        if self._deferred_builder is not None and self.type not in STYLED_ELEMENT_TYPES:
+            return _EMPTY_CONTENT
+        self.render()
+        return self._style_content
+
+    @style_content.setter
+    def style_content(self, value: str) -> None:
+        self.render()
+        self._style_content = value
 
     def __str__(self) -> str:
         """
@@ -187,4 +309,22 @@ class ReportElement:
         """
         return self.body_content
 
+    def get_transient_body_str(self) -> str:
+        """
+        Returns the body string for the element without keeping it in memory: a deferred element
+        is built for this call only and stays deferred (the builder runs again on the next call).
+        Elements with a style (`STYLED_ELEMENT_TYPES`) are rendered, style and body of one build
+        belong together.
+
+        Returns
+        -------
+        str
+            The body content for the report element.
+        """
+        if self._deferred_builder is None or self.type in STYLED_ELEMENT_TYPES:
+            return self.body_content
+        
+        builder, args, kwargs = self._deferred_builder
+        return builder(*args, **kwargs).get_body_str()
+
 # ==================================================================================================
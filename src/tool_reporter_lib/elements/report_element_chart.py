@@ -1,37 +1,77 @@
 import io
+import re
 import base64
-import matplotlib.pyplot as plt
-from typing import Optional
+import hashlib
+from typing import TYPE_CHECKING, Optional
 from .report_element import ReportElement, ReportElementTypes
 
+# matplotlib is only needed for the annotations, the figure brings its own savefig():
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from PIL import Image
+
 # ============================================================================================
 # Meta Information
-__version__:      str = '0.0.2'
-__version_date__: str = '2024-08-13'
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_:           str = 'report element - chart'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
 # --- VERSION HISTORY: -----------------------------------------------------------------------
 # v0.0.2 @ 2024-08-13 : Initial Release
+# v0.1.0 @ 2026-10-16 : Split PNG rendering from the HTML, so charts can be rendered in a pool.
+#                     : matplotlib is not imported by this module (import time).
+#                     : Added chart formats: PNG (compression level, palette), JPEG, WebP, inline
+#                     : SVG (path simplification) and 'auto' (smallest encoding / size budget).
+#                     : Added get_chart_image_bytes() and get_chart_element_from_asset() (image
+#                     : deduplication, see ImageAssetTable).
+#                     : SVG settings per call (report_chart_svg_backend), not through the global
+#                     : rcParams; fixed id salt and per chart id prefix (no id collisions inline).
 # ============================================================================================
 
 # --- TODO : ---------------------------------------------------------------------------------
 # - Check maybe not necessary transfer of plt object, just call it from matplotlib.pyplot
 # --------------------------------------------------------------------------------------------
 
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+CHART_FORMATS: list[str] = ['png', 'jpeg', 'webp', 'svg', 'auto']
+
+# Formats tried by 'auto', in the order of preference (vector, lossless, lossy):
+CHART_AUTO_FORMATS: list[str] = ['svg', 'png', 'webp', 'jpeg']
+
+CHART_MIME_TYPES: dict[str, str] = {
+    'png' : ReportElementTypes.IMAGE_PNG.value,
+    'jpeg': ReportElementTypes.IMAGE_JPEG.value,
+    'webp': 'image/webp',
+    'svg' : 'image/svg+xml',
+    }
+
+# JPEG has no alpha channel, transparent charts are flattened on the report background:
+CHART_JPEG_BACKGROUND: str = 'white'
+
+SVG_ROOT_TAG_PATTERN: re.Pattern = re.compile(r'<svg\b[^>]*>')
+SVG_SIZE_ATTR_PATTERN: re.Pattern = re.compile(r'\s(?:width|height)="[^"]*"')
+
+# The element ids of an svg and the references to them (clip paths, patches, glyphs):
+SVG_ID_PATTERN: re.Pattern = re.compile(r'(\bid="|url\(#|href="#)([^")]+)')
+
 # --------------------------------------------------------------------------------------------
 #                                  REPORT ELEMENTS:
 # --------------------------------------------------------------------------------------------
 
 def get_chart_element(  
-                        chart_plt            : plt.Figure,
+                        chart_plt            : 'plt.Figure',
                         use_fullwidth        : bool          = False,
                         heigth               : Optional[int] = None,
                         width                : Optional[int] = None,
                         use_transparent_plots: bool          = True,
+                        chart_format         : str           = 'png',
+                        **format_options,
                             ) -> ReportElement:
     """
-    Creates and returns a ReportElement containing a chart image encoded in base64.
+    Creates and returns a ReportElement containing a chart image encoded in base64 (or an
+    inline SVG).
 
     Parameters
     ----------
@@ -45,46 +85,255 @@ def get_chart_element(
         The width of the chart image, by default None (auto).
     use_transparent_plots : bool, optional
         If True, the background of the plot will be transparent, by default True.
+    chart_format : str, optional
+        'png', 'jpeg', 'webp', 'svg' or 'auto', by default 'png'.
+    **format_options
+        Encoding options, see `get_chart_image`.
 
     Returns
     -------
     ReportElement
         A ReportElement object of type CHART, containing an HTML image tag for the chart.
     """
-        
-    res      = ReportElement()
-    res.type = ReportElementTypes.CHART
+    image_format, image_data = get_chart_image(chart_plt, use_transparent_plots, chart_format, **format_options)
     
-    # Transforming the chart to BASE64 image:
-    # Save the plot to a BytesIO object
-    buf = io.BytesIO()
-    chart_plt.savefig(buf, format = 'png', transparent = use_transparent_plots)
-    buf.seek(0)
+    return get_chart_element_from_base64(   image_data, 
+                                            use_fullwidth = use_fullwidth, 
+                                            heigth        = heigth, 
+                                            width         = width, 
+                                            image_format  = image_format, )
 
-    # Encode the buffer to a base64 string
-    base64_string = base64.b64encode(buf.read()).decode('utf-8')
+# --------------------------------------------------------------------------------------------
 
-    # Close the buffer
-    buf.close()
-    
-    if heigth is None:
-        heigth_str = '\"\"'        
+def get_chart_base64(   
+                        chart_plt            : 'plt.Figure',
+                        use_transparent_plots: bool = True,
+                            ) -> str:
+    """
+    Renders the chart to PNG and returns it encoded in base64.
+
+    This is the expensive (rasterization) part of `get_chart_element`, it can run in a worker
+    thread or process, see `ChartRenderPool`.
+
+    Parameters
+    ----------
+    chart_plt : matplotlib.pyplot.Figure
+        A Matplotlib plot object to be rendered into an image.
+    use_transparent_plots : bool, optional
+        If True, the background of the plot will be transparent, by default True.
+
+    Returns
+    -------
+    str
+        The PNG image encoded in base64.
+    """
+    return base64.b64encode(_render_chart_png(chart_plt, use_transparent_plots)).decode('utf-8')
+
+# --------------------------------------------------------------------------------------------
+
+def get_chart_image(    
+                        chart_plt             : 'plt.Figure',
+                        use_transparent_plots : bool            = True,
+                        chart_format          : str             = 'png',
+                        png_compress_level    : Optional[int]   = None,
+                        png_palette_colors    : Optional[int]   = None,
+                        quality               : int             = 85,
+                        svg_simplify_threshold: Optional[float] = None,
+                        size_budget           : Optional[int]   = None,
+                            ) -> tuple[str, str]:
+    """
+    Renders the chart in the requested format.
+
+    Like `get_chart_base64` this is the expensive part of `get_chart_element`, it can run in a
+    worker thread or process, see `ChartRenderPool`.
+
+    Parameters
+    ----------
+    chart_plt : matplotlib.pyplot.Figure
+        A Matplotlib plot object to be rendered into an image.
+    use_transparent_plots : bool, optional
+        If True, the background of the plot will be transparent, by default True.
+        JPEG has no transparency, its background is white.
+    chart_format : str, optional
+        'png'  - lossless, `png_compress_level` and `png_palette_colors` (default).
+        'jpeg' - lossy, `quality`.
+        'webp' - lossy with transparency, `quality`.
+        'svg'  - vector, inlined in the html, `svg_simplify_threshold`. Small for line charts,
+                 large for dense scatter plots (one element per point).
+        'auto' - renders all the formats above, returns the first (in the order svg, png, webp,
+                 jpeg) within `size_budget`, or the smallest one if no format fits / no budget.
+    png_compress_level : int, optional
+        zlib compression level 0-9, by default None (matplotlib default).
+    png_palette_colors : int, optional
+        Quantizes the PNG to a palette of 2-256 colors (with alpha), by default None (RGBA).
+    quality : int, optional
+        JPEG and WebP quality 1-100, by default 85.
+    svg_simplify_threshold : float, optional
+        Path simplification threshold of the SVG, 0-1 pixels: line segments deviating less are
+        merged, by default None (matplotlib `path.simplify_threshold`, 1/9).
+    size_budget : int, optional
+        Maximum encoded size in bytes for 'auto', by default None (smallest encoding).
+
+    Returns
+    -------
+    tuple[str, str]
+        The image format ('png', 'jpeg', 'webp' or 'svg') and the image: encoded in base64,
+        for 'svg' the svg markup.
+
+    Raises
+    ------
+    ValueError
+        If the format or an option is not supported.
+    """
+    image_format, data = get_chart_image_bytes( chart_plt, use_transparent_plots, chart_format, 
+                                                png_compress_level, png_palette_colors, quality, 
+                                                svg_simplify_threshold, size_budget)
+
+    if image_format == 'svg':
+        return image_format, data.decode('utf-8')
+    return image_format, base64.b64encode(data).decode('utf-8')
+
+# --------------------------------------------------------------------------------------------
+
+def get_chart_image_bytes(    
+                        chart_plt             : 'plt.Figure',
+                        use_transparent_plots : bool            = True,
+                        chart_format          : str             = 'png',
+                        png_compress_level    : Optional[int]   = None,
+                        png_palette_colors    : Optional[int]   = None,
+                        quality               : int             = 85,
+                        svg_simplify_threshold: Optional[float] = None,
+                        size_budget           : Optional[int]   = None,
+                            ) -> tuple[str, bytes]:
+    """
+    Same as `get_chart_image`, but returns the encoded image bytes (the svg markup in utf-8)
+    instead of base64, e.g. to hash them before the base64 encoding.
+
+    Returns
+    -------
+    tuple[str, bytes]
+        The image format ('png', 'jpeg', 'webp' or 'svg') and the image bytes.
+    """
+    _check_chart_format_options(chart_format, png_compress_level, png_palette_colors, quality, 
+                                svg_simplify_threshold, size_budget)
+
+    if chart_format == 'svg':
+        return 'svg', _render_chart_svg(chart_plt, use_transparent_plots, svg_simplify_threshold).encode('utf-8')
+
+    if chart_format == 'png' and png_palette_colors is None:
+        return 'png', _render_chart_png(chart_plt, use_transparent_plots, png_compress_level)
+
+    if chart_format != 'auto':
+        image = _render_chart_rgba(chart_plt, use_transparent_plots)
+        return chart_format, _encode_chart_image(image, chart_format, png_compress_level, png_palette_colors, quality)
+
+    # 'auto': one rasterization for all the raster formats, sizes as embedded in the html
+    # (raster formats in base64):
+    image      = _render_chart_rgba(chart_plt, use_transparent_plots)
+    candidates = []
+    for image_format in CHART_AUTO_FORMATS:
+        if image_format == 'svg':
+            data = _render_chart_svg(chart_plt, use_transparent_plots, svg_simplify_threshold).encode('utf-8')
+            size = len(data)
+        else:
+            data = _encode_chart_image(image, image_format, png_compress_level, png_palette_colors, quality)
+            size = 4 * ((len(data) + 2) // 3)
+        if size_budget is not None and size <= size_budget:
+            return image_format, data
+        candidates.append((size, image_format, data))
+
+    _, image_format, data = min(candidates, key = lambda candidate: candidate[0])
+    return image_format, data
+
+# --------------------------------------------------------------------------------------------
+
+def get_chart_element_from_base64(  
+                        base64_string: str,
+                        use_fullwidth: bool          = False,
+                        heigth       : Optional[int] = None,
+                        width        : Optional[int] = None,
+                        image_format : str           = 'png',
+                            ) -> ReportElement:
+    """
+    Creates and returns a ReportElement for an already rendered base64 chart image.
+
+    Parameters
+    ----------
+    base64_string : str
+        The image encoded in base64 (for 'svg' the svg markup), see `get_chart_image`.
+    use_fullwidth : bool, optional
+        If True, the chart will use the full width of the report, by default False.
+    height : int, optional
+        The height of the chart image, by default None (auto).
+    width : int, optional
+        The width of the chart image, by default None (auto).
+    image_format : str, optional
+        'png', 'jpeg', 'webp' or 'svg', by default 'png'.
+
+    Returns
+    -------
+    ReportElement
+        A ReportElement object of type CHART, containing an HTML image tag for the chart.
+    """
+        
+    if image_format == 'svg':
+        image_tag = _get_svg_tag(base64_string, heigth, width)
     else:
-        heigth_str = '\"' + str(int(heigth)) + '\"'
-        pass
+        image_tag = (f'<img align=\"center\" src=\"data:{CHART_MIME_TYPES[image_format]};base64,{base64_string}\" '
+                     f'width={_get_size_attr(width)} height={_get_size_attr(heigth)} alt=\"\" class="graph-item" />')
     
-    if width is None:
-        width_str = '\"\"'
-    else:
-        width_str = '\"' + str(int(width)) + '\"'
-        pass
+    return _get_chart_element_from_tag(image_tag, use_fullwidth)
+
+# --------------------------------------------------------------------------------------------
+
+def get_chart_element_from_asset(  
+                        asset_id     : str,
+                        use_fullwidth: bool          = False,
+                        heigth       : Optional[int] = None,
+                        width        : Optional[int] = None,
+                            ) -> ReportElement:
+    """
+    Creates and returns a ReportElement for a chart image stored once in the report image asset
+    table: the `<img>` has no `src`, the asset script of the report sets it from the table.
+
+    Parameters
+    ----------
+    asset_id : str
+        The id of the image in the asset table, see `ImageAssetTable`.
+    use_fullwidth : bool, optional
+        If True, the chart will use the full width of the report, by default False.
+    height : int, optional
+        The height of the chart image, by default None (auto).
+    width : int, optional
+        The width of the chart image, by default None (auto).
+
+    Returns
+    -------
+    ReportElement
+        A ReportElement object of type CHART, containing an HTML image tag for the chart.
+    """
+    image_tag = (f'<img align=\"center\" data-asset=\"{asset_id}\" '
+                 f'width={_get_size_attr(width)} height={_get_size_attr(heigth)} alt=\"\" class="graph-item" />')
+    
+    return _get_chart_element_from_tag(image_tag, use_fullwidth)
+
+# --------------------------------------------------------------------------------------------
+#                                  SUPPORTING FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _get_chart_element_from_tag(image_tag: str, use_fullwidth: bool = False) -> ReportElement:
+    """
+    Returns the CHART element wrapping the image tag (`<img>` or inline `<svg>`).
+    """
+    res      = ReportElement()
+    res.type = ReportElementTypes.CHART
     
     if use_fullwidth == False:
         res.body_content = f'''
             <div class=\"grid_12\">
             <div class=\"graph\">
             <div style=\"align=center; float:center;\">            
-            <img align=\"center\" src=\"data:image/png;base64,{base64_string}\" width={width_str} height={heigth_str} alt=\"\" class="graph-item" />            
+            {image_tag}            
             </div>
             </div>
             </div>
@@ -93,7 +342,7 @@ def get_chart_element(
         res.body_content = f'''            
             <div class=\"graph\">
             <div style=\"align=center; float:center;\">            
-            <img align=\"center\" src=\"data:image/png;base64,{base64_string}\" width={width_str} height={heigth_str} alt=\"\" class="graph-item" />            
+            {image_tag}            
             </div>
             </div>            
         '''
@@ -101,4 +350,136 @@ def get_chart_element(
     
     return res
 
-# --------------------------------------------------------------------------------------------
\ No newline at end of file
+# --------------------------------------------------------------------------------------------
+
+def _get_size_attr(value: Optional[int]) -> str:
+    """
+    Returns the quoted value of an `<img>` width / height attribute, `""` for auto.
+    """
+    return '\"\"' if value is None else '\"' + str(int(value)) + '\"'
+
+# --------------------------------------------------------------------------------------------
+
+def _check_chart_format_options(chart_format          : str,
+                                png_compress_level    : Optional[int]   = None,
+                                png_palette_colors    : Optional[int]   = None,
+                                quality               : int             = 85,
+                                svg_simplify_threshold: Optional[float] = None,
+                                size_budget           : Optional[int]   = None,
+                                    ) -> None:
+    """
+    Raises a ValueError if the chart format or an encoding option is not supported.
+    """
+    if chart_format not in CHART_FORMATS:
+        raise ValueError(f"Invalid chart format: '{chart_format}'. Supported formats: {CHART_FORMATS}")
+    if png_compress_level is not None and not 0 <= png_compress_level <= 9:
+        raise ValueError(f'Invalid PNG compress level: {png_compress_level}, expected 0-9.')
+    if png_palette_colors is not None and not 2 <= png_palette_colors <= 256:
+        raise ValueError(f'Invalid PNG palette colors: {png_palette_colors}, expected 2-256.')
+    if not 1 <= quality <= 100:
+        raise ValueError(f'Invalid image quality: {quality}, expected 1-100.')
+    if svg_simplify_threshold is not None and not 0 <= svg_simplify_threshold <= 1:
+        raise ValueError(f'Invalid SVG simplify threshold: {svg_simplify_threshold}, expected 0-1 pixels.')
+    if size_budget is not None and size_budget <= 0:
+        raise ValueError(f'Invalid size budget: {size_budget}, expected a positive number of bytes.')
+
+# --------------------------------------------------------------------------------------------
+
+def _render_chart_png(  chart_plt            : 'plt.Figure', 
+                        use_transparent_plots: bool,
+                        compress_level       : Optional[int] = None,
+                            ) -> bytes:
+    """
+    Renders the chart to PNG with matplotlib (default compression if `compress_level` is None).
+    """
+    pil_kwargs = None if compress_level is None else {'compress_level': compress_level}
+
+    with io.BytesIO() as buf:
+        chart_plt.savefig(buf, format = 'png', transparent = use_transparent_plots, pil_kwargs = pil_kwargs)
+        return buf.getvalue()
+
+# --------------------------------------------------------------------------------------------
+
+def _render_chart_rgba(chart_plt: 'plt.Figure', use_transparent_plots: bool) -> 'Image.Image':
+    """
+    Rasterizes the chart to an RGBA Pillow image (uncompressed PNG round trip, so the size and
+    the savefig settings are the ones of the PNG format).
+    """
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(_render_chart_png(chart_plt, use_transparent_plots, compress_level = 0)))
+    return image.convert('RGBA')
+
+# --------------------------------------------------------------------------------------------
+
+def _encode_chart_image(image         : 'Image.Image',
+                        image_format  : str,
+                        compress_level: Optional[int] = None,
+                        palette_colors: Optional[int] = None,
+                        quality       : int           = 85,
+                            ) -> bytes:
+    """
+    Encodes the RGBA image as 'png' (optionally quantized to a palette), 'jpeg' or 'webp'.
+    """
+    from PIL import Image
+
+    if image_format == 'png':
+        if palette_colors is not None:
+            image = image.quantize(palette_colors, method = Image.Quantize.FASTOCTREE)
+        save_kwargs = {'format': 'PNG'} if compress_level is None else {'format': 'PNG', 'compress_level': compress_level}
+    elif image_format == 'jpeg':
+        background = Image.new('RGB', image.size, CHART_JPEG_BACKGROUND)
+        background.paste(image, mask = image.getchannel('A'))
+        image       = background
+        save_kwargs = {'format': 'JPEG', 'quality': quality}
+    else:
+        save_kwargs = {'format': 'WEBP', 'quality': quality}
+
+    with io.BytesIO() as buf:
+        image.save(buf, **save_kwargs)
+        return buf.getvalue()
+
+# --------------------------------------------------------------------------------------------
+
+def _render_chart_svg(  chart_plt            : 'plt.Figure', 
+                        use_transparent_plots: bool,
+                        simplify_threshold   : Optional[float] = None,
+                            ) -> str:
+    """
+    Renders the chart to SVG markup for inlining: without the xml declaration and doctype and
+    without the creation date. The ids are generated with a fixed salt (reproducible output) and
+    prefixed with the hash of the chart, so the inline charts of a report do not share ids.
+
+    The simplification threshold and the salt are passed to the renderer of this call
+    (`report_chart_svg_backend`), the matplotlib rcParams are not changed.
+    """
+    from .report_chart_svg_backend import CHART_SVG_BACKEND
+
+    with io.StringIO() as buf:
+        chart_plt.savefig(  buf, 
+                            format             = 'svg', 
+                            backend            = CHART_SVG_BACKEND,
+                            transparent        = use_transparent_plots, 
+                            metadata           = {'Date': None},
+                            simplify_threshold = simplify_threshold, )
+        svg = buf.getvalue()
+
+    svg    = svg[svg.index('<svg'):].strip()
+    prefix = hashlib.sha256(svg.encode('utf-8')).hexdigest()[:8]
+
+    return SVG_ID_PATTERN.sub(rf'\g<1>c{prefix}-\g<2>', svg)
+
+# --------------------------------------------------------------------------------------------
+
+def _get_svg_tag(svg: str, heigth: Optional[int] = None, width: Optional[int] = None) -> str:
+    """
+    Returns the inline svg with the chart image class. The size of the root element is replaced
+    by the given width and height, without them the svg scales like the `<img>` charts.
+    """
+    root_tag = SVG_ROOT_TAG_PATTERN.search(svg).group(0)
+    size     = ''.join(f' {name}="{int(value)}"' for name, value in [('width', width), ('height', heigth)] if value is not None)
+    new_tag  = SVG_SIZE_ATTR_PATTERN.sub('', root_tag)[:-1] + f' class="graph-item"{size}>'
+
+    return svg.replace(root_tag, new_tag, 1)
+
+# --------------------------------------------------------------------------------------------
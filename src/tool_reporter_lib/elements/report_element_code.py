@@ -1,14 +1,16 @@
 from .report_element import ReportElement, ReportElementTypes
+from .report_code_highlight import highlight_python_code
 
 # ============================================================================================
 # Meta Information
-__version__:      str = '0.0.2'
-__version_date__: str = '2024-08-13'
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_:           str = 'report element - code'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
 # --- VERSION HISTORY: -----------------------------------------------------------------------
 # v0.0.2 @ 2024-08-13 : Initial Release
+# v0.1.0 @ 2026-10-16 : Added use_highlighting: code highlighted at build time (no highlight.js needed)
 # ============================================================================================
 
 
@@ -16,7 +18,7 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 #                                  REPORT ELEMENTS:
 # --------------------------------------------------------------------------------------------
 
-def get_code_element(code: str) -> ReportElement:
+def get_code_element(code: str, use_highlighting: bool = False) -> ReportElement:
     """
     Creates and returns a ReportElement for displaying code in a formatted block.
 
@@ -24,6 +26,10 @@ def get_code_element(code: str) -> ReportElement:
     ----------
     code : str
         The code to display inside the report.
+    use_highlighting : bool, optional
+        If True, the code is escaped and highlighted in Python (`highlight_python_code`), styled
+        by `CODE_HIGHLIGHT_STYLE`, the report does not need highlight.js. If False, the code is
+        inserted as is and highlighted by highlight.js in the browser (default is `False`).
 
     Returns
     -------
@@ -34,9 +40,14 @@ def get_code_element(code: str) -> ReportElement:
     res      = ReportElement()
     res.type = ReportElementTypes.CODE
     
+    if use_highlighting:
+        code_html = f'<code class="python hljs">{highlight_python_code(code)}</code>'
+    else:
+        code_html = f'<code class="python">{code}</code>'
+    
     # Creating HTML structure for displaying code in a preformatted block
     res.body_content = f'''<div class="grid_12">
-            <pre><code class="python">{code}</code></pre>
+            <pre>{code_html}</pre>
         </div>'''
     
     return res
@@ -1,18 +1,21 @@
 import random
 import os
 import re
+from typing import Callable, Optional
 from .report_element import ReportElement, ReportElementTypes
+from .report_template_cache import get_cached_template
 
 # ============================================================================================
 # Meta Information
-__version__:      str = '0.0.6'
-__version_date__: str = '2024-08-21'
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_:           str = 'Report Element - header title'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
 # --- VERSION HISTORY: -----------------------------------------------------------------------
 # v0.0.2 @ 2024-08-13 : Initial Release
 # v0.0.6 @ 2024-08-21 : Updated header background images to random dynamic generated background.
+# v0.1.0 @ 2026-10-16 : CSS and HTML templates are served (cleaned, pre-split) from the template cache.
 # ============================================================================================
 
 
@@ -81,15 +84,9 @@ def get_header_title(
         'subtitle_html': f'<h2 class="subtitle">{subtitle}</h2>' if subtitle else ''
         }
 
-    # Load and format CSS
-    res.style_content = _load_and_format_file(CSS_FILE_PATH, params)
-
-    # Load and format body content
-    res.body_content  = _load_and_format_file(HTML_FILE_PATH, params)
-    
-    # Clean CSS and HTML files
-    res.style_content = clean_css_content(res.style_content)
-    res.body_content  = clean_css_content(res.body_content)    
+    # Load (cached), clean and format CSS and body content
+    res.style_content = _load_and_format_file(CSS_FILE_PATH,  params, clean_css_content)
+    res.body_content  = _load_and_format_file(HTML_FILE_PATH, params, clean_css_content)
 
     return res
 
@@ -118,17 +115,15 @@ def _generate_random_position() -> int:
 
 # --------------------------------------------------------------------------------------------
 
-def _load_and_format_file(  filename: str, 
-                            params  : dict, 
+def _load_and_format_file(  filename  : str, 
+                            params    : dict, 
+                            clean_func: Optional[Callable[[str], str]] = None,
                                 ) -> str:
-    """Loads a file and replaces placeholders with actual values from params."""
-    with open(filename, 'r') as file:
-        content = file.read()
-    
-    for key, value in params.items():
-        content = content.replace(f'{{{{{key}}}}}', str(value))
-    
-    return content
+    """
+    Loads a file (from the template cache) and replaces placeholders with actual values from params.
+    If clean_func is given, the template and the values are cleaned with it.
+    """
+    return get_cached_template(filename, clean_func).render(params)
 
 # --------------------------------------------------------------------------------------------
 
@@ -1,11 +1,15 @@
-import pandas as pd
+from typing import TYPE_CHECKING, Optional
 from .report_element import ReportElement, ReportElementTypes
-from .value_to_color import value_to_color
+
+# pandas, numpy and matplotlib (value_to_color) are imported on the first table, not with the package:
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 # ============================================================================================
 # Meta Information
-__version__:      str = '0.0.7'
-__version_date__: str = '2024-09-18'
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_:           str = 'report element - table dataframe'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
@@ -13,20 +17,41 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 # v0.0.2 @ 2024-08-13 : Initial Release
 # v0.0.7 @ 2024-09-18 : Updated heatmap spectrum color use,
 #                       for better visibility with heatmap_used_clr_pcnt = 0.6
+# v0.1.0 @ 2026-10-16 : Heatmap colors are computed per column in one vectorized call.
+#                     : pandas, numpy and value_to_color are imported lazily on first use.
+#                     : Added 'fast' table engine writing the html directly (default), 'styler' engine
+#                     : kept for compatibility and used as fallback (MultiIndex, non-unique labels).
+#                     : Added size policy (max_rows / max_cells) with head_tail, sample and top_k strategies,
+#                     : the heatmap range is computed on the full columns, the caption shows the omitted rows.
 # ============================================================================================
 
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+DF_TABLE_ENGINES: list[str] = ['fast', 'styler']
+
+DF_TABLE_TRUNCATE_STRATEGIES: list[str] = ['head_tail', 'sample', 'top_k']
+
+# Seed of the 'sample' strategy, the same frame always gives the same rows:
+DF_TABLE_SAMPLE_SEED: int = 0
+
 
 # --------------------------------------------------------------------------------------------
 #                                  REPORT ELEMENTS:
 # --------------------------------------------------------------------------------------------
 
-def get_table_dataframe_element(    df: pd.DataFrame, 
+def get_table_dataframe_element(    df: 'pd.DataFrame', 
                                     highlight_columns = [],
                                     round                 : int   = -1,
                                     heatmap_colormap_name : str   = 'coolwarm',
                                     heatmap_used_clr_pcnt : float = 0.6,
                                     heatmap_nan_color     : str   = '#ff0000',
                                     df_min_col_amount_for_full_width: int  = 8,
+                                    engine                : str   = 'fast',
+                                    max_rows              : Optional[int] = None,
+                                    max_cells             : Optional[int] = None,
+                                    truncate_strategy     : str   = 'head_tail',
+                                    top_k_column          : Optional[str] = None,
+                                    top_k_ascending       : bool  = False,
                                         ) -> ReportElement:
     """
     Generates a ReportElement containing an HTML table based on a DataFrame.
@@ -47,12 +72,42 @@ def get_table_dataframe_element(    df: pd.DataFrame,
         Color for NaN values in the heatmap, by default '#ff0000'.
     df_min_col_amount_for_full_width : int, optional
         Minimum number of columns required for full-width table layout, by default 8.
+    engine : str, optional
+        Table html renderer, by default 'fast':
+            - 'fast'   : writes the table markup directly from the column values, heatmap colors
+                         as inline styles. Same cell texts as the Styler.
+            - 'styler' : pandas `Styler` (per cell css rules), slow for large tables.
+        DataFrames with a MultiIndex or non-unique labels are always rendered by the Styler.
+    max_rows : int, optional
+        Maximum number of rows shown, by default None (no limit).
+    max_cells : int, optional
+        Maximum number of cells (rows x columns) shown, by default None (no limit).
+    truncate_strategy : str, optional
+        Rows shown when the table is above `max_rows` / `max_cells`, by default 'head_tail':
+            - 'head_tail' : the first and the last rows.
+            - 'sample'    : a uniform random sample (fixed seed), in the original order.
+            - 'top_k'     : the top rows by `top_k_column`.
+        The heatmap range is computed on the full columns, and the table caption shows the
+        number of omitted rows.
+    top_k_column : str, optional
+        Column sorting the rows of the 'top_k' strategy, by default None.
+    top_k_ascending : bool, optional
+        'top_k' shows the smallest values instead of the largest, by default False.
     
     Returns
     -------
     ReportElement
         A ReportElement object containing the DataFrame as an HTML table.
+
+    Raises
+    ------
+    ValueError
+        If the engine or the truncate strategy is not supported, or 'top_k' has no valid column.
     """
+    if engine not in DF_TABLE_ENGINES:
+        raise ValueError(f"Invalid DataFrame table engine: '{engine}'. Supported engines: {DF_TABLE_ENGINES}")
+    
+    _check_truncate_strategy(truncate_strategy, top_k_column)
     
     res      = ReportElement()
     res.type = ReportElementTypes.DFTABLE
@@ -66,14 +121,62 @@ def get_table_dataframe_element(    df: pd.DataFrame,
     
     res.body_content += '<div class=\"table-scroll-wrapper\">'
     
-    # Calculate min and max values for highlighted columns
+    # Calculate min and max values for highlighted columns (on the full columns)
     min_max_values = {col: (df[col].min(), df[col].max()) for col in highlight_columns if col in df.columns}
+    
+    # Size Policy:
+    caption  = None
+    rows_max = _get_rows_limit(df, max_rows, max_cells)
+    
+    if rows_max is not None and len(df) > rows_max:
+        if truncate_strategy == 'top_k' and top_k_column not in df.columns:
+            raise ValueError(f"Column '{top_k_column}' of the 'top_k' strategy is not in the DataFrame.")
+        
+        caption = _get_truncation_caption(len(df), rows_max, truncate_strategy, top_k_column, top_k_ascending)
+        df      = _truncate_rows(df, rows_max, truncate_strategy, top_k_column, top_k_ascending)
 
     if round >= 0:
         df = df.copy()
         df = df.round(round)
         pass
     
+    heatmap_params = {  'heatmap_colormap_name': heatmap_colormap_name,
+                        'heatmap_nan_color'    : heatmap_nan_color,
+                        'heatmap_used_clr_pcnt': heatmap_used_clr_pcnt, }
+    
+    if engine == 'fast' and _is_fast_engine_supported(df):
+        html_table = _get_html_table_fast(df, highlight_columns, min_max_values, round, caption, **heatmap_params)
+    else:
+        html_table = _get_html_table_styler(df, highlight_columns, min_max_values, round, caption, **heatmap_params)
+    
+    res.body_content += html_table
+    
+    if columns_amount < df_min_col_amount_for_full_width:
+        res.body_content += '</div>'
+    
+    res.body_content += '</div>'
+    
+    return res
+
+# --------------------------------------------------------------------------------------------
+#                              TABLE HTML RENDERERS:
+# --------------------------------------------------------------------------------------------
+
+def _get_html_table_styler(
+                        df                    : 'pd.DataFrame',
+                        highlight_columns     : list[str],
+                        min_max_values        : dict,
+                        round                 : int,
+                        caption               : Optional[str] = None,
+                        heatmap_colormap_name : str   = 'coolwarm',
+                        heatmap_nan_color     : str   = '#ff0000',
+                        heatmap_used_clr_pcnt : float = 0.6,
+                            ) -> str:
+    """
+    Renders the (already rounded) DataFrame with the pandas Styler.
+    """
+    import pandas as pd
+    
     # Apply the styling using pandas Styler
     styler = df.style.apply(_style_dataframe, 
                             highlight_columns     = highlight_columns, 
@@ -95,31 +198,271 @@ def get_table_dataframe_element(    df: pd.DataFrame,
     # Set the class for the table
     styler.set_table_attributes('class="minimalistic-style-table"')
     
+    if caption is not None:
+        styler.set_caption(caption)
+    
     # Convert to HTML
-    html_table = styler.to_html(escape = False, border = 0)
+    return styler.to_html(escape = False, border = 0)
+
+# --------------------------------------------------------------------------------------------
+
+def _get_html_table_fast(
+                        df                    : 'pd.DataFrame',
+                        highlight_columns     : list[str],
+                        min_max_values        : dict,
+                        round                 : int,
+                        caption               : Optional[str] = None,
+                        heatmap_colormap_name : str   = 'coolwarm',
+                        heatmap_nan_color     : str   = '#ff0000',
+                        heatmap_used_clr_pcnt : float = 0.6,
+                            ) -> str:
+    """
+    Renders the (already rounded) DataFrame as `minimalistic-style-table` html, column by column,
+    without the pandas Styler.
 
+    The cell texts follow the Styler formatting: floats with `styler.format.precision` digits
+    (or `round` digits and `-` for NaN in float64 / float32 columns when rounding), other values
+    with `str()`, no escaping. Heatmap colors are inline `background-color` styles.
+    """
+    import numpy as np
+    import pandas as pd
     
-    res.body_content += html_table
+    precision  = pd.get_option('styler.format.precision')
+    round_cols = set(df.select_dtypes(include = ['float64', 'float32']).columns) if round >= 0 else set()
     
-    if columns_amount < df_min_col_amount_for_full_width:
-        res.body_content += '</div>'
+    # Column cells, one list of '<td>' strings per column:
+    columns_cells = []
     
-    res.body_content += '</div>'
+    for col_idx, col in enumerate(df.columns):
+        series = df.iloc[:, col_idx]
+        
+        if col in round_cols:
+            texts = _format_floats(series.tolist(), round, na_rep = '-')
+        elif series.dtype.kind in 'fc':
+            texts = _format_floats(series.tolist(), precision)
+        elif series.dtype.kind in 'iub':
+            texts = [str(value) for value in series.tolist()]
+        else:
+            texts = [_format_value(value, precision) for value in series.tolist()]
+        
+        colors = None
+        if col in highlight_columns and col in min_max_values:
+            colors = _get_heatmap_colors(series.to_numpy(dtype = float, na_value = np.nan), 
+                                         min_max_values[col], 
+                                         heatmap_colormap_name, 
+                                         heatmap_nan_color, 
+                                         heatmap_used_clr_pcnt, )
+        
+        if colors is None:
+            columns_cells.append(['<td>' + text + '</td>' for text in texts])
+        else:
+            columns_cells.append([f'<td style="background-color: {color}">{text}</td>' 
+                                  for text, color in zip(texts, colors.tolist())])
     
-    return res
+    html = ['<table class="minimalistic-style-table">\n']
+    
+    if caption is not None:
+        html.append(f'<caption>{caption}</caption>\n')
+    
+    html += [_get_html_table_head(df, precision), '<tbody>\n']
+    
+    # Rows:
+    index_texts = [_format_value(label, precision) for label in df.index.tolist()]
+    
+    for label, row_cells in zip(index_texts, zip(*columns_cells) if columns_cells else [()] * len(df)):
+        html.append(f'<tr><th class="row_heading level0">{label}</th>{"".join(row_cells)}</tr>\n')
+    
+    html.append('</tbody>\n</table>\n')
+    
+    return ''.join(html)
+
+# --------------------------------------------------------------------------------------------
+
+def _get_html_table_head(df: 'pd.DataFrame', precision: int) -> str:
+    """
+    Returns the `<thead>` of the fast engine table: the column labels, and a row with the index
+    name if the index is named.
+    """
+    index_name   = df.index.name
+    columns_name = df.columns.name
+    
+    html = ['<thead>\n<tr>']
+    
+    if columns_name is not None:
+        html.append(f'<th class="index_name level0">{_format_value(columns_name, precision)}</th>')
+    else:
+        html.append('<th class="blank level0">&nbsp;</th>')
+    
+    html.extend(f'<th class="col_heading level0 col{j}">{_format_value(col, precision)}</th>' 
+                for j, col in enumerate(df.columns))
+    html.append('</tr>\n')
+    
+    if index_name is not None:
+        html.append(f'<tr><th class="index_name level0">{_format_value(index_name, precision)}</th>')
+        html.extend(f'<th class="blank col{j}">&nbsp;</th>' for j in range(len(df.columns)))
+        html.append('</tr>\n')
+    
+    html.append('</thead>\n')
+    
+    return ''.join(html)
+
+# --------------------------------------------------------------------------------------------
+#                                  SIZE POLICY:
+# --------------------------------------------------------------------------------------------
+
+def _check_truncate_strategy(truncate_strategy: str, top_k_column: Optional[str]) -> None:
+    """
+    Raises a ValueError for an unsupported truncate strategy, or 'top_k' without a column.
+    """
+    if truncate_strategy not in DF_TABLE_TRUNCATE_STRATEGIES:
+        raise ValueError(f"Invalid truncate strategy: '{truncate_strategy}'. "
+                         f"Supported strategies: {DF_TABLE_TRUNCATE_STRATEGIES}")
+    
+    if truncate_strategy == 'top_k' and top_k_column is None:
+        raise ValueError("The 'top_k' truncate strategy needs a top_k_column.")
+
+# --------------------------------------------------------------------------------------------
+
+def _get_rows_limit(df: 'pd.DataFrame', max_rows: Optional[int], max_cells: Optional[int]) -> Optional[int]:
+    """
+    Returns the maximum number of rows allowed by `max_rows` and `max_cells`, None if no limit.
+    """
+    limits = []
+    
+    if max_rows is not None:
+        limits.append(max_rows)
+    if max_cells is not None:
+        limits.append(max_cells // max(1, len(df.columns)))
+    
+    return max(1, min(limits)) if limits else None
+
+# --------------------------------------------------------------------------------------------
+
+def _truncate_rows( df               : 'pd.DataFrame',
+                    rows_max         : int,
+                    truncate_strategy: str,
+                    top_k_column     : Optional[str] = None,
+                    top_k_ascending  : bool          = False,
+                        ) -> 'pd.DataFrame':
+    """
+    Returns `rows_max` rows of the DataFrame selected by the truncate strategy.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    if truncate_strategy == 'head_tail':
+        head_rows = (rows_max + 1) // 2
+        return pd.concat([df.iloc[:head_rows], df.iloc[len(df) - (rows_max - head_rows):]])
+    
+    if truncate_strategy == 'sample':
+        rng       = np.random.default_rng(DF_TABLE_SAMPLE_SEED)
+        positions = np.sort(rng.choice(len(df), size = rows_max, replace = False))
+        return df.iloc[positions]
+    
+    # 'top_k': ties in the original order, NaN values last.
+    # nlargest / nsmallest select without sorting the whole column (numeric columns, enough non-NaN values):
+    if pd.api.types.is_numeric_dtype(df[top_k_column]) and df[top_k_column].count() >= rows_max:
+        if top_k_ascending:
+            return df.nsmallest(rows_max, top_k_column, keep = 'first')
+        return df.nlargest(rows_max, top_k_column, keep = 'first')
+    
+    return df.sort_values(top_k_column, ascending = top_k_ascending, kind = 'stable', na_position = 'last').iloc[:rows_max]
+
+# --------------------------------------------------------------------------------------------
+
+def _get_truncation_caption(rows_total       : int,
+                            rows_max         : int,
+                            truncate_strategy: str,
+                            top_k_column     : Optional[str] = None,
+                            top_k_ascending  : bool          = False,
+                                ) -> str:
+    """
+    Returns the table caption describing the shown and the omitted rows.
+    """
+    if truncate_strategy == 'head_tail':
+        head_rows = (rows_max + 1) // 2
+        shown     = f'the first {head_rows:,} and the last {rows_max - head_rows:,} of {rows_total:,} rows'
+    elif truncate_strategy == 'sample':
+        shown     = f'a uniform sample of {rows_max:,} of {rows_total:,} rows'
+    else:
+        order     = 'smallest' if top_k_ascending else 'largest'
+        shown     = f'the {rows_max:,} rows with the {order} {top_k_column} of {rows_total:,} rows'
+    
+    return f'Showing {shown}, {rows_total - rows_max:,} rows omitted.'
+
+# --------------------------------------------------------------------------------------------
+#                                  ENGINE SUPPORT:
+# --------------------------------------------------------------------------------------------
+
+def _is_fast_engine_supported(df: 'pd.DataFrame') -> bool:
+    """
+    The fast engine renders one header level and unique labels, other frames use the Styler.
+    """
+    return (df.index.nlevels == 1 and df.columns.nlevels == 1 
+            and df.index.is_unique and df.columns.is_unique)
+
+# --------------------------------------------------------------------------------------------
+
+def _format_floats(values: list, precision: int, na_rep: Optional[str] = None) -> list[str]:
+    """
+    Formats float values with the given precision, NaN as `na_rep` (if given).
+    """
+    float_format = ('{:.' + str(precision) + 'f}').format
+    
+    if na_rep is None:
+        return [float_format(value) for value in values]
+    
+    return [na_rep if value != value else float_format(value) for value in values]
+
+# --------------------------------------------------------------------------------------------
+
+def _format_value(value, precision: int) -> str:
+    """
+    Formats one value like the default Styler formatter: floats (and complex) with the precision,
+    other values with `str()`.
+    """
+    import numpy as np
+    
+    if isinstance(value, (float, complex, np.floating, np.complexfloating)):
+        return f'{value:.{precision}f}'
+    return str(value)
+
+# --------------------------------------------------------------------------------------------
+
+def _get_heatmap_colors(values               : 'np.ndarray',
+                        min_max              : tuple,
+                        heatmap_colormap_name: str,
+                        heatmap_nan_color    : str,
+                        heatmap_used_clr_pcnt: float,
+                            ) -> Optional['np.ndarray']:
+    """
+    Returns the heatmap colors of the column values, `None` if min >= max (not highlighted).
+    """
+    from .value_to_color import values_to_colors
+    
+    # Check if min >= max then skip:
+    if min_max[0] >= min_max[1]:
+        return None
+    
+    return values_to_colors(values, 
+                            min_max[0], 
+                            min_max[1], 
+                            heatmap_colormap_name,
+                            heatmap_nan_color, 
+                            heatmap_used_clr_pcnt, )
 
 # --------------------------------------------------------------------------------------------
 #                              STYLING FUNCTION:
 # --------------------------------------------------------------------------------------------
 
 def _style_dataframe(   
-                        df                    : pd.DataFrame,
+                        df                    : 'pd.DataFrame',
                         highlight_columns     : list[str],
                         min_max_values, 
                         heatmap_colormap_name : str   = 'coolwarm',
                         heatmap_nan_color     : str   = '#ff0000',
                         heatmap_used_clr_pcnt : float = 0.6,
-                            ) -> pd.DataFrame:
+                            ) -> 'pd.DataFrame':
     """
     Styles a DataFrame for highlighting columns with heatmap colors.
 
@@ -143,6 +486,8 @@ def _style_dataframe(
     pd.DataFrame
         The DataFrame with styles applied for HTML rendering.
     """
+    import numpy as np
+    import pandas as pd
     
     styles = pd.DataFrame(  '', 
                             index   = df.index, 
@@ -151,17 +496,15 @@ def _style_dataframe(
     for col in highlight_columns:
         
         if col in df.columns:
-            # Check if min >= max then skip:
-            if min_max_values[col][0] >= min_max_values[col][1]:
+            colors = _get_heatmap_colors(   df[col].to_numpy(dtype = float, na_value = np.nan), 
+                                            min_max_values[col], 
+                                            heatmap_colormap_name,
+                                            heatmap_nan_color, 
+                                            heatmap_used_clr_pcnt, )
+            if colors is None:
                 continue
             
-            color: str = df[col].apply(value_to_color, args = ( min_max_values[col][0], 
-                                                                min_max_values[col][1], 
-                                                                heatmap_colormap_name,
-                                                                heatmap_nan_color, 
-                                                                heatmap_used_clr_pcnt,))
-            
-            styles[col] = 'background-color: ' + color
+            styles[col] = 'background-color: ' + colors
             pass
         pass
     
@@ -177,6 +520,8 @@ def test_get_table_dataframe_element():
     """
     Test the get_table_dataframe_element function with a sample DataFrame.
     """
+    import pandas as pd
+    
     # Create a sample DataFrame
     data = {
         'A': [1, 2, 3, 4, 5],
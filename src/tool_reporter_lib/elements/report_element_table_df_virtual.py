@@ -0,0 +1,416 @@
+import json
+import math
+
+from typing import TYPE_CHECKING, Optional, Union
+from .report_element import ReportElement, ReportElementTypes
+from .report_element_table_df import (
+    _format_value,
+    _get_html_table_head,
+    get_table_dataframe_element, )
+
+# pandas, numpy and matplotlib (value_to_color) are imported on the first table, not with the package:
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# ============================================================================================
+# Meta Information
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'report element - table dataframe virtual'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# ============================================================================================
+
+"""
+Virtual scrolling DataFrame table, for tables too large to be embedded as static `<tr>` markup.
+
+The data is embedded once as columnar JSON (`<script type="application/json">`):
+    - float columns as numbers rounded to the displayed digits, formatted in the browser,
+    - integer columns as numbers, other columns as the formatted cell texts,
+    - RangeIndex as start / step, other indexes as the formatted labels,
+    - heatmap columns with their min / max, and one colormap lookup table per table.
+
+`VIRTUAL_TABLE_SCRIPT` (added once per report) renders only the rows of the visible window
+while scrolling, with the same cell texts and heatmap colors as the 'fast' table engine.
+"""
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+# Estimated row height (px) of the `minimalistic-style-table`, measured again in the browser:
+VIRTUAL_TABLE_ROW_HEIGHT: int = 42
+
+# Largest integer shipped as a JSON number (exact in JavaScript), larger ones are shipped as text:
+_MAX_SAFE_INTEGER: int = 2**53
+
+# Largest float shipped as a JSON number (`toFixed` switches to exponent notation from 1e21):
+_MAX_FIXED_FLOAT: float = 1e21
+
+# --- CSS AND JAVASCRIPT (added once per report with virtual tables): ------------------------
+
+VIRTUAL_TABLE_STYLE: str = """
+.virtual-table-scroll {
+    overflow-y: auto;
+    margin    : 25px 0;
+}
+
+.virtual-table-scroll .minimalistic-style-table {
+    margin: 0;
+}
+
+.virtual-table-scroll th,
+.virtual-table-scroll td {
+    white-space: nowrap;
+}
+
+.virtual-table-scroll thead {
+    position: sticky;
+    top     : 0;
+    z-index : 3;
+}
+"""
+
+VIRTUAL_TABLE_SCRIPT: str = """
+(function () {
+    var MAX_HEIGHT = 8000000;   // px, larger tables map the scroll position to the row index
+    var OVERSCAN   = 10;        // rows rendered above and below the visible window
+
+    function toNumber(value) {
+        return value === null ? NaN : Number(value);
+    }
+
+    function cellText(col, i) {
+        if (col.texts) { return col.texts[i]; }
+        var value = col.values[i];
+        if (value === null) { return col.na; }
+        if (typeof value === 'string') { return value === 'Infinity' ? 'inf' : '-inf'; }
+        if (col.digits === undefined) { return String(value); }
+        var text = value.toFixed(col.digits);
+        return (value === 0 && 1 / value < 0) ? '-' + text : text;
+    }
+
+    function heatColor(lut, value, min, max) {
+        if (value === null) { return lut.nan; }
+        var t = (toNumber(value) - min) / (max - min);
+        t = t > 0 ? (t < 1 ? t : 1) : 0;
+        var position = (lut.offset + t * lut.scale) * lut.resolution;
+        var index    = Math.floor(Math.min(position, lut.resolution - 1)) - lut.first;
+        return lut.colors[Math.min(Math.max(index, 0), lut.colors.length - 1)];
+    }
+
+    function rowHtml(table, i) {
+        var label = table.index ? table.index[i] : String(table.index_start + i * table.index_step);
+        var html  = '<tr><th class="row_heading level0">' + label + '</th>';
+        for (var j = 0; j < table.columns.length; j++) {
+            var col = table.columns[j], text = cellText(col, i);
+            if (col.heat) {
+                var value = col.heat_values ? col.heat_values[i] : col.values[i];
+                html += '<td style="background-color: ' + heatColor(table.lut, value, col.heat_min, col.heat_max) + '">' + text + '</td>';
+            } else {
+                html += '<td>' + text + '</td>';
+            }
+        }
+        return html + '</tr>';
+    }
+
+    function init(box) {
+        var table   = JSON.parse(box.querySelector('script[type="application/json"]').textContent);
+        var bodies  = box.querySelectorAll('tbody');
+        var height  = table.row_height;
+        var pending = false;
+
+        table.columns.forEach(function (col) {
+            if (col.heat) { col.heat_min = toNumber(col.heat[0]); col.heat_max = toNumber(col.heat[1]); }
+        });
+
+        function render() {
+            pending = false;
+            var n       = table.rows;
+            var visible = Math.max(table.visible_rows, Math.ceil(box.clientHeight / height));
+            var total   = Math.min(n * height, MAX_HEIGHT);
+            var first, top;
+
+            if (n * height > MAX_HEIGHT) {
+                var fraction = Math.min(box.scrollTop / Math.max(1, total - box.clientHeight), 1);
+                var target   = Math.floor(fraction * Math.max(0, n - visible));
+                first = target - target % 2;
+                top   = Math.max(0, box.scrollTop - (target - first) * height);
+            } else {
+                first = Math.max(0, Math.floor(box.scrollTop / height) - OVERSCAN);
+                first = first - first % 2;   // keeps the even / odd row striping
+                top   = first * height;
+            }
+
+            var last = Math.min(n, first + visible + 2 * OVERSCAN);
+            var html = [];
+            for (var i = first; i < last; i++) { html.push(rowHtml(table, i)); }
+
+            bodies[1].innerHTML = html.join('');
+            bodies[0].rows[0].cells[0].style.height = top + 'px';
+            bodies[2].rows[0].cells[0].style.height = Math.max(0, total - top - (last - first) * height) + 'px';
+
+            var row = bodies[1].rows[0];
+            if (row) {
+                var measured = row.getBoundingClientRect().height;
+                if (measured > 0 && Math.abs(measured - height) > 0.5) {
+                    height = measured;
+                    schedule();
+                }
+            }
+        }
+
+        function schedule() {
+            if (!pending) {
+                pending = true;
+                window.requestAnimationFrame(render);
+            }
+        }
+
+        box.addEventListener('scroll', schedule, { passive: true });
+        if (window.ResizeObserver) { new ResizeObserver(schedule).observe(box); }
+        render();
+    }
+
+    Array.prototype.forEach.call(document.querySelectorAll('.virtual-table-scroll'), init);
+})();
+"""
+
+# --------------------------------------------------------------------------------------------
+#                                  REPORT ELEMENTS:
+# --------------------------------------------------------------------------------------------
+
+def get_table_dataframe_virtual_element(
+                                    df: 'pd.DataFrame',
+                                    highlight_columns = [],
+                                    round                 : int   = -1,
+                                    heatmap_colormap_name : str   = 'coolwarm',
+                                    heatmap_used_clr_pcnt : float = 0.6,
+                                    heatmap_nan_color     : str   = '#ff0000',
+                                    df_min_col_amount_for_full_width: int  = 8,
+                                    visible_rows          : int   = 25,
+                                        ) -> ReportElement:
+    """
+    Generates a ReportElement with a virtual scrolling table of a DataFrame: the data is
+    embedded once as columnar JSON and only the visible rows are rendered by the browser.
+
+    The cell texts and heatmap colors are the same as for `get_table_dataframe_element`,
+    the heatmap of columns that are not rounded uses the values rounded to the displayed
+    precision. The report needs `VIRTUAL_TABLE_STYLE` and `VIRTUAL_TABLE_SCRIPT` (added by
+    `ReportHTML` when the report has a virtual table).
+
+    DataFrames with a MultiIndex (rows or columns) are rendered as a static table.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame to display in the report.
+    highlight_columns : list[str], optional
+        Columns to apply a heatmap style, by default an empty list.
+    round : int, optional
+        Number of decimal places to round the values, by default -1 (no rounding).
+    heatmap_colormap_name : str, optional
+        Name of the colormap for heatmap highlighting, by default 'coolwarm'.
+    heatmap_used_clr_pcnt : float, optional
+        Percentage of the colormap spectrum to use for heatmap, by default 0.6.
+    heatmap_nan_color : str, optional
+        Color for NaN values in the heatmap, by default '#ff0000'.
+    df_min_col_amount_for_full_width : int, optional
+        Minimum number of columns required for full-width table layout, by default 8.
+    visible_rows : int, optional
+        Number of rows visible without scrolling, by default 25.
+
+    Returns
+    -------
+    ReportElement
+        A ReportElement object containing the virtual table.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if df.index.nlevels > 1 or df.columns.nlevels > 1:
+        return get_table_dataframe_element( df,
+                                            highlight_columns,
+                                            round,
+                                            heatmap_colormap_name,
+                                            heatmap_used_clr_pcnt,
+                                            heatmap_nan_color,
+                                            df_min_col_amount_for_full_width, )
+
+    res      = ReportElement()
+    res.type = ReportElementTypes.DFTABLE_VIRTUAL
+
+    precision      = pd.get_option('styler.format.precision')
+    columns_amount = len(df.columns)
+
+    # Heatmap ranges of the original values:
+    heat_ranges = {j: (df.iloc[:, j].min(), df.iloc[:, j].max())
+                   for j, col in enumerate(df.columns) if col in highlight_columns}
+
+    if round >= 0:
+        df = df.round(round)
+
+    round_cols = set(df.select_dtypes(include = ['float64', 'float32']).columns) if round >= 0 else set()
+
+    table_data = {  'rows'        : len(df),
+                    'visible_rows': visible_rows,
+                    'row_height'  : VIRTUAL_TABLE_ROW_HEIGHT,
+                    'columns'     : [], }
+
+    if isinstance(df.index, pd.RangeIndex):
+        table_data['index_start'] = df.index.start
+        table_data['index_step']  = df.index.step
+    else:
+        table_data['index'] = [_format_value(label, precision) for label in df.index.tolist()]
+
+    for j, col in enumerate(df.columns):
+        series = df.iloc[:, j]
+
+        if col in round_cols:
+            column_data = _get_column_data(series, round, '-', precision)
+        else:
+            column_data = _get_column_data(series, precision, 'nan', precision)
+
+        if j in heat_ranges and not heat_ranges[j][0] >= heat_ranges[j][1]:
+            column_data['heat'] = [_to_json_number(heat_ranges[j][0]), _to_json_number(heat_ranges[j][1])]
+            if 'values' not in column_data:
+                column_data['heat_values'] = _to_json_numbers(series.to_numpy(dtype = float, na_value = np.nan))
+
+        table_data['columns'].append(column_data)
+
+    if any('heat' in column_data for column_data in table_data['columns']):
+        table_data['lut'] = _get_lut_data(heatmap_colormap_name, heatmap_used_clr_pcnt, heatmap_nan_color)
+
+    # '</' is escaped, the json can not close the script element:
+    json_data   = json.dumps(table_data, ensure_ascii = False, separators = (',', ':')).replace('</', '<\\/')
+    head_rows   = 2 if df.index.name is not None else 1
+    max_height  = (min(visible_rows, len(df)) + head_rows) * VIRTUAL_TABLE_ROW_HEIGHT
+    spacer_body = (f'<tbody><tr><td colspan="{columns_amount + 1}" '
+                   f'style="padding: 0; border: 0; height: 0px"></td></tr></tbody>\n')
+
+    if columns_amount < df_min_col_amount_for_full_width:
+        res.body_content += '<div class=\"grid_12\">'
+
+    res.body_content += '<div class=\"table-scroll-wrapper\">'
+    res.body_content += (f'<div class="virtual-table-scroll" style="max-height: {max_height}px">'
+                         f'<script type="application/json">{json_data}</script>\n'
+                         '<table class="minimalistic-style-table">\n'
+                         f'{_get_html_table_head(df, precision)}'
+                         f'{spacer_body}<tbody></tbody>\n{spacer_body}'
+                         '</table>\n</div>')
+
+    if columns_amount < df_min_col_amount_for_full_width:
+        res.body_content += '</div>'
+
+    res.body_content += '</div>'
+
+    return res
+
+# --------------------------------------------------------------------------------------------
+#                                 SUPPORTING FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _get_column_data(series: 'pd.Series', digits: int, na_rep: str, precision: int) -> dict:
+    """
+    Returns the JSON data of one column: either the `values` (numbers, formatted in the browser
+    with `digits` and `na`) or the formatted `texts`.
+    """
+    import numpy as np
+
+    column_data = {}
+    kind        = series.dtype.kind
+
+    if kind == 'f':
+        values = series.to_numpy(dtype = float, na_value = np.nan)
+        finite = values[np.isfinite(values)]
+
+        if not len(finite) or np.abs(finite).max() < _MAX_FIXED_FLOAT:
+            column_data['values'] = _to_json_numbers(values, digits)
+            column_data['digits'] = digits
+            column_data['na']     = na_rep
+            return column_data
+
+        column_data['texts'] = [na_rep if value != value else f'{value:.{digits}f}' for value in values.tolist()]
+        return column_data
+
+    if kind in 'iu' and not series.hasnans and (series.empty or int(series.abs().max()) <= _MAX_SAFE_INTEGER):
+        column_data['values'] = series.tolist()
+        return column_data
+
+    if kind in 'iub':
+        column_data['texts'] = [str(value) for value in series.tolist()]
+    elif kind == 'c':
+        column_data['texts'] = [f'{value:.{precision}f}' for value in series.tolist()]
+    else:
+        column_data['texts'] = [_format_value(value, precision) for value in series.tolist()]
+
+    return column_data
+
+# --------------------------------------------------------------------------------------------
+
+def _to_json_number(value) -> Union[float, str, None]:
+    """
+    Converts a float to a JSON value: `None` for NaN, 'Infinity' / '-Infinity' for infinite
+    values, else the value.
+    """
+    value = float(value)
+
+    if value != value:
+        return None
+    if math.isinf(value):
+        return 'Infinity' if value > 0 else '-Infinity'
+
+    return value
+
+# --------------------------------------------------------------------------------------------
+
+def _to_json_numbers(values: 'np.ndarray', digits: Optional[int] = None) -> list:
+    """
+    Converts float values to JSON values (see `_to_json_number()`), rounded to `digits` if given.
+
+    The rounding gives the Python `round()` result, which is correctly rounded: `toFixed(digits)`
+    of the rounded value in the browser is the same text as `f'{value:.{digits}f}'`. `np.round()`
+    is used for the values that are not close to a tie, `round()` for the others.
+    """
+    import numpy as np
+
+    finite = np.isfinite(values)
+
+    if digits is not None:
+        with np.errstate(invalid = 'ignore', over = 'ignore'):
+            scaled   = values * 10.0**digits
+            rounded  = np.round(values, digits)
+            tie_dist = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+            unsure   = finite & (tie_dist <= np.abs(scaled) * 2**-50 + 1e-9)
+
+        for i in np.flatnonzero(unsure):
+            rounded[i] = round(float(values[i]), digits)
+        values = rounded
+
+    res = values.tolist()
+
+    for i in np.flatnonzero(~finite):
+        res[i] = _to_json_number(res[i])
+
+    return res
+
+# --------------------------------------------------------------------------------------------
+
+def _get_lut_data(colormap_name: str, used_palette_part: float, nan_color: str) -> dict:
+    """
+    Returns the JSON data of the colormap lookup table, the browser does the same lookup as
+    `ColormapLUT.lookup()`.
+    """
+    from .value_to_color import get_colormap_lut
+
+    colormap_lut = get_colormap_lut(colormap_name, used_palette_part)
+
+    return {'colors'    : colormap_lut.hex_colors.tolist(),
+            'offset'    : colormap_lut.offset,
+            'scale'     : colormap_lut.scale,
+            'resolution': colormap_lut.resolution,
+            'first'     : colormap_lut.first_index,
+            'nan'       : nan_color, }
+
+# --------------------------------------------------------------------------------------------
@@ -3,8 +3,8 @@
 This module provides functionality to load, clean, and validate the CSS styles from an external file.
 """
 
-__version__     : str = '0.0.9'
-__version_date__: str = '2024-10-20'
+__version__     : str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_          : str = 'Report Style Loader'
 VERSION         : str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
@@ -12,10 +12,18 @@ VERSION         : str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 # v0.0.2 @ 2024-08-13 : Initial Release
 # v0.0.9 @ 2024-10-20 : Added CSS content cleaning and validation functions.
 #                     : Separated CSS file path retrieval from content loading.
+# v0.1.0 @ 2026-10-16 : get_css_content() is served from the process-wide template cache.
+#                     : get_css_content(element_types): only the rule groups of the given element types.
 # ============================================================================================
 
 import os
 import re
+import threading
+
+from typing import Iterable, Optional
+
+from .report_element import ReportElementTypes
+from .report_template_cache import get_cached_file_content
 
 # --------------------------------------------------------------------------------------------
 # TODO NOTES:
@@ -25,6 +33,46 @@ import re
 # 3. Create additional helper functions to modify CSS at runtime if needed.
 # --------------------------------------------------------------------------------------------
 
+# --- CSS RULE GROUPS: -----------------------------------------------------------------------
+
+# A `/* @group name */` comment in report_style.css starts the rules of a group (until the next
+# marker), the rules before the first marker and of the 'base' group are always emitted:
+CSS_GROUP_PATTERN: re.Pattern = re.compile(r'/\*\s*@group\s+(\w+)\s*\*/')
+
+CSS_BASE_GROUP: str = 'base'
+
+# The rule groups used by each element type, in addition to 'base'. Element types that are not
+# listed (OTHER, NONE) may use any rule, they get the whole stylesheet:
+ELEMENT_CSS_GROUPS: dict[ReportElementTypes, tuple[str, ...]] = {
+    ReportElementTypes.STYLE                   : (),
+    ReportElementTypes.TITLE                   : (),
+    ReportElementTypes.TEXT                    : (),
+    ReportElementTypes.TEXT_CONSOLE            : (),
+    ReportElementTypes.SPACE                   : (),
+    ReportElementTypes.FOOTER                  : (),
+    ReportElementTypes.HORIZONTAL_LINE         : (),
+    ReportElementTypes.HEAD_TITLE_ON_BACKGROUND: (),
+    ReportElementTypes.SHOWHIDE_REGION_CLOSE   : (),
+    ReportElementTypes.CHART                   : ('chart',),
+    ReportElementTypes.IMAGE_PNG               : ('chart',),
+    ReportElementTypes.IMAGE_JPEG              : ('chart',),
+    ReportElementTypes.DFTABLE                 : ('df_table',),
+    ReportElementTypes.DFTABLE_VIRTUAL         : ('df_table',),
+    ReportElementTypes.CODE                    : ('code',),
+    ReportElementTypes.ALERT_BOX               : ('alert_box',),
+    ReportElementTypes.PARAM_VALUE_TABLE       : ('param_value_grid',),
+    ReportElementTypes.PARAM_VALUE_GRID        : ('param_value_grid',),
+    ReportElementTypes.PARAM_VALUE_TABLE_v2    : ('param_value_table',),
+    ReportElementTypes.SHOWHIDE_REGION_OPEN    : ('showhide',),
+}
+
+# Cleaned (group, rules) segments of the stylesheet, per raw file content, and the joined CSS
+# per set of groups (the raw content is served by the template cache, re-split when it changes):
+_css_groups_cache     : dict           = {'raw': None, 'segments': [], 'css': {}}
+_css_groups_cache_lock: threading.Lock = threading.Lock()
+
+# --------------------------------------------------------------------------------------------
+
 def get_css_file_path() -> str:
     """
     Retrieves the path to the CSS file.
@@ -77,10 +125,19 @@ def clean_css_content(css_content: str) -> str:
 
 # -----------------------------------------------------------------------------------------------------------
 
-def get_css_content() -> str:
+def get_css_content(element_types: Optional[Iterable[ReportElementTypes]] = None) -> str:
     """
     Loads the CSS content from the external CSS file and cleans it by removing comments and unwanted spaces.
 
+    The cleaned content is cached for the whole process and reloaded only when the file changes.
+
+    Parameters
+    ----------
+    element_types : Iterable[ReportElementTypes], optional
+        If given, only the rule groups used by these element types are returned (`ELEMENT_CSS_GROUPS`,
+        in stylesheet order, with the 'base' rules). All the rules if an element type has no
+        declared groups. If None, the whole stylesheet (default is `None`).
+
     Returns
     -------
     str
@@ -96,11 +153,60 @@ def get_css_content() -> str:
     if not os.path.exists(css_file_path):
         raise FileNotFoundError(f"CSS file not found at {css_file_path}")
 
-    with open(css_file_path, 'r') as css_file:
-        css_content = css_file.read()
-    
-    # Clean the CSS content
-    return clean_css_content(css_content)
+    if element_types is None:
+        # Cleaned content from the template cache (read from disk only on the first call):
+        return get_cached_file_content(css_file_path, clean_css_content)
+
+    groups = _get_css_groups(element_types)
+    if groups is None:
+        return get_cached_file_content(css_file_path, clean_css_content)
+
+    raw_css_content = get_cached_file_content(css_file_path)
+
+    with _css_groups_cache_lock:
+        if _css_groups_cache['raw'] is not raw_css_content:
+            _css_groups_cache['raw']      = raw_css_content
+            _css_groups_cache['segments'] = _split_css_groups(raw_css_content)
+            _css_groups_cache['css']      = {}
+
+        css = _css_groups_cache['css'].get(groups)
+        if css is None:
+            css = ''.join(rules for group, rules in _css_groups_cache['segments'] if group in groups)
+            _css_groups_cache['css'][groups] = css
+
+    return css
+
+# -----------------------------------------------------------------------------------------------------------
+
+def _get_css_groups(element_types: Iterable[ReportElementTypes]) -> Optional[frozenset[str]]:
+    """
+    Returns the rule groups used by the element types (with 'base'), None if an element type
+    has no declared groups (all the rules are needed).
+    """
+    groups = {CSS_BASE_GROUP}
+
+    for element_type in set(element_types):
+        element_groups = ELEMENT_CSS_GROUPS.get(element_type)
+        if element_groups is None:
+            return None
+        groups.update(element_groups)
+
+    return frozenset(groups)
+
+# -----------------------------------------------------------------------------------------------------------
+
+def _split_css_groups(css_content: str) -> list[tuple[str, str]]:
+    """
+    Splits the raw CSS on the `/* @group name */` markers, returns the cleaned rules of every
+    segment with its group name. Joined in order, the segments give `clean_css_content(css_content)`.
+    """
+    parts    = CSS_GROUP_PATTERN.split(css_content)
+    segments = [(CSS_BASE_GROUP, clean_css_content(parts[0]))]
+
+    for i in range(1, len(parts), 2):
+        segments.append((parts[i], clean_css_content(parts[i + 1])))
+
+    return [(group, rules) for group, rules in segments if rules]
 
 
 # -----------------------------------------------------------------------------------------------------------
@@ -0,0 +1,198 @@
+import os
+import re
+import threading
+
+from typing import Callable, Optional
+
+# ============================================================================================
+# Meta Information
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Report Template Cache'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# ============================================================================================
+
+"""
+Process-wide cache of the template files shipped with the package (report CSS, header title
+CSS and HTML).
+
+Every file is read and cleaned once, and then served from memory. A cache entry is keyed by
+the file path and the cleaning function, and is invalidated when the file modification time
+or size changes, so edited templates are picked up without restarting the process.
+
+Templates with `{{key}}` placeholders are split once into literal parts and placeholder keys,
+rendering is a single join instead of one `str.replace` pass per parameter.
+"""
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+PLACEHOLDER_PATTERN: re.Pattern = re.compile(r'\{\{(\w+)\}\}')
+
+# --- TEMPLATE CACHE (module level, shared by all reports of the process): -------------------
+
+_template_cache: dict[tuple, tuple] = {}   # (path, clean_func) -> ((mtime_ns, size), ReportTemplate)
+_template_cache_lock: threading.Lock = threading.Lock()
+_template_cache_stats: dict[str, int] = {'hits': 0, 'misses': 0}
+
+# ============================================================================================
+#                                REPORT TEMPLATE CLASS
+# ============================================================================================
+
+class ReportTemplate:
+    """
+    A template pre-split into literal parts and `{{key}}` placeholders.
+
+    Attributes
+    ----------
+    content : str
+        The (cleaned) template content.
+    parts : list[str]
+        Alternating literal parts and placeholder keys, literals at the even positions.
+    clean_func : Callable[[str], str], optional
+        The cleaning function applied to the template, and to the values on `render()`.
+
+    Methods
+    -------
+    render(params) -> str
+        Returns the content with the placeholders replaced by the values from params.
+    """
+
+    __slots__ = ('content', 'parts', 'clean_func')
+
+    def __init__(   self,
+                    content   : str,
+                    clean_func: Optional[Callable[[str], str]] = None,
+                        ) -> None:
+        """
+        Cleans the content (if a cleaning function is given) and splits it on the placeholders.
+        """
+        if clean_func is not None:
+            content = clean_func(content)
+
+        self.content   : str                            = content
+        self.parts     : list[str]                      = PLACEHOLDER_PATTERN.split(content)
+        self.clean_func: Optional[Callable[[str], str]] = clean_func
+
+    # --------------------------------------------------------------------------------------------
+
+    def render(self, params: dict) -> str:
+        """
+        Returns the content with the `{{key}}` placeholders replaced by the values from params.
+
+        Placeholders without a value in params are kept as they are. The values are cleaned with
+        the template cleaning function, so the result is the same as cleaning the rendered text.
+
+        Parameters
+        ----------
+        params : dict
+            Placeholder values by key, converted with `str()`.
+
+        Returns
+        -------
+        str
+            The rendered content.
+        """
+        parts = self.parts[:]
+
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            if key in params:
+                value    = str(params[key])
+                parts[i] = self.clean_func(value) if self.clean_func is not None else value
+            else:
+                parts[i] = f'{{{{{key}}}}}'
+
+        return ''.join(parts)
+
+# --------------------------------------------------------------------------------------------
+#                                  CACHE FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def get_cached_template( file_path : str,
+                         clean_func: Optional[Callable[[str], str]] = None,
+                            ) -> ReportTemplate:
+    """
+    Returns the template of a file from the process-wide cache, reading and cleaning it only
+    when it is not cached yet or the file has changed (modification time or size).
+
+    Files that cannot be stat-ed (e.g. not on disk) are read directly and not cached.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the template file.
+    clean_func : Callable[[str], str], optional
+        Function to clean the file content, part of the cache key (default is `None`).
+
+    Returns
+    -------
+    ReportTemplate
+        The cleaned and pre-split template.
+    """
+    try:
+        stat      = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return ReportTemplate(_read_file(file_path), clean_func)
+
+    key = (os.path.abspath(file_path), clean_func)
+
+    with _template_cache_lock:
+        cached = _template_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            _template_cache_stats['hits'] += 1
+            return cached[1]
+
+    template = ReportTemplate(_read_file(file_path), clean_func)
+
+    with _template_cache_lock:
+        _template_cache_stats['misses'] += 1
+        _template_cache[key] = (signature, template)
+
+    return template
+
+# --------------------------------------------------------------------------------------------
+
+def get_cached_file_content( file_path : str,
+                             clean_func: Optional[Callable[[str], str]] = None,
+                                ) -> str:
+    """
+    Returns the (cleaned) content of a file from the process-wide cache.
+
+    See `get_cached_template()` for the caching and invalidation rules.
+    """
+    return get_cached_template(file_path, clean_func).content
+
+# --------------------------------------------------------------------------------------------
+
+def clear_template_cache() -> None:
+    """
+    Removes all templates from the cache and resets its statistics.
+    """
+    with _template_cache_lock:
+        _template_cache.clear()
+        _template_cache_stats['hits']   = 0
+        _template_cache_stats['misses'] = 0
+
+# --------------------------------------------------------------------------------------------
+
+def get_template_cache_info() -> dict[str, int]:
+    """
+    Returns the cache statistics: `hits`, `misses` and the current `size`.
+    """
+    with _template_cache_lock:
+        return {**_template_cache_stats, 'size': len(_template_cache)}
+
+# --------------------------------------------------------------------------------------------
+#                                 SUPPORTING FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _read_file(file_path: str) -> str:
+    """Reads the whole text file."""
+    with open(file_path, 'r') as file:
+        return file.read()
+
+# --------------------------------------------------------------------------------------------
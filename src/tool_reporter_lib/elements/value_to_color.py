@@ -1,21 +1,36 @@
+import threading
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+from collections import OrderedDict
+from typing import Optional
 from matplotlib.colors import Colormap, rgb2hex
 
 # ============================================================================================
 # Meta Information
-__version__:      str = "0.0.2"
-__version_date__: str = "2024-08-13"
+__version__:      str = "0.1.0"
+__version_date__: str = "2026-10-16"
 _name_:           str = "Value to Color Function"
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
 # --- VERSION HISTORY: -----------------------------------------------------------------------
 # version: 0.0.2 @ 2024-08-13 : Initial Release
+# version: 0.1.0 @ 2026-10-16 : Added vectorized `values_to_colors` for whole columns.
+#                             : Added bounded cache of precomputed colormap lookup tables.
+#                             : Undefined normalized values (min == max) get the nan_color.
 # ============================================================================================
 
 # --- CONSTANTS: -----------------------------------------------------------------------------
 COLOR_MAP_NAME_DEFAULT_LIST: list[str] = ['viridis', 'plasma', 'inferno', 'magma', 'cividis']
 VIRIDIS_COLOR_MAP          : Colormap  = plt.get_cmap('viridis')
+COLOR_MAP_NAME_PREWARM_LIST: list[str] = ['coolwarm', 'viridis']
+
+# --- COLORMAP LOOKUP TABLE CACHE: -----------------------------------------------------------
+COLORMAP_LUT_CACHE_MAX_SIZE: int = 32   # Least recently used tables are evicted above this size.
+
+_colormap_lut_cache     : OrderedDict = OrderedDict()
+_colormap_lut_cache_lock: threading.Lock = threading.Lock()
+_colormap_lut_cache_stats: dict[str, int] = {'hits': 0, 'misses': 0}
 
 # ============================================================================================
 #               Functions for Converting Value to Heatmap Color
@@ -88,26 +103,293 @@ def value_to_color(
     if np.isnan(value):
         return nan_color
     
-    # Validate colormap name
-    if colormap_name not in plt.colormaps():
-        emergency_colormap = COLOR_MAP_NAME_DEFAULT_LIST[0]
-        print(f"!!! ERROR !!! Invalid colormap name: '{colormap_name}'")
-        print(f"Using default colormap: '{emergency_colormap}'")
-        colormap_name = emergency_colormap
+    colormap_lut = get_colormap_lut(colormap_name, used_palette_part)
     
-    colormap = plt.get_cmap(colormap_name)
+    # Normalize value between 0 and 1 (undefined for value == min == max, colored as NaN)
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        normalized_value = np.clip(np.divide(value - min_value, max_value - min_value), 0, 1)
     
-    # Normalize value between 0 and 1
-    normalized_value = np.clip((value - min_value) / (max_value - min_value), 0, 1)
+    if np.isnan(normalized_value):
+        return nan_color
     
-    # Adjust the used palette part
-    used_palette_part = np.clip(used_palette_part, 0.05, 1.0)
-    normalized_value  = 0.5 * (1.0 - used_palette_part) + normalized_value * used_palette_part
+    return colormap_lut.lookup_value(normalized_value)
+
+# --------------------------------------------------------------------------------------------
+
+def values_to_colors(
+                    values           : np.ndarray,
+                    min_value        : float,
+                    max_value        : float,
+                    colormap_name    : str = 'viridis',
+                    nan_color        : str = '#ff0000',
+                    used_palette_part: float = 0.4,
+                        ) -> np.ndarray:
+    """
+    Return the HEX colors for a whole array of values based on a colormap.
+
+    Vectorized version of `value_to_color`: the values are normalized with NumPy and looked up
+    in the cached colormap lookup table in bulk. The colors are identical to calling
+    `value_to_color` for every value.
+
+    Parameters
+    ----------
+    values : array-like of float
+        The values to be converted to colors (e.g. a DataFrame column).
+    min_value : float
+        The minimum value in the range.
+    max_value : float
+        The maximum value in the range.
+    colormap_name : str, optional
+        The name of the colormap to use, by default 'viridis'.
+    nan_color : str, optional
+        HEX color for NaN values, by default '#ff0000'.
+    used_palette_part : float, optional
+        The part of the palette to use, between 0.05 and 1.0, by default 0.4.
+
+    Returns
+    -------
+    np.ndarray
+        Array (dtype object) of HEX colors, one for each input value.
+    
+    Example
+    -------
+    >>> values_to_colors(np.array([0.0, 0.5, np.nan]), 0, 1, colormap_name = 'viridis')
+    array(['#355f8d', '#21918c', '#ff0000'], dtype=object)
+    """
+    values       = np.asarray(values, dtype = float)
+    colormap_lut = get_colormap_lut(colormap_name, used_palette_part)
     
-    # Get the color from the colormap and convert to HEX
-    color     = colormap(normalized_value)
-    hex_color = rgb2hex(color)
+    # Normalize values between 0 and 1, NaN values and undefined ones (value == min == max)
+    # are colored separately:
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        normalized_values = (values - min_value) / (max_value - min_value)
+    nan_mask = np.isnan(normalized_values)
+    normalized_values[nan_mask] = 0.0
+    normalized_values = np.clip(normalized_values, 0, 1)
     
-    return hex_color
+    hex_colors           = colormap_lut.lookup(normalized_values)
+    hex_colors[nan_mask] = nan_color
+    
+    return hex_colors
+
+# ============================================================================================
+#                           Colormap Lookup Table (LUT) Cache
+# ============================================================================================
+
+class ColormapLUT:
+    """
+    Precomputed HEX colors of a colormap, restricted to the used part of the palette.
+
+    A lookup is one clip plus an integer index into `hex_colors`, and gives exactly the color
+    that `rgb2hex(colormap(value))` would give.
+
+    Attributes
+    ----------
+    colormap_name : str
+        The name of the colormap.
+    resolution : int
+        The number of colors in the full colormap.
+    offset : float
+        Start of the used palette part, in the range [0, 1].
+    scale : float
+        Size of the used palette part, in the range [0.05, 1].
+    first_index : int
+        The colormap index of `hex_colors[0]`.
+    hex_colors : np.ndarray
+        HEX colors (dtype object) reachable within the used palette part.
+    """
+
+    def __init__(   self,
+                    colormap_name    : str,
+                    used_palette_part: float         = 0.4,
+                    resolution       : Optional[int] = None,
+                        ) -> None:
+        """
+        Builds the lookup table.
+
+        Parameters
+        ----------
+        colormap_name : str
+            The name of the colormap to use.
+        used_palette_part : float, optional
+            The part of the palette to use, between 0.05 and 1.0, by default 0.4.
+        resolution : int, optional
+            The number of colors of the colormap, by default None (colormap own resolution).
+        """
+        colormap = _get_colormap(colormap_name)
+        if resolution is not None and resolution != colormap.N:
+            colormap = colormap.resampled(resolution)
+
+        used_palette_part = float(np.clip(used_palette_part, 0.05, 1.0))
+
+        self.colormap_name: str   = colormap_name
+        self.resolution   : int   = colormap.N
+        self.offset       : float = 0.5 * (1.0 - used_palette_part)
+        self.scale        : float = used_palette_part
+
+        self.first_index  : int   = self._to_index(self.offset * self.resolution)
+        last_index        : int   = self._to_index((self.offset + self.scale) * self.resolution)
+
+        # Integer input is indexed directly in the colormap table:
+        rgba            = colormap(np.arange(self.first_index, last_index + 1))
+        self.hex_colors = _rgba_to_hex(rgba)
+
+    # ----------------------------------------------------------------------------------------
+
+    def _to_index(self, position: float) -> int:
+        """Colormap index of a scaled position, with the same truncation as matplotlib."""
+        return self.resolution - 1 if position >= self.resolution else int(position)
+
+    # ----------------------------------------------------------------------------------------
+
+    def lookup_value(self, normalized_value: float) -> str:
+        """
+        Returns the HEX color of a single normalized value in the range [0, 1].
+        """
+        position = (self.offset + normalized_value * self.scale) * self.resolution
+        return self.hex_colors[self._to_index(position) - self.first_index]
+
+    # ----------------------------------------------------------------------------------------
+
+    def lookup(self, normalized_values: np.ndarray) -> np.ndarray:
+        """
+        Returns the HEX colors (dtype object) of an array of normalized values in the range [0, 1].
+        """
+        positions = (self.offset + np.clip(normalized_values, 0, 1) * self.scale) * self.resolution
+        indexes   = np.minimum(positions, self.resolution - 1).astype(np.int64) - self.first_index
+        return self.hex_colors[np.clip(indexes, 0, len(self.hex_colors) - 1)]
+
+# --------------------------------------------------------------------------------------------
+
+def get_colormap_lut(
+                    colormap_name    : str,
+                    used_palette_part: float         = 0.4,
+                    resolution       : Optional[int] = None,
+                        ) -> ColormapLUT:
+    """
+    Returns the cached lookup table for (colormap_name, used_palette_part, resolution),
+    building it on the first request.
+
+    The cache keeps at most `COLORMAP_LUT_CACHE_MAX_SIZE` tables and evicts the least
+    recently used one when it is full.
+
+    Parameters
+    ----------
+    colormap_name : str
+        The name of the colormap to use.
+    used_palette_part : float, optional
+        The part of the palette to use, between 0.05 and 1.0, by default 0.4.
+    resolution : int, optional
+        The number of colors of the colormap, by default None (colormap own resolution).
+
+    Returns
+    -------
+    ColormapLUT
+        The lookup table.
+    """
+    key = (colormap_name, float(np.clip(used_palette_part, 0.05, 1.0)), resolution)
+
+    with _colormap_lut_cache_lock:
+        colormap_lut = _colormap_lut_cache.get(key)
+        if colormap_lut is not None:
+            _colormap_lut_cache.move_to_end(key)
+            _colormap_lut_cache_stats['hits'] += 1
+            return colormap_lut
+
+    colormap_lut = ColormapLUT(colormap_name, used_palette_part, resolution)
+
+    with _colormap_lut_cache_lock:
+        _colormap_lut_cache_stats['misses'] += 1
+        _colormap_lut_cache[key] = colormap_lut
+        while len(_colormap_lut_cache) > COLORMAP_LUT_CACHE_MAX_SIZE:
+            _colormap_lut_cache.popitem(last = False)
+
+    return colormap_lut
+
+# --------------------------------------------------------------------------------------------
+
+def prewarm_colormap_luts(
+                    colormap_names    : list[str]      = COLOR_MAP_NAME_PREWARM_LIST,
+                    used_palette_parts: list[float]    = [0.4, 0.6, 0.8, 1.0],
+                    resolution        : Optional[int]  = None,
+                        ) -> None:
+    """
+    Builds the lookup tables of the common colormaps in advance, e.g. at worker start-up.
+
+    Parameters
+    ----------
+    colormap_names : list[str], optional
+        The colormaps to prepare, by default ['coolwarm', 'viridis'].
+    used_palette_parts : list[float], optional
+        The used palette parts to prepare for each colormap, by default [0.4, 0.6, 0.8, 1.0].
+    resolution : int, optional
+        The number of colors of the colormap, by default None (colormap own resolution).
+
+    Example
+    -------
+    >>> prewarm_colormap_luts(['coolwarm'], [0.6])
+    """
+    for colormap_name in colormap_names:
+        for used_palette_part in used_palette_parts:
+            get_colormap_lut(colormap_name, used_palette_part, resolution)
+
+# --------------------------------------------------------------------------------------------
+
+def clear_colormap_lut_cache() -> None:
+    """
+    Removes all lookup tables from the cache and resets its statistics.
+    """
+    with _colormap_lut_cache_lock:
+        _colormap_lut_cache.clear()
+        _colormap_lut_cache_stats['hits']   = 0
+        _colormap_lut_cache_stats['misses'] = 0
+
+# --------------------------------------------------------------------------------------------
+
+def get_colormap_lut_cache_info() -> dict[str, int]:
+    """
+    Returns the cache statistics: `hits`, `misses`, current `size` and `max_size`.
+    """
+    with _colormap_lut_cache_lock:
+        return {**_colormap_lut_cache_stats,
+                'size'    : len(_colormap_lut_cache),
+                'max_size': COLORMAP_LUT_CACHE_MAX_SIZE, }
+
+# --------------------------------------------------------------------------------------------
+#                                 SUPPORTING FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _get_colormap(colormap_name: str) -> Colormap:
+    """
+    Return the colormap by name, or the default colormap if the name is invalid.
+
+    Parameters
+    ----------
+    colormap_name : str
+        The name of the colormap.
+
+    Returns
+    -------
+    Colormap
+        The matplotlib colormap object.
+    """
+    # Validate colormap name (registry lookup, no list of all colormaps is built)
+    if colormap_name not in matplotlib.colormaps:
+        emergency_colormap = COLOR_MAP_NAME_DEFAULT_LIST[0]
+        print(f"!!! ERROR !!! Invalid colormap name: '{colormap_name}'")
+        print(f"Using default colormap: '{emergency_colormap}'")
+        colormap_name = emergency_colormap
+    
+    return plt.get_cmap(colormap_name)
+
+# --------------------------------------------------------------------------------------------
+
+def _rgba_to_hex(rgba: np.ndarray) -> np.ndarray:
+    """
+    Converts an array of RGBA colors to HEX strings (dtype object), rounding like `rgb2hex`.
+    """
+    rgb_bytes = np.round(rgba[..., :3] * 255).astype(np.int64)
+    rgb_codes = (rgb_bytes[..., 0] << 16) | (rgb_bytes[..., 1] << 8) | rgb_bytes[..., 2]
+    return np.array([f'#{code:06x}' for code in rgb_codes.ravel()], dtype = object).reshape(rgb_codes.shape)
 
 # --------------------------------------------------------------------------------------------
@@ -0,0 +1,340 @@
+# ============================================================================================
+#                   Reporter - Report Batch (many reports in warm worker processes)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Reporter - Report Batch'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# --------------------------------------------------------------------------------------------
+
+# --- TODO : ---------------------------------------------------------------------------------
+# - Stream the results (imap-like) for batches too large to keep all file paths in memory.
+# ============================================================================================
+
+import os
+import sys
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Optional, Union
+
+from .utils.report_settings import Reports_Settings
+from .utils.report_compression import _check_report_compression
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+# Report methods a spec can call, besides the `add_*` methods:
+REPORT_SPEC_METHODS: list[str] = ['update_header_title', 'move_element_to_bottom']
+
+# Jobs sent to a worker at once: enough to amortize the pickling, few enough to balance the load:
+BATCH_MAX_CHUNKSIZE: int = 64
+
+# A job: a picklable callable returning a built `ReportHTML` (module level function or
+# `functools.partial` of one), or a spec dict, see `build_report_from_spec`:
+ReportJob = Union[Callable[[], Any], dict]
+
+# ============================================================================================
+#                                REPORT BATCH CLASS
+# ============================================================================================
+
+class ReportBatch:
+    """
+    Builds and saves many reports in a pool of warm worker processes.
+
+    Every worker is initialized once: matplotlib (Agg backend) and pandas are imported, the
+    report CSS, the header templates and the favicon are loaded into the process caches, and
+    the `Reports_Settings` of the caller are applied. The jobs are then sent in chunks, each
+    worker builds the reports and writes them with collision-safe file names (exclusive
+    create), so the throughput grows with the number of cores.
+
+    The settings are taken when the workers start, the pool is restarted by `generate()` if
+    they changed since. Saved reports are never opened in the browser.
+
+    Attributes
+    ----------
+    max_workers : int, optional
+        Number of worker processes, None for the CPU count, 0 builds the reports in the calling
+        process (serial, e.g. for debugging).
+
+    Methods
+    -------
+    generate(jobs, compression = None, folder_path = None, return_exceptions = False) -> list
+        Builds and saves the reports, returns their file paths in job order.
+    shutdown(wait = True) -> None
+        Stops the workers.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Initializes the batch, the workers are started on the first `generate()`.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of worker processes (default is `None`, the CPU count). 0 is serial.
+
+        Raises
+        ------
+        ValueError
+            If max_workers is negative.
+        """
+        if max_workers is not None and max_workers < 0:
+            raise ValueError(f"Invalid number of batch workers: {max_workers}. Must be >= 0 or None")
+
+        self.max_workers: Optional[int]      = max_workers
+        self._executor  : Optional[Executor] = None
+        self._settings  : Optional[dict]     = None     # the settings the workers were started with
+
+    # --------------------------------------------------------------------------------------------
+
+    def __enter__(self) -> 'ReportBatch':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    # --------------------------------------------------------------------------------------------
+
+    def generate(   self,
+                    jobs             : Iterable[ReportJob],
+                    compression      : Optional[str] = None,
+                    folder_path      : Optional[str] = None,
+                    return_exceptions: bool          = False,
+                        ) -> list:
+        """
+        Builds and saves the reports.
+
+        Parameters
+        ----------
+        jobs : Iterable[ReportJob]
+            Callables returning a built `ReportHTML` (picklable: module level functions or
+            `functools.partial` of them), or spec dicts (see `build_report_from_spec`).
+        compression : str, optional
+            None (the report default), 'gzip' or 'self_extracting', see `ReportHTML.save_to_file()`.
+        folder_path : str, optional
+            The folder of the reports (default is `None`, `Reports_Settings.get_folder_path()`).
+        return_exceptions : bool, optional
+            If True, a failed job gives its exception in the results instead of raising it
+            (default is `False`).
+
+        Returns
+        -------
+        list
+            The file paths of the saved reports (or the exceptions), in job order.
+
+        Example
+        -------
+        >>> def build_entity_report(entity_id: int) -> ReportHTML:
+        ...     report = ReportHTML(title = f'Entity {entity_id}')
+        ...     report.add_text(f'Entity {entity_id} is OK.')
+        ...     return report
+        >>> with ReportBatch(max_workers = 8) as batch:
+        ...     paths = batch.generate([partial(build_entity_report, i) for i in range(20_000)])
+        """
+        _check_report_compression(compression)
+
+        jobs        = list(jobs)
+        folder_path = folder_path or Reports_Settings.get_folder_path()
+        os.makedirs(folder_path, exist_ok = True)
+
+        run_job = partial(_run_report_job,
+                          compression       = compression,
+                          folder_path       = folder_path,
+                          return_exceptions = return_exceptions)
+
+        if self.max_workers == 0:
+            return [run_job(job) for job in jobs]
+
+        executor  = self._get_executor(_get_settings_snapshot())
+        workers   = self.max_workers or os.cpu_count() or 1
+        chunksize = max(1, min(BATCH_MAX_CHUNKSIZE, len(jobs) // (4 * workers)))
+
+        return list(executor.map(run_job, jobs, chunksize = chunksize))
+
+    # --------------------------------------------------------------------------------------------
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the workers. The batch can be used again, new workers are started on demand.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait = wait)
+            self._executor = None
+
+    # --------------------------------------------------------------------------------------------
+
+    def _get_executor(self, settings: dict) -> Executor:
+        """
+        Returns the pool, (re)starting it if the settings changed since the workers started.
+        """
+        if self._executor is not None and settings != self._settings:
+            self.shutdown()
+
+        if self._executor is None:
+            self._settings = settings
+            self._executor = ProcessPoolExecutor(max_workers = self.max_workers,
+                                                 initializer = _init_report_batch_worker,
+                                                 initargs    = (settings,))
+        return self._executor
+
+# --------------------------------------------------------------------------------------------
+#                                  BATCH FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def generate_reports(   jobs             : Iterable[ReportJob],
+                        max_workers      : Optional[int] = None,
+                        compression      : Optional[str] = None,
+                        folder_path      : Optional[str] = None,
+                        return_exceptions: bool          = False,
+                            ) -> list:
+    """
+    Builds and saves the reports in a `ReportBatch` of warm worker processes, stopped when done.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of worker processes (default is `None`, the CPU count). 0 is serial.
+    See `ReportBatch.generate()` for the other parameters.
+
+    Returns
+    -------
+    list
+        The file paths of the saved reports (or the exceptions), in job order.
+
+    Example
+    -------
+    >>> paths = generate_reports([{'title': f'Entity {i}', 'elements': [('add_text', (f'Entity {i}',))]}
+    ...                           for i in range(1000)])
+    """
+    with ReportBatch(max_workers) as batch:
+        return batch.generate(jobs, compression, folder_path, return_exceptions)
+
+# --------------------------------------------------------------------------------------------
+
+def build_report_from_spec(spec: dict):
+    """
+    Builds a report from a spec dict.
+
+    The keys `title`, `sub_title`, `file_name`, `use_title_background` are the `ReportHTML`
+    arguments, `elements` lists the method calls as `(method_name, args, kwargs)` tuples
+    (args and kwargs optional). The methods are the `add_*` methods and `REPORT_SPEC_METHODS`.
+
+    Parameters
+    ----------
+    spec : dict
+        The report spec.
+
+    Returns
+    -------
+    ReportHTML
+        The built (not saved) report.
+
+    Raises
+    ------
+    ValueError
+        If a method can not be called from a spec.
+
+    Example
+    -------
+    >>> report = build_report_from_spec({'title'   : 'Entity 1',
+    ...                                  'elements': [('add_title', ('Summary',)),
+    ...                                               ('add_param_value_table', ({'Rows': 10},)),
+    ...                                               ('add_dataframe_table', (df,), {'round': 2})]})
+    """
+    from .report_generator import ReportHTML
+
+    report = ReportHTML(title                = spec.get('title'),
+                        sub_title            = spec.get('sub_title'),
+                        file_name            = spec.get('file_name'),
+                        use_title_background = spec.get('use_title_background', True), )
+
+    for call in spec.get('elements', []):
+        method_name = call[0]
+        args        = call[1] if len(call) > 1 else ()
+        kwargs      = call[2] if len(call) > 2 else {}
+
+        if not (method_name.startswith('add_') or method_name in REPORT_SPEC_METHODS) or not hasattr(report, method_name):
+            raise ValueError(f"Invalid report spec method: '{method_name}'. "
+                             f"Supported methods: add_* and {REPORT_SPEC_METHODS}")
+
+        getattr(report, method_name)(*args, **kwargs)
+
+    return report
+
+# --------------------------------------------------------------------------------------------
+#                               WORKER PROCESS FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _init_report_batch_worker(settings: dict) -> None:
+    """
+    Worker process initializer: applies the caller settings, imports matplotlib (Agg) and pandas,
+    and loads the CSS, header templates and favicon into the process caches.
+    """
+    for name, value in settings.items():
+        setattr(Reports_Settings, name, value)
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot    # noqa: F401
+    import pandas               # noqa: F401
+
+    from .elements import get_header_title
+    from .elements.report_style import get_css_content
+    from .report_favicon import _get_base64_favicon
+
+    get_css_content()
+    get_header_title('', '', use_background_image = True)
+    get_header_title('', '', use_background_image = False)
+    _get_base64_favicon()
+
+# --------------------------------------------------------------------------------------------
+
+def _run_report_job(job              : ReportJob,
+                    compression      : Optional[str],
+                    folder_path      : str,
+                    return_exceptions: bool,
+                        ) -> Any:
+    """
+    Builds the report of the job and saves it to the folder, returns the file path (or the
+    exception, with return_exceptions). The figures left open by the job are closed.
+    """
+    try:
+        report = build_report_from_spec(job) if isinstance(job, dict) else job()
+
+        report.folder_path              = folder_path
+        report._use_default_folder_path = False
+        report.use_open_saved_file      = False
+        report.save_to_file(compression)
+
+        return report._file_path
+
+    except Exception as error:
+        if return_exceptions:
+            return error
+        raise
+
+    finally:
+        if 'matplotlib.pyplot' in sys.modules:
+            sys.modules['matplotlib.pyplot'].close('all')
+
+# --------------------------------------------------------------------------------------------
+#                                  SUPPORTING FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _get_settings_snapshot() -> dict:
+    """
+    Returns the `Reports_Settings` values (class attributes, not methods) for the workers.
+    Parallel chart rendering is disabled in the workers, they are the parallelism.
+    """
+    settings = {name: value for name, value in vars(Reports_Settings).items()
+                if not name.startswith('__') and not isinstance(value, (staticmethod, classmethod, property))}
+
+    settings['chart_render_workers'] = 0
+    settings['use_open_saved_file']  = False
+    return settings
+
+# ============================================================================================
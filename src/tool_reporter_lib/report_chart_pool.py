@@ -0,0 +1,209 @@
+# ============================================================================================
+#                   Reporter - Chart Render Pool (parallel chart rasterization)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Reporter - Chart Render Pool'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+#                     : Added submit_image() for the chart formats (PNG, JPEG, WebP, SVG, auto)
+#                     : submit_image(as_bytes = True) returns the image bytes (image deduplication)
+#                     : 'thread': renders of the same figure are serialized (a figure submitted several
+#                     : times was drawn concurrently, giving corrupted images)
+#                     : The executor type defaults to 'process' ('thread' gives little speedup)
+#                     : Removed the 'thread' executor: concurrent savefig calls share the global
+#                     : rcParams / pyplot state, the output was not identical to the serial path
+# --------------------------------------------------------------------------------------------
+
+# --- TODO : ---------------------------------------------------------------------------------
+# - Share one pool between several reports built in the same process.
+# ============================================================================================
+
+import pickle
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Optional
+
+from .elements.report_element_chart import get_chart_base64, get_chart_image, get_chart_image_bytes
+
+# ============================================================================================
+#                                CHART RENDER POOL CLASS
+# ============================================================================================
+
+class ChartRenderPool:
+    """
+    Renders charts to base64 PNG (or to the other chart formats) in a pool of worker processes.
+
+    `submit()` returns immediately with a `Future`, the caller joins the futures in document
+    order, so the report is identical to the serial `get_chart_element` path.
+
+    The figure is pickled at submit time (a snapshot) and rendered in a worker process with the
+    Agg backend, so it can be changed or reused right away. There is no thread mode: `savefig`
+    reads the process-global rcParams and pyplot state, concurrent renders in threads do not give
+    the serial output (and little speedup, the Agg rasterization mostly holds the GIL).
+
+    Attributes
+    ----------
+    max_workers : int, optional
+        Number of workers, None means the executor default (CPU count based).
+
+    Methods
+    -------
+    submit(chart_plt, use_transparent_plots = True) -> Future[str]
+        Schedules the chart rasterization and base64 encoding.
+    submit_image(chart_plt, use_transparent_plots = True, chart_format = 'png', as_bytes = False, **format_options) -> Future[tuple]
+        Schedules the chart rendering in a chart format, see `get_chart_image`.
+    shutdown(wait = True) -> None
+        Stops the workers.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Initializes the pool, the workers are started on the first `submit()`.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of workers (default is `None`, executor default).
+        """
+        self.max_workers: Optional[int]      = max_workers
+        self._executor  : Optional[Executor] = None
+
+    # --------------------------------------------------------------------------------------------
+
+    def submit( self,
+                chart_plt,
+                use_transparent_plots: bool = True,
+                    ) -> Future:
+        """
+        Schedules the chart rasterization and base64 encoding.
+
+        Parameters
+        ----------
+        chart_plt : matplotlib.pyplot or matplotlib.figure.Figure
+            The chart to render. For `matplotlib.pyplot` the current figure is used.
+        use_transparent_plots : bool, optional
+            If True, the background of the plot will be transparent (default is `True`).
+
+        Returns
+        -------
+        Future[str]
+            Future of the PNG image encoded in base64.
+        """
+        # The current figure has to be taken now, not when the worker runs:
+        figure = chart_plt.gcf() if hasattr(chart_plt, 'gcf') else chart_plt
+
+        return self._get_executor().submit(_render_pickled_chart_base64,
+                                           pickle.dumps(figure),
+                                           use_transparent_plots)
+
+    # --------------------------------------------------------------------------------------------
+
+    def submit_image(   self,
+                        chart_plt,
+                        use_transparent_plots: bool = True,
+                        chart_format         : str  = 'png',
+                        as_bytes             : bool = False,
+                        **format_options,
+                            ) -> Future:
+        """
+        Schedules the chart rendering in a chart format.
+
+        Parameters
+        ----------
+        chart_plt : matplotlib.pyplot or matplotlib.figure.Figure
+            The chart to render. For `matplotlib.pyplot` the current figure is used.
+        use_transparent_plots : bool, optional
+            If True, the background of the plot will be transparent (default is `True`).
+        chart_format : str, optional
+            'png', 'jpeg', 'webp', 'svg' or 'auto' (default is `'png'`).
+        as_bytes : bool, optional
+            If True, the image is returned as bytes, see `get_chart_image_bytes` (default is `False`).
+        **format_options
+            Encoding options, see `get_chart_image`.
+
+        Returns
+        -------
+        Future[tuple[str, str]] or Future[tuple[str, bytes]]
+            Future of the image format and the image (base64, or the svg markup), or its bytes.
+        """
+        figure = chart_plt.gcf() if hasattr(chart_plt, 'gcf') else chart_plt
+
+        return self._get_executor().submit(_render_pickled_chart_image,
+                                           pickle.dumps(figure),
+                                           use_transparent_plots,
+                                           chart_format,
+                                           format_options,
+                                           as_bytes)
+
+    # --------------------------------------------------------------------------------------------
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the workers. The pool can be used again, new workers are started on demand.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait = wait)
+            self._executor = None
+
+    # --------------------------------------------------------------------------------------------
+
+    def _get_executor(self) -> Executor:
+        """
+        Returns the executor, creating it on the first use.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers = self.max_workers,
+                                                 initializer = _init_chart_render_worker)
+        return self._executor
+
+# --------------------------------------------------------------------------------------------
+#                               WORKER PROCESS FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _init_chart_render_worker() -> None:
+    """
+    Worker process initializer: non-interactive backend, so unpickled figures never open windows.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+
+# --------------------------------------------------------------------------------------------
+
+def _render_pickled_chart_base64(figure_pickle: bytes, use_transparent_plots: bool) -> str:
+    """
+    Unpickles the figure snapshot, renders it to base64 PNG and releases it.
+    """
+    import matplotlib.pyplot as plt
+
+    figure = pickle.loads(figure_pickle)
+    try:
+        return get_chart_base64(figure, use_transparent_plots)
+    finally:
+        plt.close(figure)
+
+# --------------------------------------------------------------------------------------------
+
+def _render_pickled_chart_image(figure_pickle        : bytes, 
+                                use_transparent_plots: bool, 
+                                chart_format         : str, 
+                                format_options       : dict,
+                                as_bytes             : bool = False,
+                                    ) -> tuple:
+    """
+    Unpickles the figure snapshot, renders it in the chart format and releases it.
+    """
+    import matplotlib.pyplot as plt
+
+    render_image = get_chart_image_bytes if as_bytes else get_chart_image
+
+    figure = pickle.loads(figure_pickle)
+    try:
+        return render_image(figure, use_transparent_plots, chart_format, **format_options)
+    finally:
+        plt.close(figure)
+
+# ============================================================================================
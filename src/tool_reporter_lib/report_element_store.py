@@ -0,0 +1,196 @@
+# ============================================================================================
+#                   Reporter - Element Spill Store (rendered bodies spilled to disk)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Reporter - Element Spill Store'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+#                     : read() raises ValueError once the store is closed
+# --------------------------------------------------------------------------------------------
+
+# --- TODO : ---------------------------------------------------------------------------------
+# - Spill the image asset table (deduplicated charts) too.
+# ============================================================================================
+
+import tempfile
+import threading
+
+from typing import IO, Optional
+
+from .elements.report_element import ReportElement, ReportElementTypes
+
+# ============================================================================================
+#                                SPILLED ELEMENT CLASS
+# ============================================================================================
+
+class SpilledReportElement(ReportElement):
+    """
+    A rendered element whose body was moved to the segment file of an `ElementSpillStore`: only
+    the type, the style, and the offset and length of the body stay in memory.
+
+    The body is read back from the file on every access (not kept), so streaming the report
+    reads the bodies sequentially with one body in memory at a time. Setting the body keeps the
+    new body in memory.
+    """
+
+    __slots__ = ('_store', '_offset', '_length')
+
+    def __init__(   self,
+                    store        : 'ElementSpillStore',
+                    offset       : int,
+                    length       : int,
+                    element_type : ReportElementTypes,
+                    style_content: str,
+                        ) -> None:
+        super().__init__()
+        self.type          : ReportElementTypes            = element_type
+        self._style_content: str                           = style_content
+        self._store        : Optional['ElementSpillStore'] = store
+        self._offset       : int                           = offset
+        self._length       : int                           = length
+
+    @property
+    def body_content(self) -> str:
+        """
+        The body content of the element, read from the segment file.
+        """
+        if self._store is None:
+            return self._body_content
+        return self._store.read(self._offset, self._length)
+
+    @body_content.setter
+    def body_content(self, value: str) -> None:
+        self._store        = None
+        self._body_content = value
+
+# ============================================================================================
+#                                ELEMENT SPILL STORE CLASS
+# ============================================================================================
+
+class ElementSpillStore:
+    """
+    Keeps the rendered element bodies of a report within a memory budget by appending them to
+    an anonymous temporary segment file (deleted when the store is closed or garbage collected).
+
+    The report tracks every added element with `add()`. Once the bodies added since the last
+    spill exceed the budget, all rendered elements of the list are replaced by
+    `SpilledReportElement`s, so the memory stays flat however long the report grows.
+    Deferred elements, chart placeholders and empty bodies stay in memory.
+
+    Attributes
+    ----------
+    memory_budget : int
+        Characters of element bodies kept in memory before spilling.
+    spill_dir : str, optional
+        Folder of the segment file, None for the system temporary folder.
+    spilled_size : int
+        Bytes written to the segment file.
+
+    Methods
+    -------
+    add(element, elements_list) -> None
+        Counts the element body, spills the list when the budget is exceeded.
+    spill_elements(elements_list) -> None
+        Spills all rendered elements of the list now.
+    read(offset, length) -> str
+        Reads a body back from the segment file.
+    close() -> None
+        Closes (deletes) the segment file, the spilled elements can not be read anymore.
+    """
+
+    def __init__(self, memory_budget: int, spill_dir: Optional[str] = None) -> None:
+        """
+        Initializes the store, the segment file is created on the first spill.
+
+        Raises
+        ------
+        ValueError
+            If the memory budget is negative.
+        """
+        if memory_budget < 0:
+            raise ValueError(f"Invalid element memory budget: {memory_budget}. Must be >= 0")
+
+        self.memory_budget: int            = memory_budget
+        self.spill_dir    : Optional[str]  = spill_dir
+        self.spilled_size : int            = 0
+        self._memory_size : int            = 0      # body characters added since the last spill
+        self._file        : Optional[IO]   = None
+        self._lock        : threading.Lock = threading.Lock()
+
+    # --------------------------------------------------------------------------------------------
+
+    def add(self, element: ReportElement, elements_list: list[ReportElement]) -> None:
+        """
+        Counts the body of the added element (deferred elements count when they are spilled
+        rendered), and spills the elements of the list if the memory budget is exceeded.
+        """
+        if element.is_rendered:
+            self._memory_size += len(element.get_body_str())
+
+        if self._memory_size > self.memory_budget:
+            self.spill_elements(elements_list)
+
+    # --------------------------------------------------------------------------------------------
+
+    def spill_elements(self, elements_list: list[ReportElement]) -> None:
+        """
+        Replaces every rendered, not yet spilled element with a non-empty body in the list by a
+        `SpilledReportElement`, the bodies are appended to the segment file in list order.
+        """
+        for i, element in enumerate(elements_list):
+            if type(element) is ReportElement and element.is_rendered and element.get_body_str():
+                elements_list[i] = self._spill(element)
+
+        self._memory_size = 0
+
+    # --------------------------------------------------------------------------------------------
+
+    def read(self, offset: int, length: int) -> str:
+        """
+        Reads a spilled body (`length` bytes at `offset`) from the segment file.
+
+        Raises
+        ------
+        ValueError
+            If the store is closed (the report was saved).
+        """
+        with self._lock:
+            if self._file is None:
+                raise ValueError("The element spill store is closed, the spilled element bodies were released")
+            self._file.seek(offset)
+            return self._file.read(length).decode('utf-8')
+
+    # --------------------------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        Closes the segment file, which deletes it.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # --------------------------------------------------------------------------------------------
+
+    def _spill(self, element: ReportElement) -> SpilledReportElement:
+        """
+        Appends the element body to the segment file and returns its spilled element.
+        """
+        data = element.get_body_str().encode('utf-8')
+
+        with self._lock:
+            if self._file is None:
+                self._file = tempfile.TemporaryFile(mode = 'w+b', prefix = 'report_elements_', dir = self.spill_dir)
+            offset = self.spilled_size
+            self._file.seek(offset)
+            self._file.write(data)
+            self.spilled_size += len(data)
+
+        return SpilledReportElement(self, offset, len(data), element.type, element.get_style_str())
+
+# ============================================================================================
@@ -7,22 +7,25 @@ The favicon can be read from an external file or, if the file is not found, a sm
 
 Version History:
 - v0.0.2 @ 2024-08-13 : Initial Release
+- v0.1.0 @ 2026-10-16 : Memoized favicon, custom favicon from PNG bytes or file.
 
 Modules:
 --------
-- fav_icon : Contains the function `_get_base64_favicon()` that retrieves the base64-encoded favicon.
+- fav_icon : Contains the function `_get_base64_favicon()` that retrieves the base64-encoded favicon,
+             `set_custom_favicon()` and `reset_favicon()`.
 
 """
 
 # ============================================================================================
 # Meta Information
-__version__:      str = '0.0.2'
-__version_date__: str = '2024-08-13'
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_:           str = 'report favicon'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
 # --- VERSION HISTORY: -----------------------------------------------------------------------
 # v0.0.2 @ 2024-08-13 : Initial Release
+# v0.1.0 @ 2026-10-16 : Memoized favicon, added set_custom_favicon() and reset_favicon().
 # ============================================================================================
 
 # --- TODO: ----------------------------------------------------------------------------------
@@ -30,6 +33,6 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 # ============================================================================================
 
 # Import the function to retrieve the base64 favicon.
-from .fav_icon import _get_base64_favicon
+from .fav_icon import _get_base64_favicon, set_custom_favicon, reset_favicon
 
 # ============================================================================================
\ No newline at end of file
@@ -1,14 +1,19 @@
+import base64
 import os
 
+from typing import Optional, Union
+
 # ============================================================================================
 
-__version__:      str = "0.0.2"
-__version_date__: str = "2024-08-13"
+__version__:      str = "0.1.0"
+__version_date__: str = "2026-10-16"
 _name_:           str = "report favicon"
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
 # --- VERSION HISTORY: --------------------------------------------------------------
 # v0.0.2 @ 2024-08-13 : Initial Release
+# v0.1.0 @ 2026-10-16 : Favicon is loaded once per process and memoized.
+#                     : Added set_custom_favicon() and reset_favicon().
 
 # --- CONSTANTS: --------------------------------------------------------------------
 # The file is assumed to be in the same folder as this Python file.
@@ -18,18 +23,75 @@ FALLBACK_FAVICON_BASE64 = (
     'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/wcA'
     'AwAB/By8kUAAAAAASUVORK5CYII=')  
 
+FAVICON_BASE64_PREFIX   = 'data:image/png;base64,'
+
+# --- MEMOIZED FAVICON (process wide): -------------------------------------------------------
+_favicon_base64: Optional[str] = None
+
 # ============================================================================================
 
 def _get_base64_favicon() -> str:
     """
-    Loads the base64 favicon string from the external file located in the same folder as this Python file.
-    If the file is not found, returns the fallback base64 favicon string (1x1 transparent PNG).
+    Returns the base64 favicon string: the custom favicon if one was set with `set_custom_favicon()`,
+    otherwise the default favicon, loaded from the external file on the first call and memoized.
 
     Returns
     -------
     str
         The base64-encoded favicon string or fallback favicon string (1x1 transparent PNG).
     """
+    global _favicon_base64
+
+    if _favicon_base64 is None:
+        _favicon_base64 = _load_base64_favicon()
+
+    return _favicon_base64
+
+# --------------------------------------------------------------------------------------------
+
+def set_custom_favicon(favicon: Union[bytes, str]) -> None:
+    """
+    Sets a custom favicon for all reports of the process. The image is encoded once and reused.
+
+    Parameters
+    ----------
+    favicon : bytes or str
+        The PNG image content (bytes), or the path to a PNG file (str).
+
+    Raises
+    ------
+    FileNotFoundError
+        If the PNG file cannot be found.
+    ValueError
+        If the image is not a PNG image.
+    """
+    global _favicon_base64
+
+    if isinstance(favicon, str):
+        with open(favicon, 'rb') as file:
+            favicon = file.read()
+
+    if not favicon.startswith(b'\x89PNG\r\n\x1a\n'):
+        raise ValueError('The custom favicon must be a PNG image.')
+
+    _favicon_base64 = FAVICON_BASE64_PREFIX + base64.b64encode(favicon).decode('ascii')
+
+# --------------------------------------------------------------------------------------------
+
+def reset_favicon() -> None:
+    """
+    Removes the custom favicon and the memoized default favicon, it is loaded again on the next use.
+    """
+    global _favicon_base64
+    _favicon_base64 = None
+
+# --------------------------------------------------------------------------------------------
+
+def _load_base64_favicon() -> str:
+    """
+    Loads the base64 favicon string from the external file located in the same folder as this Python file.
+    If the file is not found, returns the fallback base64 favicon string (1x1 transparent PNG).
+    """
     try:
         with open(FAVICON_BASE64_PATH, 'r') as file:
             favicon_base64 = file.read().strip()
@@ -2,8 +2,8 @@
 #                   Reporter - ReportHTML Class for generating HTML reports
 # ============================================================================================
 
-__version__:      str = '0.0.9'
-__version_date__: str = '2024-10-20'
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_:           str = 'Report HTML Generator'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
@@ -12,6 +12,35 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 # v0.0.4 @ 2024-08-20 : Improved Annotations and Documentation
 # v0.0.6 @ 2024-08-21 : Refactored Code, Updated Elements and Settings
 # v0.0.9 @ 2024-10-20 : Enhanced Documentation, Added Code Improvements
+# v0.1.0 @ 2026-10-16 : Added streaming HTML writer, the report is written to file chunk by chunk
+#                     : Added opt-in parallel chart rendering (ChartRenderPool)
+#                     : Added deferred (lazy) element rendering, the header is always deferred
+#                     : save_to_file claims the file name atomically (claim_unique_file_name)
+#                     : Lazy imports: matplotlib, pandas and webbrowser are not loaded with the package,
+#                     : the default report path (keyring) is looked up on the first save
+#                     : Added opt-in profiling (ReportProfiler): element build times, sizes, save phases
+#                     : add_dataframe_table uses the Reports_Settings.df_table_engine renderer
+#                     : Added add_dataframe_table_virtual (virtual scrolling table for large DataFrames)
+#                     : add_dataframe_table applies the Reports_Settings DataFrame table size policy
+#                     : add_chart / add_plot: chart_format (PNG, JPEG, WebP, SVG, auto), Reports_Settings defaults
+#                     : Added opt-in image deduplication (ImageAssetTable): repeated charts are stored once
+#                     : save(compression): gzip (.html.gz) or self-extracting html, compressed while streaming
+#                     : Code blocks are highlighted offline (Reports_Settings), the highlight.js CDN tags
+#                     : are added only to reports with code blocks and offline highlighting disabled
+#                     : Tree shaking (Reports_Settings): only the CSS rule groups and scripts of the element
+#                     : types in the report are emitted
+#                     : Added save_async, add_chart_async, add_dataframe_table_async (asyncio, cancellable)
+#                     : Element memory budget (Reports_Settings): rendered element bodies are spilled to a
+#                     : temporary file (ElementSpillStore) and streamed back on save
+#                     : Added live mode (flush_live): new elements are appended to segment files, the
+#                     : report file is rewritten around them and swapped in atomically (LiveReportFile)
+#                     : save(minify): the streamed html is minified in one pass (MinifyingStream), the
+#                     : pre / code / script / textarea and white-space: pre content is kept
+#                     : Async tables are joined on save (also a sync one), save_async completes the
+#                     : elements list in the event loop thread and writes a snapshot of it
+#                     : The element store is closed (temporary file released) when the report is discarded
+#                     : The claimed report file is removed if the save fails (not only when cancelled)
+#                     : Deferred elements are built one at a time by the save and not kept rendered
 # --------------------------------------------------------------------------------------------
 
 # --- TODO : ---------------------------------------------------------------------------------
@@ -20,20 +49,39 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 #                  but call it directely from library to get the plot.
 # --------------------------------------------------------------------------------------------
 
+import asyncio
+import itertools
 import os
-import webbrowser
-import matplotlib.pyplot as plt
-import pandas as pd
+import threading
+import weakref
 
-from typing import Optional
+from contextlib import nullcontext
+from concurrent.futures import Executor, Future
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, TextIO
+
+# matplotlib and pandas are imported by the chart and table elements on first use:
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    import pandas as pd
 
 from .utils.report_settings import Reports_Settings
-from .utils.report_utils import sanitize_filename, update_filename, get_current_datetime
+from .utils.report_utils import sanitize_filename, claim_unique_file_name, get_current_datetime
+from .utils.report_profiler import ReportProfiler
+from .utils.report_compression import open_report_stream, get_report_file_format, _check_report_compression
+from .utils.report_async import run_cancellable, run_into_future, CancellableStream
+from .utils.report_minify import MinifyingStream
 from .report_favicon import _get_base64_favicon
+from .report_chart_pool import ChartRenderPool
+from .report_image_assets import ImageAssetTable
+from .report_element_store import ElementSpillStore
+from .report_live import LiveReportFile
 from .elements import (
     ReportElement,     
+    ReportElementTypes,
     get_alert_box_element, 
     get_chart_element,
+    get_chart_element_from_base64,
+    get_chart_image_bytes,
     get_code_element,
     get_footer_element,
     get_header_title,
@@ -45,14 +93,22 @@ from .elements import (
     get_space_element,
     get_style_element,
     get_table_dataframe_element,
+    get_table_dataframe_virtual_element,
     get_text_element,
     get_text_console_element,
     get_title_element,      )
+from .elements.report_element_table_df_virtual import VIRTUAL_TABLE_SCRIPT, VIRTUAL_TABLE_STYLE
+from .elements.report_element_chart import CHART_FORMATS
+from .elements.report_code_highlight import CODE_HIGHLIGHT_STYLE
+from .elements.report_style import get_css_content
     
 # --- CONSTANTS: -----------------------------------------------------------------------------
 
 _DEFAULT_REPORT_TITLE: str = 'Report'
 
+# Elements added by `_initialize()`: the style and the header title:
+_REPORT_HEAD_ELEMENTS: int = 2
+
 # --- JAVASCRIPT FUNCTIONS: ------------------------------------------------------------------
 
 _TOGGLE_CONTENT_SCRIPT: str = """
@@ -68,6 +124,12 @@ function toggleContent(regionId, btn, regionName) {
 }
 """
 
+# Scripts used by the element types, each emitted once at the end of the body (tree shaking):
+_ELEMENT_SCRIPTS: dict[ReportElementTypes, tuple[str, ...]] = {
+    ReportElementTypes.SHOWHIDE_REGION_OPEN: (_TOGGLE_CONTENT_SCRIPT,),
+    ReportElementTypes.DFTABLE_VIRTUAL     : (VIRTUAL_TABLE_SCRIPT,),
+}
+
 # --- HTML ELEMENTS: -------------------------------------------------------------------------
 
 _HIGHLIGHT_JS_CDN: str = '''
@@ -109,6 +171,10 @@ class ReportHTML():
         Whether to automatically open the saved HTML file after saving.
     use_title_background : bool
         Whether to use background image in the report title.
+    use_lazy_elements : bool
+        Whether to defer rendering of the added elements until the report is saved.
+    chart_render_workers : int
+        Number of workers rendering charts in parallel, `0` renders charts immediately.
 
     Methods
     -------
@@ -116,6 +182,10 @@ class ReportHTML():
         Saves the report to an HTML file. Updates the filename if it already exists.
     save_to_file():
         Saves the report to an HTML file. Updates the filename if it already exists.
+    save_async(compression = None, executor = None, minify = None):
+        Saves the report without blocking the asyncio event loop (coroutine, cancellable).
+    flush_live(min_interval = 0.0, refresh_seconds = None):
+        Writes the report as it is now to one live file (incremental, atomic replace).
     update_header_title(title = 'My Title', subtitle = 'My Sub Title', use_title_background = True):
         Updates the report's header title and subtitle.    
     add_horizontal_line():
@@ -128,14 +198,20 @@ class ReportHTML():
         Adds a text element to the report. Suppoer Multi-line text.
     add_text_console(text = 'My Console Text'):
         Adds text to the report in console style.
-    add_chart(chart_plt, use_fullwidth = False, height = None, width = None):
+    add_chart(chart_plt, use_fullwidth = False, height = None, width = None, chart_format = None):
         Adds a chart to the report.
-    add_plot(plot_plt, use_fullwidth = False, height = None, width = None):
+    add_plot(plot_plt, use_fullwidth = False, height = None, width = None, chart_format = None):
         Adds a plot to the report.
+    add_chart_async(chart_plt, use_fullwidth = False, height = None, width = None, chart_format = None):
+        Adds a chart to the report, rendered in the chart render pool (coroutine).
     add_dataframe_table(df, highlight_columns = [], round = -1, color_map_name = 'viridis', used_part_of_color = 0.8):
         Adds a dataframe table to the report.
     add_df_table(df, highlight_columns = [], round = -1):
         Adds a dataframe table to the report.
+    add_dataframe_table_async(df, highlight_columns = [], round = -1, ..., executor = None):
+        Adds a dataframe table to the report, rendered in an executor (coroutine).
+    add_dataframe_table_virtual(df, highlight_columns = [], round = -1, visible_rows = 25):
+        Adds a large dataframe table with virtual scrolling to the report.
     add_param_value_table(pv_data, title = '', use_big_table = False):
         Adds a parameter-value table to the report.
     add_param_value_table_big(pv_data, title = '', use_big_table = True):
@@ -213,6 +289,10 @@ class ReportHTML():
         if Reports_Settings.custom_folder_path is not None:
             self.folder_path = Reports_Settings.custom_folder_path
 
+        # Default folder path, not yet activated from the keyring (done on save):
+        self._use_default_folder_path: bool = (Reports_Settings.custom_folder_path is None 
+                                               and not Reports_Settings._default_report_path_activated)
+
         self.report_file_name     : str  = file_name or title or Reports_Settings._report_file_name
         self.file_format          : str  = Reports_Settings._file_format
 
@@ -225,10 +305,42 @@ class ReportHTML():
 
         self.use_open_saved_file  : bool = open_saved_file if open_saved_file is not None else Reports_Settings.use_open_saved_file
         self.use_title_background : bool = use_title_background
+        self.use_lazy_elements    : bool = Reports_Settings.use_lazy_elements
+        self.report_compression   : Optional[str] = Reports_Settings.report_compression
+        self.use_minify_html      : bool = Reports_Settings.use_minify_html
+        self.use_offline_code_highlighting: bool  = Reports_Settings.use_offline_code_highlighting
+        self.use_tree_shaking     : bool = Reports_Settings.use_tree_shaking
 
         self.elements_list        : list[ReportElement] = []
         self.bottom_elements_list : list[ReportElement] = []
 
+        # Parallel chart rendering, pending charts are joined in document order on save:
+        self.chart_render_workers : int                       = Reports_Settings.chart_render_workers
+        self._chart_render_pool   : Optional[ChartRenderPool] = None
+        self._pending_charts      : list[tuple[ReportElement, Future, dict]] = []
+
+        # DataFrame tables rendered in worker threads (`add_dataframe_table_async`), joined on save:
+        self._pending_tables      : list[tuple[ReportElement, Future]] = []
+
+        # Image deduplication, the chart images are stored once per unique content:
+        self.use_image_dedup      : bool            = Reports_Settings.use_image_dedup
+        self._image_assets        : ImageAssetTable = ImageAssetTable()
+
+        # Element bodies over the memory budget are spilled to a temporary file (None = all in memory):
+        self._element_store       : Optional[ElementSpillStore] = None
+        if Reports_Settings.element_memory_budget is not None:
+            self._element_store = ElementSpillStore(Reports_Settings.element_memory_budget, 
+                                                    Reports_Settings.element_spill_dir)
+            # the spilled bodies are read by every save, the file is closed when the report is discarded:
+            weakref.finalize(self, self._element_store.close)
+
+        # Live mode (None until the first `flush_live()`), the file opened in the browser:
+        self._live_file           : Optional[LiveReportFile] = None
+        self._opened_file_path    : Optional[str]            = None
+
+        # Profiling (None = disabled, no timing code runs):
+        self._profiler            : Optional[ReportProfiler] = ReportProfiler() if Reports_Settings.use_profiling else None
+
         self._initialize()
 
     # --------------------------------------------------------------------------------------------
@@ -278,21 +390,300 @@ class ReportHTML():
         Initializes the report by adding default elements like style and header title.
         """
         self.elements_list = []
-        self.elements_list.append(get_style_element())
-
-        element_header_title = get_header_title(
-                                title                = self.title,
-                                subtitle             = self.sub_title,
-                                use_background_image = self.use_title_background, )
+        self.elements_list.append(self._timed(ReportElementTypes.STYLE, get_style_element)())
+
+        # The header is deferred: `save()` replaces it once more with the file name subtitle.
+        element_header_title = ReportElement.deferred(  ReportElementTypes.HEAD_TITLE_ON_BACKGROUND,
+                                                        self._timed(ReportElementTypes.HEAD_TITLE_ON_BACKGROUND, get_header_title),
+                                                        title                = self.title,
+                                                        subtitle             = self.sub_title,
+                                                        use_background_image = self.use_title_background, )
         
         self.elements_list.append(element_header_title)
 
     # --------------------------------------------------------------------------------------------
     
-    def save_to_file(self)-> None:
+    def save_to_file(self, compression: Optional[str] = None, minify: Optional[bool] = None)-> None:
         """
         Saves the report to an HTML file. Updates the filename if it already exists.
+
+        The file name is claimed atomically (exclusive create), so reports saved in parallel
+        to the same folder never overwrite each other.
+
+        Parameters
+        ----------
+        compression : str, optional
+            None     - the report `report_compression` (`Reports_Settings.report_compression`,
+                       default plain html).
+            'gzip'   - `.html.gz` file, for web servers sending it with `Content-Encoding: gzip`
+                       (not opened in the browser after saving).
+            'self_extracting' - one `.html` file with the gzip compressed report, decompressed
+                       by the browser (`DecompressionStream`, needs JavaScript).
+            The html is compressed chunk by chunk while it is written.
+        minify : bool, optional
+            Minify the html while it is written (whitespace runs and comments, the content of
+            pre, code, script, textarea and `white-space: pre` elements is kept), see `utils.report_minify`
+            (default is `None`, the report `use_minify_html`, `Reports_Settings.enable_minify_html()`).
+        """
+        compression = self._write_report_file(compression, minify = minify)
+        self._open_saved_file(compression)
+        
+    # --------------------------------------------------------------------------------------------
+    def save(self, compression: Optional[str] = None, minify: Optional[bool] = None) -> None:
+        """
+        Saves the report to an HTML file.
+
+        Parameters
+        ----------
+        compression : str, optional
+            None (the report default), 'gzip' or 'self_extracting', see `save_to_file()`.
+        minify : bool, optional
+            Minify the html (default is `None`, the report default), see `save_to_file()`.
+        """
+        self.save_to_file(compression, minify)
+
+    # --------------------------------------------------------------------------------------------
+    async def save_async(   self, 
+                            compression: Optional[str]      = None, 
+                            executor   : Optional[Executor] = None, 
+                            minify     : Optional[bool]     = None, 
+                                ) -> None:
+        """
+        Saves the report like `save_to_file()`, without blocking the asyncio event loop: the file
+        name claim, the html build and the (compressed) file write run in a worker thread, opening
+        the browser in another one. Many reports can be saved concurrently.
+
+        The charts and tables still rendered (`add_chart_async()`, `add_dataframe_table_async()`)
+        are awaited first, the elements added after that are not in the saved file.
+
+        Cancelling the task stops the writing at the next html chunk and removes the partially
+        written file, the coroutine returns (raises `asyncio.CancelledError`) once it is removed.
+
+        Parameters
+        ----------
+        compression : str, optional
+            None (the report default), 'gzip' or 'self_extracting', see `save_to_file()`.
+        executor : concurrent.futures.Executor, optional
+            A thread pool for the save, None for the event loop default executor (default is `None`).
+            Charts are rendered by the chart render pool (worker processes), see
+            `Reports_Settings.enable_parallel_chart_rendering()`.
+        minify : bool, optional
+            Minify the html (default is `None`, the report default), see `save_to_file()`.
+
+        Example
+        -------
+        >>> async def handle_request():
+        ...     report = ReportHTML(title = 'Status')
+        ...     report.add_text('OK')
+        ...     await report.save_async()
+        """
+        cancel_event = threading.Event()
+        
+        if self._live_file is None:
+            compression = await run_cancellable(self._claim_report_path, compression, executor = executor)
+        
+        try:
+            # the elements list is completed in the event loop thread, the worker writes a snapshot:
+            await self._wait_pending_elements()
+            elements = self._finalize_elements_list()
+            
+            if self._live_file is not None:
+                await run_cancellable(self._write_live_report_file, compression, cancel_event, minify, elements, 
+                                      executor = executor, cancel_event = cancel_event)
+            else:
+                await run_cancellable(self._write_claimed_file, compression, cancel_event, minify, elements, 
+                                      executor = executor, cancel_event = cancel_event)
+        except BaseException:
+            # cancelled or failed before the writing started, the claimed file is empty:
+            if self._live_file is None:
+                self._remove_claimed_file()
+            raise
+        
+        if self.use_open_saved_file and compression != 'gzip':
+            await run_cancellable(self._open_saved_file, compression, executor = executor)
+
+    # --------------------------------------------------------------------------------------------
+    def flush_live( self, 
+                    min_interval   : float         = 0.0, 
+                    refresh_seconds: Optional[int] = None, 
+                        ) -> bool:
+        """
+        Writes the report as it is now to its file, which can be opened while the job is still
+        running. The first call claims the file name (and opens the browser), every later call
+        rewrites the same file.
+
+        Only the elements added since the last flush are rendered: their styles and bodies are
+        appended to segment files, the document (small head and tail around the copied segments)
+        is written to a temporary file and swapped in with `os.replace()`, so a reader never sees
+        a partial report. `elements_list` is not changed (no footer is added), `save()` writes the
+        final report to the same file and ends the live mode.
+
+        Live reports are plain html, the `report_compression` is not used. Removing a flushed
+        element (e.g. `move_element_to_bottom()`) makes the next flush append all elements again.
+
+        Parameters
+        ----------
+        min_interval : float, optional
+            Minimum seconds since the last flush, a call within the interval does nothing
+            (default is `0.0`). Calling it after every element with an interval gives periodic flushes.
+        refresh_seconds : int, optional
+            The page reloads itself in the browser every `refresh_seconds` (default is `None`, no reload).
+
+        Returns
+        -------
+        bool: True if the file was written.
+
+        Example
+        -------
+        >>> for epoch in range(epochs):
+        ...     report.add_chart(plot_epoch(epoch))
+        ...     report.flush_live(min_interval = 60, refresh_seconds = 30)
+        >>> report.save()
+        """
+        if self._live_file is not None and not self._live_file.is_due(min_interval):
+            return False
+        
+        is_first_flush: bool = self._live_file is None
+        
+        if is_first_flush:
+            self._claim_report_file(self.file_format)
+            self._live_file = LiveReportFile(self._file_path)
+        
+        try:
+            # charts rendered in the pool, tables rendered in worker threads:
+            self._join_pending_charts()
+            self._join_pending_tables()
+            
+            # the elements added since the last flush:
+            self._live_file.append(self.elements_list[_REPORT_HEAD_ELEMENTS + self._live_file.flushed_count:])
+            self._live_file.replace(lambda file: self._write_chunks(self._iter_live_html_chunks(refresh_seconds), file))
+        except BaseException:
+            # the first flush failed, no live report (the claimed file is empty):
+            if is_first_flush:
+                self._live_file.close()
+                self._live_file = None
+                self._remove_claimed_file()
+            raise
+        
+        self._open_saved_file()
+        return True
+
+    # --------------------------------------------------------------------------------------------
+    def _write_live_report_file(self, 
+                                compression : Optional[str]               = None, 
+                                cancel_event: Optional[threading.Event]   = None, 
+                                minify      : Optional[bool]              = None, 
+                                elements    : Optional[list[ReportElement]] = None, 
+                                    ) -> None:
+        """
+        Writes the final report over the live report file (atomic replace) and ends the live mode.
+        If the writing is cancelled, the last flushed file is kept and the live mode goes on.
+        """
+        if compression is not None:
+            raise ValueError(f"Invalid compression for a live report: '{compression}'. Live reports are plain html")
+        
+        self._live_file.replace(lambda file: self._write_html_file(file, minify, cancel_event, elements))
+        self._live_file.close()
+        self._live_file = None
+
+    # --------------------------------------------------------------------------------------------
+    def _write_report_file( self, 
+                            compression : Optional[str]             = None, 
+                            cancel_event: Optional[threading.Event] = None, 
+                            minify      : Optional[bool]            = None, 
+                                ) -> Optional[str]:
+        """
+        Claims the file name and writes the report to the file, returns the used compression.
+        If the cancel event is set, the writing stops with `concurrent.futures.CancelledError`
+        and the partially written file is removed. A live report is written over its file.
+        """
+        if self._live_file is not None:
+            return self._write_live_report_file(compression, cancel_event, minify)
+        
+        compression = self._claim_report_path(compression)
+        self._write_claimed_file(compression, cancel_event, minify)
+        
+        return compression
+
+    # --------------------------------------------------------------------------------------------
+    def _claim_report_path(self, compression: Optional[str] = None) -> Optional[str]:
+        """
+        Checks the compression (None for the report `report_compression`) and claims the file
+        name of the report, returns the compression.
+        """
+        compression = self.report_compression if compression is None else compression
+        _check_report_compression(compression)
+        
+        self._claim_report_file(get_report_file_format(self.file_format, compression))
+        return compression
+
+    # --------------------------------------------------------------------------------------------
+    def _write_claimed_file(self, 
+                            compression : Optional[str]                 = None, 
+                            cancel_event: Optional[threading.Event]     = None, 
+                            minify      : Optional[bool]                = None, 
+                            elements    : Optional[list[ReportElement]] = None, 
+                                ) -> None:
+        """
+        Writes the report (or the completed `elements`, see `_finalize_elements_list()`) to the
+        claimed file. If the cancel event is set, the writing stops with
+        `concurrent.futures.CancelledError`. If the writing stops (cancelled, or an element failed
+        to render), the claimed, partially written file is removed.
+        """
+        # Stream the HTML content to the file (compressed on the fly), element by element:
+        try:
+            with open_report_stream(self._file_path, compression, self.title) as file:
+                self._write_html_file(file, minify, cancel_event, elements)
+        except BaseException:
+            self._remove_claimed_file()
+            raise
+
+    # --------------------------------------------------------------------------------------------
+    def _remove_claimed_file(self) -> None:
+        """
+        Removes the claimed report file after a failed or cancelled save (not the report: a next
+        save claims a name again).
+        """
+        try:
+            os.remove(self._file_path)
+        except FileNotFoundError:
+            pass
+
+    # --------------------------------------------------------------------------------------------
+    def _write_html_file(   self, 
+                            file        : TextIO, 
+                            minify      : Optional[bool]                = None, 
+                            cancel_event: Optional[threading.Event]     = None, 
+                            elements    : Optional[list[ReportElement]] = None, 
+                                ) -> None:
         """
+        Streams the report html (of the completed `elements` if given) into the open file,
+        minified (`MinifyingStream`, None for the report `use_minify_html`) and stopped when the
+        cancel event is set.
+        """
+        minify = self.use_minify_html if minify is None else minify
+        stream = file if cancel_event is None else CancellableStream(file, cancel_event)
+        
+        if not minify:
+            self._write_chunks(self._iter_html_chunks(elements), stream)
+            return
+        
+        # the minified html is written through the cancellable stream, `finish()` writes the rest:
+        minifying_stream = MinifyingStream(stream)
+        self._write_chunks(self._iter_html_chunks(elements), minifying_stream)
+        minifying_stream.finish()
+
+    # --------------------------------------------------------------------------------------------
+    def _claim_report_file(self, file_format: str) -> None:
+        """
+        Resolves the report folder, claims a unique file name (`_file_path`) and adds the file
+        name to the default subtitle.
+        """
+        # Default report path from the keyring, looked up on the first save:
+        if self._use_default_folder_path and self.folder_path == Reports_Settings._folder_path:
+            self.folder_path = Reports_Settings.get_folder_path()
+        self._use_default_folder_path = False
+        
         # Check if the folder exists:
         if not os.path.exists(self.folder_path):
             os.makedirs(self.folder_path)
@@ -302,40 +693,30 @@ class ReportHTML():
         self._file_name = sanitize_filename(self._file_name)
         # self._file_name = self._sanitize_filename(self._file_name)
         
-        # Construct the full file path
-        self._file_path = os.path.join(self.folder_path, self._file_name + self.file_format)        
+        # if file exists, then update the filename (_(NNNN) index), and claim the file.
+        with self._phase('collision_resolution'):
+            self._file_name = claim_unique_file_name(self.folder_path, self._file_name, file_format)
         
-        # if file exists, then update the filename, and save the file.        
-        while os.path.exists(self._file_path):
-            # self._file_name = self._update_filename(self._file_name)
-            self._file_name = update_filename(self._file_name)
-            self._file_path = os.path.join(self.folder_path, self._file_name + self.file_format)
-            pass
+        # Construct the full file path
+        self._file_path = os.path.join(self.folder_path, self._file_name + file_format)        
         
         # UPDATING SUBTITLE FOR DEFAULT SETTINGS WITH FILENAME:        
         if self.use_custom_sub_title == False:
             self.sub_title = self.sub_title + f'<p><p>{self._file_name}'
             self.update_header_title(subtitle = self.sub_title)            
             pass
-        
-        html_content: str = self._get_html_str()
-                
-        # Save the HTML content to the file
-        with open(self._file_path, 'w', encoding = "utf-8") as file:
-            file.write(html_content)
 
-        # Optionally open the file after saving
-        if self.use_open_saved_file:
-            webbrowser.open_new_tab(self._file_path)        
-        
-        pass
-        
     # --------------------------------------------------------------------------------------------
-    def save(self) -> None:
+    def _open_saved_file(self, compression: Optional[str] = None) -> None:
         """
-        Saves the report to an HTML file.
+        Optionally opens the saved file in the browser (browsers do not render a local .html.gz).
         """
-        self.save_to_file()
+        # a live report is opened once, the browser reloads it:
+        if self.use_open_saved_file and compression != 'gzip' and self._file_path != self._opened_file_path:
+            with self._phase('browser_open'):
+                import webbrowser
+                webbrowser.open_new_tab(self._file_path)        
+            self._opened_file_path = self._file_path
 
     # --------------------------------------------------------------------------------------------
     def update_header_title(self, 
@@ -370,9 +751,11 @@ class ReportHTML():
         if use_title_background is not None:
             self.use_title_background = use_title_background
 
-        header_element = get_header_title(  title    = self.title, 
-                                            subtitle = self.sub_title, 
-                                            use_background_image = self.use_title_background)
+        header_element = ReportElement.deferred(ReportElementTypes.HEAD_TITLE_ON_BACKGROUND,
+                                                self._timed(ReportElementTypes.HEAD_TITLE_ON_BACKGROUND, get_header_title),
+                                                title                = self.title, 
+                                                subtitle             = self.sub_title, 
+                                                use_background_image = self.use_title_background)
         
         self.elements_list[1] = header_element
 
@@ -382,7 +765,7 @@ class ReportHTML():
         """
         Adds a horizontal line to the report.
         """
-        self.elements_list.append(get_horizontal_line_element())
+        self._add_element(ReportElementTypes.HORIZONTAL_LINE, get_horizontal_line_element)
 
     # --------------------------------------------------------------------------------------------
     
@@ -390,7 +773,7 @@ class ReportHTML():
         """
         Adds a space element to the report.
         """
-        self.elements_list.append(get_space_element())
+        self._add_element(ReportElementTypes.SPACE, get_space_element)
 
     # --------------------------------------------------------------------------------------------
     
@@ -415,9 +798,11 @@ class ReportHTML():
         -------
         >>> report.add_title(title = 'My Title', h_level = 2, use_center = True)
         """
-        self.elements_list.append(get_title_element(title, 
-                                                    h_level    = h_level, 
-                                                    use_center = use_center))
+        self._add_element(  ReportElementTypes.TITLE, 
+                            get_title_element, 
+                            title, 
+                            h_level    = h_level, 
+                            use_center = use_center)
 
     # --------------------------------------------------------------------------------------------
     
@@ -438,7 +823,7 @@ class ReportHTML():
                             My long tex is still going on. \'''
         >>> report.add_text(text = long_text)
         """
-        self.elements_list.append(get_text_element(text))
+        self._add_element(ReportElementTypes.TEXT, get_text_element, text)
 
     # --------------------------------------------------------------------------------------------
     
@@ -459,15 +844,16 @@ class ReportHTML():
                         My long text is still going on.'''
         >>> report.add_text_console(text = long_text)
         """
-        self.elements_list.append(get_text_console_element(text))
+        self._add_element(ReportElementTypes.TEXT_CONSOLE, get_text_console_element, text)
 
     # --------------------------------------------------------------------------------------------
     
     def add_chart(  self, 
-                    chart_plt     : plt.Figure,
+                    chart_plt     : 'plt.Figure',
                     use_fullwidth : bool          = False,
                     height        : Optional[int] = None,
                     width         : Optional[int] = None,
+                    chart_format  : Optional[str] = None,
                         ) -> None:
         """
         Adds a chart to the report.
@@ -483,6 +869,9 @@ class ReportHTML():
             The height of the chart in pixels (default is `None`).
         width : int, optional
             The width of the chart in pixels (default is `None`).
+        chart_format : str, optional
+            'png', 'jpeg', 'webp', 'svg' or 'auto' (default is `None`, `Reports_Settings.chart_format`).
+            The encoding options are set by `Reports_Settings.set_chart_format()`.
             
 
         Example
@@ -496,20 +885,39 @@ class ReportHTML():
                                 width         = 1170)
         """
         use_transparent_plots: bool = self._USE_TRANSPARENT_PLOTS
+        format_options       : dict = self._get_chart_format_options(chart_format)
+        layout               : dict = { 'use_fullwidth': use_fullwidth, 
+                                        'heigth'       : height, 
+                                        'width'        : width, }
+        
+        if self.chart_render_workers > 0:
+            self._add_chart_to_pool(chart_plt, 
+                                    use_transparent_plots = use_transparent_plots,
+                                    layout                = layout,
+                                    format_options        = format_options)
+            return
         
-        self.elements_list.append(get_chart_element(chart_plt, 
+        if self.use_image_dedup:
+            image_format, image_bytes = get_chart_image_bytes(chart_plt, use_transparent_plots, **format_options)
+            self.elements_list.append(self._get_deduplicated_chart_element(image_format, image_bytes, layout))
+            return
+        
+        self.elements_list.append(self._timed(ReportElementTypes.CHART, get_chart_element)(chart_plt, 
                                                     use_fullwidth         = use_fullwidth, 
                                                     heigth                = height, 
                                                     width                 = width, 
-                                                    use_transparent_plots = use_transparent_plots, ))
+                                                    use_transparent_plots = use_transparent_plots, 
+                                                    **format_options, ))
+        self._spill_elements(self.elements_list[-1])
 
     # --------------------------------------------------------------------------------------------
     
     def add_plot(   self, 
-                    plot_plt      : plt.Figure,
+                    plot_plt      : 'plt.Figure',
                     use_fullwidth : bool          = False,
                     height        : Optional[int] = None,
                     width         : Optional[int] = None,
+                    chart_format  : Optional[str] = None,
                         ) -> None:
         """
         Adds a plot to the report.
@@ -525,6 +933,8 @@ class ReportHTML():
             The height of the plot in pixels (default is `None`).
         width : int, optional
             The width of the plot in pixels (default is `None`).
+        chart_format : str, optional
+            'png', 'jpeg', 'webp', 'svg' or 'auto' (default is `None`, `Reports_Settings.chart_format`).
 
         Example
         -------
@@ -537,12 +947,56 @@ class ReportHTML():
                             height        = 400,
                             width         = 1170)        
         """
-        self.add_chart(plot_plt, use_fullwidth, height, width)
+        self.add_chart(plot_plt, use_fullwidth, height, width, chart_format)
+
+    # --------------------------------------------------------------------------------------------
+    
+    async def add_chart_async(  self, 
+                                chart_plt     : 'plt.Figure',
+                                use_fullwidth : bool          = False,
+                                height        : Optional[int] = None,
+                                width         : Optional[int] = None,
+                                chart_format  : Optional[str] = None,
+                                    ) -> None:
+        """
+        Adds a chart to the report like `add_chart()`, rendered in the chart render pool without
+        blocking the asyncio event loop. The chart keeps its place in the document even if other
+        elements are added while it is rendered.
+
+        The pool renders in worker processes: the figure is pickled when the coroutine starts (it
+        can be changed right away) and the rendering does not hold the GIL of the service.
+        Cancelling the task removes the chart from the report.
+
+        Parameters
+        ----------
+        See `add_chart()`.
+
+        Example
+        -------
+        >>> fig, ax = plt.subplots()
+        >>> ax.plot([1, 2, 3, 4])
+        >>> await report.add_chart_async(fig, height = 400)
+        """
+        layout: dict = {'use_fullwidth': use_fullwidth, 
+                        'heigth'       : height, 
+                        'width'        : width, }
+        
+        element, future = self._add_chart_to_pool(  chart_plt, 
+                                                    use_transparent_plots = self._USE_TRANSPARENT_PLOTS,
+                                                    layout                = layout,
+                                                    format_options        = self._get_chart_format_options(chart_format))
+        try:
+            await asyncio.wrap_future(future)
+        except BaseException:
+            # cancelled or failed, the report is saved without the chart:
+            future.cancel()
+            self._remove_element(element)
+            raise
 
     # --------------------------------------------------------------------------------------------
     
     def add_dataframe_table(self, 
-                            df:                 pd.DataFrame, 
+                            df:                 'pd.DataFrame', 
                             highlight_columns:  list[str] = [], 
                             round:              int       = -1, 
                             color_map_name:     str       = Reports_Settings.df_heatmap_colormap_name,
@@ -564,6 +1018,9 @@ class ReportHTML():
         used_part_of_color : float, optional
             Part of the color map to use for the heatmap, should be between 0.05 and 1.0 (default is `Reports_Settings.df_heatmap_used_clr_pcnt`).
 
+        The table is rendered by the `Reports_Settings.df_table_engine` renderer ('fast' or 'styler').
+        Large tables are truncated by the size policy, see `Reports_Settings.set_df_table_size_policy()`.
+
         Example
         -------
         >>> import pandas as pd
@@ -574,18 +1031,26 @@ class ReportHTML():
                                         color_map_name     = 'coolwarm',
                                         used_part_of_color = 0.4)        
         """
-        self.elements_list.append(get_table_dataframe_element(  df, 
-                                                                highlight_columns, 
-                                                                round, 
-                                                                color_map_name,
-                                                                used_part_of_color,
-                                                                Reports_Settings.df_heatmap_nan_color,
-                                                                Reports_Settings.df_min_col_amount_for_full_width))
+        self._add_element(  ReportElementTypes.DFTABLE,
+                            get_table_dataframe_element,
+                            df, 
+                            highlight_columns, 
+                            round, 
+                            color_map_name,
+                            used_part_of_color,
+                            Reports_Settings.df_heatmap_nan_color,
+                            Reports_Settings.df_min_col_amount_for_full_width,
+                            Reports_Settings.df_table_engine,
+                            max_rows          = Reports_Settings.df_table_max_rows,
+                            max_cells         = Reports_Settings.df_table_max_cells,
+                            truncate_strategy = Reports_Settings.df_table_truncate_strategy,
+                            top_k_column      = Reports_Settings.df_table_top_k_column,
+                            top_k_ascending   = Reports_Settings.df_table_top_k_ascending, )
 
     # --------------------------------------------------------------------------------------------    
     
     def add_df_table(   self, 
-                        df               : pd.DataFrame,
+                        df               : 'pd.DataFrame',
                         highlight_columns: list[str] = [],
                         round            : int       = -1,
                             ) -> None:
@@ -613,6 +1078,123 @@ class ReportHTML():
 
     # --------------------------------------------------------------------------------------------
     
+    async def add_dataframe_table_async(self, 
+                                        df:                 'pd.DataFrame', 
+                                        highlight_columns:  list[str]          = [], 
+                                        round:              int                = -1, 
+                                        color_map_name:     str                = Reports_Settings.df_heatmap_colormap_name,
+                                        used_part_of_color: float              = Reports_Settings.df_heatmap_used_clr_pcnt,
+                                        executor:           Optional[Executor] = None,
+                                            ) -> None:
+        """
+        Adds a dataframe table to the report like `add_dataframe_table()`, rendered in a worker
+        thread without blocking the asyncio event loop. The table keeps its place in the document
+        even if other elements are added while it is rendered.
+
+        The DataFrame must not be changed until the coroutine returns. Cancelling the task
+        removes the table from the report (the rendering runs to the end in the background).
+        A save while the table is rendered waits for it. With `use_lazy_elements` the table is
+        added deferred, like `add_dataframe_table()`, and rendered on save.
+
+        Parameters
+        ----------
+        See `add_dataframe_table()`.
+        executor : concurrent.futures.Executor, optional
+            A thread pool for the rendering, None for the event loop default executor (default is `None`).
+
+        Example
+        -------
+        >>> await report.add_dataframe_table_async(df, highlight_columns = ['A'], round = 2)
+        """
+        if self.use_lazy_elements:
+            self.add_dataframe_table(df, highlight_columns, round, color_map_name, used_part_of_color)
+            return
+        
+        element      = ReportElement()
+        element.type = ReportElementTypes.DFTABLE
+        future       = Future()
+        
+        self._pending_tables.append((element, future))
+        self.elements_list.append(element)
+        
+        try:
+            await run_cancellable(  run_into_future, 
+                                    future,
+                                    self._timed(ReportElementTypes.DFTABLE, get_table_dataframe_element),
+                                    df, 
+                                    highlight_columns, 
+                                    round, 
+                                    color_map_name,
+                                    used_part_of_color,
+                                    Reports_Settings.df_heatmap_nan_color,
+                                    Reports_Settings.df_min_col_amount_for_full_width,
+                                    Reports_Settings.df_table_engine,
+                                    Reports_Settings.df_table_max_rows,
+                                    Reports_Settings.df_table_max_cells,
+                                    Reports_Settings.df_table_truncate_strategy,
+                                    Reports_Settings.df_table_top_k_column,
+                                    Reports_Settings.df_table_top_k_ascending,
+                                    executor = executor)
+        except BaseException:
+            self._remove_element(element)
+            raise
+        
+        # filled here, unless a save already joined it:
+        self._join_pending_tables(element)
+
+    # --------------------------------------------------------------------------------------------
+    
+    def add_dataframe_table_virtual(self, 
+                                    df:                 'pd.DataFrame', 
+                                    highlight_columns:  list[str] = [], 
+                                    round:              int       = -1, 
+                                    color_map_name:     str       = Reports_Settings.df_heatmap_colormap_name,
+                                    used_part_of_color: float     = Reports_Settings.df_heatmap_used_clr_pcnt,
+                                    visible_rows:       int       = 25,
+                                        ) -> None:
+        """
+        Adds a dataframe table with virtual scrolling to the report, for DataFrames too large
+        for a static html table (hundreds of thousands of rows and more).
+
+        The data is embedded once as compact columnar JSON, and only the visible rows are
+        rendered by the browser while scrolling. The cell texts and heatmap colors are the same
+        as for `add_dataframe_table`.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The pandas DataFrame to add as a table.
+        highlight_columns : list of str, optional
+            List of column names to highlight values in the table by heatmap (default is `[]`).
+        round : int, optional
+            Round the values in the table to the given number of digits after the decimal point (default is `-1`).
+        color_map_name : str, optional
+            Name of the color map to use for the heatmap (default is `Reports_Settings.df_heatmap_colormap_name`).
+        used_part_of_color : float, optional
+            Part of the color map to use for the heatmap, should be between 0.05 and 1.0 (default is `Reports_Settings.df_heatmap_used_clr_pcnt`).
+        visible_rows : int, optional
+            Number of rows visible without scrolling (default is `25`).
+
+        Example
+        -------
+        >>> import numpy as np
+        >>> import pandas as pd
+        >>> df = pd.DataFrame(np.random.normal(size = (1_000_000, 3)), columns = ['A', 'B', 'C'])
+        >>> report.add_dataframe_table_virtual(df, highlight_columns = ['A'], round = 3)
+        """
+        self._add_element(  ReportElementTypes.DFTABLE_VIRTUAL,
+                            get_table_dataframe_virtual_element,
+                            df, 
+                            highlight_columns, 
+                            round, 
+                            color_map_name,
+                            used_part_of_color,
+                            Reports_Settings.df_heatmap_nan_color,
+                            Reports_Settings.df_min_col_amount_for_full_width,
+                            visible_rows)
+
+    # --------------------------------------------------------------------------------------------
+    
     def add_param_value_table(  self, 
                                 pv_data      : dict[str, str] | list[tuple[str, str]],
                                 title        : str  = '',
@@ -638,11 +1220,13 @@ class ReportHTML():
                                             use_big_table = False, )        
         """
         if use_big_table:
-            self.elements_list.append(get_param_value_table_element_v2(pv_data, title))
+            self._add_element(ReportElementTypes.PARAM_VALUE_TABLE_v2, get_param_value_table_element_v2, pv_data, title)
         else:
-            self.elements_list.append(get_param_value_table_element(pv_data, 
-                                                                    title, 
-                                                                    Reports_Settings.param_value_table_truncate_length))
+            self._add_element(  ReportElementTypes.PARAM_VALUE_TABLE,
+                                get_param_value_table_element, 
+                                pv_data, 
+                                title, 
+                                Reports_Settings.param_value_table_truncate_length)
 
     # --------------------------------------------------------------------------------------------
     
@@ -702,7 +1286,8 @@ class ReportHTML():
         if title is not None:
             self.add_title(title)            
         
-        self.elements_list.append(get_code_element(f_code))
+        self._add_element(ReportElementTypes.CODE, get_code_element, f_code, 
+                          use_highlighting = self.use_offline_code_highlighting)
 
     # --------------------------------------------------------------------------------------------
     
@@ -734,7 +1319,7 @@ class ReportHTML():
                                     alert_type = 'i',
                                     emoji      = '', )
         """
-        self.elements_list.append(get_alert_box_element(text, alert_type, emoji))
+        self._add_element(ReportElementTypes.ALERT_BOX, get_alert_box_element, text, alert_type, emoji)
 
     # --------------------------------------------------------------------------------------------
     
@@ -772,7 +1357,7 @@ class ReportHTML():
         
         title_upd: str = title_suffix + title
         
-        self.elements_list.append(get_showhide_region_open_element(title_upd, region_name))
+        self._add_element(ReportElementTypes.SHOWHIDE_REGION_OPEN, get_showhide_region_open_element, title_upd, region_name)
 
     # --------------------------------------------------------------------------------------------
     
@@ -780,7 +1365,7 @@ class ReportHTML():
         """
         Adds a show/hide region close to the report.
         """
-        self.elements_list.append(get_showhide_region_close_element())
+        self._add_element(ReportElementTypes.SHOWHIDE_REGION_CLOSE, get_showhide_region_close_element)
 
     # --------------------------------------------------------------------------------------------
     
@@ -794,55 +1379,503 @@ class ReportHTML():
         >>> report.move_element_to_bottom()
         """
         if len(self.elements_list) > 0:
+            self._invalidate_live_elements(len(self.elements_list) - 1)
             self.bottom_elements_list.append(self.elements_list.pop())
     
+    # --------------------------------------------------------------------------------------------
+    #                                         PROFILING:
+    # --------------------------------------------------------------------------------------------
+
+    def get_profile_summary(self, as_dataframe: bool = False) -> Optional[dict]:
+        """
+        Returns the profiling data of the report: per element type build time and size, and the
+        save phases. Requires `Reports_Settings.enable_profiling()` before the report is created.
+
+        Parameters
+        ----------
+        as_dataframe : bool, optional
+            Return all records as a `pandas.DataFrame` instead of the summary dict (default is `False`).
+
+        Returns
+        -------
+        dict or pandas.DataFrame or None
+            The summary (see `ReportProfiler.summary()`), `None` if profiling is off.
+
+        Example
+        -------
+        >>> Reports_Settings.enable_profiling()
+        >>> report = ReportHTML('My Report')
+        >>> report.add_text('My Text')
+        >>> report.save()
+        >>> report.get_profile_summary()['phases']
+        {'collision_resolution': 0.0001, 'html_assembly': 0.002, 'write': 0.0003}
+        """
+        if self._profiler is None:
+            return None
+        
+        if as_dataframe:
+            return self._profiler.to_dataframe()
+        
+        return self._profiler.summary()
+
+    # --------------------------------------------------------------------------------------------
+
+    def add_profile_table(self, title: str = 'Report Profile') -> None:
+        """
+        Adds the profiling data recorded so far (element build times and sizes) to the report as a
+        parameter-value table. Does nothing if profiling is off.
+
+        Parameters
+        ----------
+        title : str, optional
+            Title of the table (default is `'Report Profile'`).
+        """
+        if self._profiler is None:
+            return
+        
+        self.add_param_value_table(self._profiler.get_pv_data(), title = title)
+
     # --------------------------------------------------------------------------------------------
     #                                         PRIVATE METHODS:
     # --------------------------------------------------------------------------------------------
+
+    def _add_element(   self, 
+                        element_type: ReportElementTypes, 
+                        builder     : Callable[..., ReportElement], 
+                        *args, 
+                        **kwargs, 
+                            ) -> None:
+        """
+        Adds the element built by `builder(*args, **kwargs)` to the report.
+        With `use_lazy_elements` the builder runs only when the element is rendered.
+        """
+        builder = self._timed(element_type, builder)
+        
+        if self.use_lazy_elements:
+            self.elements_list.append(ReportElement.deferred(element_type, builder, *args, **kwargs))
+        else:
+            self.elements_list.append(builder(*args, **kwargs))
+            self._spill_elements(self.elements_list[-1])
+
+    # --------------------------------------------------------------------------------------------
+
+    def _timed(   self, 
+                  element_type: ReportElementTypes, 
+                  builder     : Callable[..., ReportElement], 
+                      ) -> Callable[..., ReportElement]:
+        """
+        Returns the builder, wrapped by the profiler (time and size recording) if profiling is on.
+        """
+        if self._profiler is None:
+            return builder
+        return self._profiler.timed_builder(element_type, builder)
+
+    # --------------------------------------------------------------------------------------------
+
+    def _phase(self, name: str):
+        """
+        Returns a context manager timing the save phase `name` if profiling is on.
+        """
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.phase(name)
+
+    # --------------------------------------------------------------------------------------------
+
+    def _get_chart_format_options(self, chart_format: Optional[str] = None) -> dict:
+        """
+        Returns the chart format (the `Reports_Settings` default if None) and its encoding options
+        from `Reports_Settings`, as keyword arguments of `get_chart_image`.
+        """
+        chart_format = Reports_Settings.chart_format if chart_format is None else chart_format
+        
+        if chart_format not in CHART_FORMATS:
+            raise ValueError(f"Invalid chart format: '{chart_format}'. Supported formats: {CHART_FORMATS}")
+        
+        return {'chart_format'          : chart_format,
+                'png_compress_level'    : Reports_Settings.chart_png_compress_level,
+                'png_palette_colors'    : Reports_Settings.chart_png_palette_colors,
+                'quality'               : Reports_Settings.chart_quality,
+                'svg_simplify_threshold': Reports_Settings.chart_svg_simplify_threshold,
+                'size_budget'           : Reports_Settings.chart_size_budget, }
+
+    # --------------------------------------------------------------------------------------------
+
+    def _get_deduplicated_chart_element(self, 
+                                        image_format: str, 
+                                        image_bytes : bytes, 
+                                        layout      : dict, 
+                                            ) -> ReportElement:
+        """
+        Adds the image to the asset table and returns its deferred chart element, rendered on
+        save (embedded if the image is used once, otherwise a reference to the asset table).
+        Inline SVG charts are not deduplicated.
+        """
+        if image_format == 'svg':
+            return get_chart_element_from_base64(image_bytes.decode('utf-8'), image_format = image_format, **layout)
+        
+        asset_id = self._image_assets.add(image_format, image_bytes)
+        
+        return ReportElement.deferred(  ReportElementTypes.CHART, 
+                                        self._timed(ReportElementTypes.CHART, self._image_assets.get_chart_element), 
+                                        asset_id, 
+                                        **layout)
+
+    # --------------------------------------------------------------------------------------------
+
+    def _add_chart_to_pool( self, 
+                            chart_plt            : 'plt.Figure', 
+                            use_transparent_plots: bool, 
+                            layout               : dict, 
+                            format_options       : dict, 
+                                ) -> tuple[ReportElement, Future]:
+        """
+        Adds a placeholder chart element and schedules its rendering in the chart render pool,
+        returns the element and the render future.
+        """
+        if self._chart_render_pool is None:
+            # without parallel rendering (async charts) the executor default number of workers:
+            self._chart_render_pool = ChartRenderPool(max_workers = self.chart_render_workers or None)
+        
+        element      = ReportElement()
+        element.type = ReportElementTypes.CHART
+        
+        future = self._chart_render_pool.submit_image(chart_plt, use_transparent_plots, 
+                                                      as_bytes = self.use_image_dedup, **format_options)
+        
+        self._pending_charts.append((element, future, layout))
+        self.elements_list.append(element)
+        
+        return element, future
+
+    # --------------------------------------------------------------------------------------------
+
+    def _spill_elements(self, element: ReportElement) -> None:
+        """
+        Counts the added (rendered) element in the element store, which spills the rendered
+        elements to its temporary file once the memory budget is exceeded.
+        """
+        if self._element_store is not None:
+            self._element_store.add(element, self.elements_list)
+
+    # --------------------------------------------------------------------------------------------
+
+    def _remove_element(self, element: ReportElement) -> None:
+        """
+        Removes the element (and its pending chart rendering) from the report, e.g. when adding
+        it was cancelled.
+        """
+        self._pending_charts = [pending for pending in self._pending_charts if pending[0] is not element]
+        self._pending_tables = [pending for pending in self._pending_tables if pending[0] is not element]
+        
+        # deleted in place (a save in a worker thread may update the header meanwhile):
+        for index in reversed(range(len(self.elements_list))):
+            if self.elements_list[index] is element:
+                self._invalidate_live_elements(index)
+                del self.elements_list[index]
+
+    # --------------------------------------------------------------------------------------------
+
+    def _invalidate_live_elements(self, index: int) -> None:
+        """
+        Empties the live segments if the element at the index, being removed, was already flushed.
+        """
+        if self._live_file is not None and index < _REPORT_HEAD_ELEMENTS + self._live_file.flushed_count:
+            self._live_file.reset()
+
+    # --------------------------------------------------------------------------------------------
+
+    def _join_pending_charts(self) -> None:
+        """
+        Waits for the charts rendered in the pool and fills their elements, in document order.
+        """
+        if not self._pending_charts:
+            return
+        
+        deduplicated_charts: list[tuple[ReportElement, str, dict]] = []
+        
+        for element, future, layout in self._pending_charts:
+            with self._phase('chart_pool_join'):
+                image_format, image_data = future.result()
+            
+            # deduplicated images (bytes) are rendered when all of them are in the asset table:
+            if isinstance(image_data, bytes) and image_format != 'svg':
+                deduplicated_charts.append((element, self._image_assets.add(image_format, image_data), layout))
+                continue
+            
+            if isinstance(image_data, bytes):
+                image_data = image_data.decode('utf-8')
+            
+            element.body_content = get_chart_element_from_base64(image_data, image_format = image_format, 
+                                                                 **layout).body_content
+            pass
+        
+        for element, asset_id, layout in deduplicated_charts:
+            element.body_content = self._image_assets.get_chart_element(asset_id, **layout).body_content
+            pass
+        
+        self._pending_charts = []
+        self._chart_render_pool.shutdown()
+
+    # --------------------------------------------------------------------------------------------
+
+    def _join_pending_tables(self, element: Optional[ReportElement] = None) -> None:
+        """
+        Waits for the tables rendered in worker threads (only the one of `element` if given) and
+        fills their elements.
+        """
+        for pending in list(self._pending_tables):
+            if element is not None and pending[0] is not element:
+                continue
+            
+            table_element, future = pending
+            table = future.result()
+            
+            table_element.body_content  = table.get_body_str()
+            table_element.style_content = table.get_style_str()
+            
+            self._pending_tables.remove(pending)
+            self._spill_elements(table_element)
+
+    # --------------------------------------------------------------------------------------------
+
+    async def _wait_pending_elements(self) -> None:
+        """
+        Waits, without blocking the event loop, until no chart or table of the report is rendered
+        anymore (also the ones added while waiting). Failures are raised by the join on save.
+        """
+        while True:
+            futures = [future for _, future, _ in self._pending_charts if not future.done()]
+            futures += [future for _, future in self._pending_tables if not future.done()]
+            
+            if not futures:
+                return
+            
+            await asyncio.wait([asyncio.wrap_future(future) for future in futures])
     
-    def _get_html_str(self) -> str:
+    # --------------------------------------------------------------------------------------------
+
+    def _finalize_elements_list(self) -> list[ReportElement]:
         """
-        Returns the html string for the report.
+        Completes the report for the save: fills the pending charts and tables, adds the bottom
+        elements and the footer. Returns a copy of the elements list, the document to write.
         """
+        # charts rendered in the pool, tables rendered in worker threads:
+        self._join_pending_charts()
+        self._join_pending_tables()
         
         # adding bottom elements to the report:
         self._adding_bottom_elements_to_report()
         
         # Adding final element:
-        self.elements_list.append(get_footer_element())        
+        self.elements_list.append(get_footer_element())
+        
+        return list(self.elements_list)
+    
+    # --------------------------------------------------------------------------------------------
+    
+    def _get_html_str(self) -> str:
+        """
+        Returns the html string for the report.
+        """
+        return ''.join(self._iter_html_chunks())
+    
+    # --------------------------------------------------------------------------------------------
+
+    def _iter_html_chunks(self, elements: Optional[list[ReportElement]] = None) -> Iterator[str]:
+        """
+        Generates the html of the report chunk by chunk: the head, the collected style fragments,
+        each element body and the closing scripts. `elements` is a list completed by
+        `_finalize_elements_list()` before (None to complete the report now).
+
+        Joining the chunks gives exactly the same document as `_get_html_str()`, but the caller
+        never has to hold more than one element body in memory at a time: the style pass does not
+        render the deferred elements (only the header has a style), each deferred body is built
+        when it is written and released after (the element stays deferred).
+
+        Yields
+        ------
+        str: The next chunk of the html document.
+        """
+        if elements is None:
+            elements = self._finalize_elements_list()
+        
+        element_types: set[ReportElementTypes] = {element.type for element in elements}
         
+        yield from self._iter_html_head(element_types, 
+                                        (self._get_element_style_str(element, element_types) for element in elements))
+        
+        for element in elements:
+            yield element.get_transient_body_str()
+            pass        
+
+        yield from self._iter_html_tail(element_types)
+    
+    # --------------------------------------------------------------------------------------------
+
+    def _iter_live_html_chunks(self, refresh_seconds: Optional[int] = None) -> Iterator[str]:
+        """
+        Generates the html of a live flush: the head and the header, the flushed element styles
+        and bodies copied from the live segments, the bottom elements and the footer.
+        """
+        head_elements: list[ReportElement] = self.elements_list[:_REPORT_HEAD_ELEMENTS]
+        tail_elements: list[ReportElement] = self.bottom_elements_list + [get_footer_element()]
+        
+        element_types: set[ReportElementTypes] = ({element.type for element in head_elements + tail_elements} 
+                                                  | self._live_file.element_types)
+        
+        style_chunks: Iterator[str] = itertools.chain(
+                                        (self._get_element_style_str(element, element_types) for element in head_elements),
+                                        self._live_file.iter_styles(),
+                                        (element.get_style_str() for element in tail_elements), )
+        
+        yield from self._iter_html_head(element_types, style_chunks, refresh_seconds)
+        
+        for element in head_elements:
+            yield element.get_body_str()
+        
+        yield from self._live_file.iter_bodies()
+        
+        for element in tail_elements:
+            yield element.get_body_str()
+        
+        yield from self._iter_html_tail(element_types)
+
+    # --------------------------------------------------------------------------------------------
+
+    def _iter_html_head(self, 
+                        element_types  : set[ReportElementTypes], 
+                        style_chunks   : Iterable[str], 
+                        refresh_seconds: Optional[int] = None, 
+                            ) -> Iterator[str]:
+        """
+        Generates the html head (with the style chunks of the elements) up to the opening body tag.
+        With `refresh_seconds` the browser reloads the page periodically (live reports).
+        """
         favicon_base64: str = _get_base64_favicon()
         
-        res: str = '<!DOCTYPE html> \n'
-        res     += '<html lang="en"> \n'
-        res     += '<head> \n'
-        res     += '<meta charset="UTF-8"> \n'
-        res     += f'<link rel="icon" type="image/png" href="{favicon_base64}"/>'
-        res     += f'''<title>
+        # The virtual table style and script are added only when the report has a virtual table:
+        use_virtual_tables: bool = ReportElementTypes.DFTABLE_VIRTUAL in element_types
+        
+        # Code highlighting (offline style or highlight.js) only when the report has code blocks:
+        use_code_elements: bool = ReportElementTypes.CODE in element_types
+        
+        yield ( '<!DOCTYPE html> \n'
+                '<html lang="en"> \n'
+                '<head> \n'
+                '<meta charset="UTF-8"> \n'
+                f'<link rel="icon" type="image/png" href="{favicon_base64}"/>'
+                f'''<title>
                     {self.title}                
-                    </title> \n'''
+                    </title> \n''' )
+        
+        if refresh_seconds is not None:
+            yield f'<meta http-equiv="refresh" content="{refresh_seconds}"> \n'
                 
         # Code Highlighting:
-        res     += _HIGHLIGHT_JS_CDN                
-        res     += '<style> \n'
+        if use_code_elements and not self.use_offline_code_highlighting:
+            yield _HIGHLIGHT_JS_CDN                
+        yield '<style> \n'
         
-        for element in self.elements_list:
-            res += element.get_style_str()
+        for style_str in style_chunks:
+            if style_str:
+                yield style_str
             pass
         
-        res += '</style> \n'        
-        res += '</head> \n'
-        res += '<body> \n'
+        if use_virtual_tables:
+            yield VIRTUAL_TABLE_STYLE
         
-        for element in self.elements_list:
-            res += element.get_body_str()
-            pass        
+        if use_code_elements and self.use_offline_code_highlighting:
+            yield CODE_HIGHLIGHT_STYLE
+        
+        yield '</style> \n'        
+        yield '</head> \n'
+        yield '<body> \n'
+
+    # --------------------------------------------------------------------------------------------
 
-        res += f'''<script>{_TOGGLE_CONTENT_SCRIPT}</script>'''
-        res += '</body> \n'
-        res += '</html> \n'
+    def _iter_html_tail(self, element_types: set[ReportElementTypes]) -> Iterator[str]:
+        """
+        Generates the end of the html body: the shared chart images and the element scripts.
+        """
+        # The shared chart images, after the elements referencing them:
+        image_assets_str: str = self._image_assets.get_script()
+        if image_assets_str:
+            yield image_assets_str
+
+        for script in self._get_element_scripts(element_types):
+            yield f'''<script>{script}</script>'''
         
-        return res
+        yield '</body> \n'
+        yield '</html> \n'
+
+    # --------------------------------------------------------------------------------------------
+
+    def _get_element_style_str(self, element: ReportElement, element_types: set[ReportElementTypes]) -> str:
+        """
+        Returns the style of the element, with tree shaking the report stylesheet (STYLE element)
+        has only the rule groups of the element types in the report.
+        """
+        if element.type == ReportElementTypes.STYLE and self.use_tree_shaking:
+            return get_css_content(element_types)
+        return element.get_style_str()
+    
+    # --------------------------------------------------------------------------------------------
+
+    def _get_element_scripts(self, element_types: set[ReportElementTypes]) -> list[str]:
+        """
+        Returns the scripts used by the element types of the report (`_ELEMENT_SCRIPTS`), each
+        once. Without tree shaking the show / hide toggle script is always included.
+        """
+        scripts: list[str] = [] if self.use_tree_shaking else [_TOGGLE_CONTENT_SCRIPT]
+        
+        for element_type, element_scripts in _ELEMENT_SCRIPTS.items():
+            if element_type in element_types:
+                scripts += [script for script in element_scripts if script not in scripts]
+        
+        return scripts
+    
+    # --------------------------------------------------------------------------------------------
+
+    def write_to_stream(self, stream: TextIO) -> int:
+        """
+        Writes the report html to any writable text stream (an open file, `io.StringIO`, etc.)
+        without building the whole document as one string first.
+
+        Parameters
+        ----------
+        stream : TextIO
+            The writable text stream to write the html into.
+
+        Returns
+        -------
+        int: The number of characters written.
+
+        Example
+        -------
+        >>> with open('my_report.html', 'w', encoding = 'utf-8') as file:
+        ...     report.write_to_stream(file)
+        """
+        return self._write_chunks(self._iter_html_chunks(), stream)
+    
+    # --------------------------------------------------------------------------------------------
+
+    def _write_chunks(self, chunks: Iterable[str], stream: TextIO) -> int:
+        """
+        Writes the html chunks to the stream (timed by the profiler if profiling is on), returns 
+        the number of characters written.
+        """
+        if self._profiler is not None:
+            return self._profiler.write_chunks(chunks, stream)
+        
+        written: int = 0
+        
+        for chunk in chunks:
+            stream.write(chunk)
+            written += len(chunk)
+            pass
+        
+        return written
     
     # --------------------------------------------------------------------------------------------
 
@@ -0,0 +1,148 @@
+# ============================================================================================
+#                   Reporter - Image Asset Table (content-addressed image deduplication)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Reporter - Image Asset Table'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# --------------------------------------------------------------------------------------------
+
+# --- TODO : ---------------------------------------------------------------------------------
+# - Deduplicate repeated inline SVG charts (<symbol> / <use>).
+# ============================================================================================
+
+import base64
+import hashlib
+import json
+
+from typing import Optional
+
+from .elements.report_element import ReportElement
+from .elements.report_element_chart import (
+    CHART_MIME_TYPES,
+    get_chart_element_from_asset,
+    get_chart_element_from_base64,
+)
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+IMAGE_ASSET_ID_LENGTH: int = 16     # hex digits of the sha256 of the image bytes
+
+IMAGE_ASSETS_JSON_ID: str = 'report-image-assets'
+
+# Sets the `src` of every `<img data-asset>` from the asset table (placed after the elements):
+IMAGE_ASSET_SCRIPT: str = """
+(function () {
+    var assets = JSON.parse(document.getElementById('report-image-assets').textContent);
+    var images = document.querySelectorAll('img[data-asset]');
+    for (var i = 0; i < images.length; i++) {
+        images[i].src = assets[images[i].getAttribute('data-asset')];
+    }
+})();
+"""
+
+# ============================================================================================
+#                                IMAGE ASSET TABLE CLASS
+# ============================================================================================
+
+class ImageAssetTable:
+    """
+    Stores every unique chart image of a report once, keyed by the hash of its bytes.
+
+    `add()` hashes the encoded image bytes, only the first occurrence is base64 encoded. The
+    chart elements are rendered by `get_chart_element()` when the report is saved, when the
+    reference counts are final:
+
+    - images used once are embedded in their `<img>` as before (identical output),
+    - images used several times are written once to the asset table (`get_script()`, a JSON
+      script after the elements), their `<img>` elements reference it by id.
+
+    Attributes
+    ----------
+    assets : dict[str, dict]
+        Per asset id: `format`, `base64` (the encoded image) and `count` (number of references).
+
+    Methods
+    -------
+    add(image_format, image_bytes) -> str
+        Stores the image (if new) and returns its asset id.
+    get_chart_element(asset_id, use_fullwidth = False, heigth = None, width = None) -> ReportElement
+        The chart element of the image: embedded if used once, else a reference to the table.
+    get_script() -> str
+        The asset table and the script setting the image sources, empty without shared images.
+    """
+
+    def __init__(self) -> None:
+        self.assets: dict[str, dict] = {}
+
+    # --------------------------------------------------------------------------------------------
+
+    def add(self, image_format: str, image_bytes: bytes) -> str:
+        """
+        Stores the image if it is not in the table yet and counts the reference.
+
+        Parameters
+        ----------
+        image_format : str
+            'png', 'jpeg' or 'webp', see `get_chart_image_bytes`.
+        image_bytes : bytes
+            The encoded image.
+
+        Returns
+        -------
+        str
+            The asset id (the first hex digits of the sha256 of the format and the bytes).
+        """
+        asset_id = hashlib.sha256(image_format.encode('ascii') + b':' + image_bytes).hexdigest()[:IMAGE_ASSET_ID_LENGTH]
+        asset    = self.assets.get(asset_id)
+
+        if asset is None:
+            self.assets[asset_id] = {'format': image_format,
+                                     'base64': base64.b64encode(image_bytes).decode('utf-8'),
+                                     'count' : 1, }
+        else:
+            asset['count'] += 1
+
+        return asset_id
+
+    # --------------------------------------------------------------------------------------------
+
+    def get_chart_element(  self,
+                            asset_id     : str,
+                            use_fullwidth: bool          = False,
+                            heigth       : Optional[int] = None,
+                            width        : Optional[int] = None,
+                                ) -> ReportElement:
+        """
+        Returns the chart element of the image: the image is embedded if it is used once,
+        otherwise the `<img>` references the asset table.
+        """
+        asset = self.assets[asset_id]
+
+        if asset['count'] == 1:
+            return get_chart_element_from_base64(asset['base64'], use_fullwidth, heigth, width, asset['format'])
+
+        return get_chart_element_from_asset(asset_id, use_fullwidth, heigth, width)
+
+    # --------------------------------------------------------------------------------------------
+
+    def get_script(self) -> str:
+        """
+        Returns the asset table of the shared images (as data URIs in a JSON script) and the
+        script setting the `src` of the referencing `<img>` elements, an empty string if no image
+        is used more than once.
+        """
+        shared = {asset_id: f"data:{CHART_MIME_TYPES[asset['format']]};base64,{asset['base64']}"
+                  for asset_id, asset in self.assets.items() if asset['count'] > 1}
+
+        if not shared:
+            return ''
+
+        return (f'<script type="application/json" id="{IMAGE_ASSETS_JSON_ID}">{json.dumps(shared)}</script>'
+                f'<script>{IMAGE_ASSET_SCRIPT}</script>')
+
+# ============================================================================================
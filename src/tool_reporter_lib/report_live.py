@@ -0,0 +1,188 @@
+# ============================================================================================
+#                   Reporter - Live Report File (incremental flush, atomic replace)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Reporter - Live Report File'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# --------------------------------------------------------------------------------------------
+
+# --- TODO : ---------------------------------------------------------------------------------
+# - Live self-extracting reports (the compressed stream can not be appended to).
+# ============================================================================================
+
+import os
+import tempfile
+import time
+
+from typing import Any, Callable, Iterator, Optional, TextIO
+
+from .elements.report_element import ReportElement, ReportElementTypes
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+# Characters copied from a segment file at once:
+LIVE_SEGMENT_CHUNK_SIZE: int = 1 << 16
+
+# ============================================================================================
+#                                LIVE REPORT FILE CLASS
+# ============================================================================================
+
+class LiveReportFile:
+    """
+    The state of a live report: one target file, rewritten by every flush, and two segment
+    files (anonymous temporary files) holding the styles and the bodies of the flushed
+    elements in document order.
+
+    A flush appends only the elements added since the previous one to the segments, the new
+    document (small head and tail around the copied segments) is written to a temporary file
+    in the target folder and swapped in with `os.replace()`, so a browser reloading the file
+    never sees a partial report.
+
+    Attributes
+    ----------
+    file_path : str
+        The target file of the report.
+    flushed_count : int
+        Number of elements in the segments.
+    element_types : set[ReportElementTypes]
+        Types of the flushed elements.
+    last_flush_time : float, optional
+        `time.monotonic()` of the last flush, None before the first one.
+
+    Methods
+    -------
+    is_due(min_interval) -> bool
+        Whether the minimum interval since the last flush has passed.
+    append(elements) -> None
+        Appends the styles and bodies of the elements to the segments.
+    reset() -> None
+        Empties the segments, the next flush appends all elements again.
+    iter_styles() -> Iterator[str]
+        Reads the styles segment in chunks.
+    iter_bodies() -> Iterator[str]
+        Reads the bodies segment in chunks.
+    replace(write) -> Any
+        Writes the new document to a temporary file and swaps it in atomically.
+    close() -> None
+        Closes (deletes) the segment files.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path      : str                     = file_path
+        self.flushed_count  : int                     = 0
+        self.element_types  : set[ReportElementTypes] = set()
+        self.last_flush_time: Optional[float]         = None
+
+        self._styles: TextIO = tempfile.TemporaryFile(mode = 'w+', encoding = 'utf-8', prefix = 'report_live_')
+        self._bodies: TextIO = tempfile.TemporaryFile(mode = 'w+', encoding = 'utf-8', prefix = 'report_live_')
+
+    # --------------------------------------------------------------------------------------------
+
+    def is_due(self, min_interval: float = 0.0) -> bool:
+        """
+        Returns True if no flush was done yet or at least `min_interval` seconds have passed.
+        """
+        return self.last_flush_time is None or time.monotonic() - self.last_flush_time >= min_interval
+
+    # --------------------------------------------------------------------------------------------
+
+    def append(self, elements: list[ReportElement]) -> None:
+        """
+        Appends the styles and bodies of the (rendered) elements to the segments.
+        """
+        self._styles.seek(0, os.SEEK_END)
+        self._bodies.seek(0, os.SEEK_END)
+
+        for element in elements:
+            self._styles.write(element.get_style_str())
+            self._bodies.write(element.get_body_str())
+            self.element_types.add(element.type)
+
+        self.flushed_count += len(elements)
+
+    # --------------------------------------------------------------------------------------------
+
+    def reset(self) -> None:
+        """
+        Empties the segments, e.g. when a flushed element was removed from the report.
+        """
+        for segment in (self._styles, self._bodies):
+            segment.seek(0)
+            segment.truncate()
+
+        self.flushed_count = 0
+        self.element_types = set()
+
+    # --------------------------------------------------------------------------------------------
+
+    def iter_styles(self) -> Iterator[str]:
+        """
+        Yields the flushed element styles in chunks.
+        """
+        return self._iter_segment(self._styles)
+
+    # --------------------------------------------------------------------------------------------
+
+    def iter_bodies(self) -> Iterator[str]:
+        """
+        Yields the flushed element bodies in chunks.
+        """
+        return self._iter_segment(self._bodies)
+
+    # --------------------------------------------------------------------------------------------
+
+    def replace(self, write: Callable[[TextIO], Any]) -> Any:
+        """
+        Calls `write(file)` on a temporary file in the target folder and replaces the target
+        file with it. If writing fails, the temporary file is removed and the target is kept.
+
+        Returns
+        -------
+        Any
+            The result of `write`.
+        """
+        folder_path, file_name = os.path.split(self.file_path)
+        file_descriptor, temp_path = tempfile.mkstemp(prefix = f'.{file_name}.', suffix = '.tmp', dir = folder_path or None)
+
+        try:
+            with open(file_descriptor, 'w', encoding = 'utf-8') as file:
+                res = write(file)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        self.last_flush_time = time.monotonic()
+        return res
+
+    # --------------------------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        Closes the segment files, which deletes them.
+        """
+        self._styles.close()
+        self._bodies.close()
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _iter_segment(segment: TextIO) -> Iterator[str]:
+        """
+        Yields the content of the segment file in chunks of `LIVE_SEGMENT_CHUNK_SIZE` characters.
+        """
+        segment.flush()
+        segment.seek(0)
+
+        while True:
+            chunk = segment.read(LIVE_SEGMENT_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+# ============================================================================================
@@ -2,8 +2,8 @@
 #                                  Tools - Utils Package
 # ============================================================================================
 
-__version__:      str = '0.0.9'
-__version_date__: str = '2024-10-20'
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_:           str = 'Tools - Utilities'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
@@ -12,6 +12,8 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 # v0.0.2 @ 2024-08-20 : Added report settings and utility functions.
 # v0.0.9 @ 2024-10-20 : Updated documentation and added the HTML cleaning function.
 #                     : Added function to clean the HTML code for reduced file size.
+# v0.1.0 @ 2026-10-16 : Added the streaming html minifier (minify_html).
+#                     : Exported claim_unique_file_name and clear_file_index_cache.
 # --------------------------------------------------------------------------------------------
 
 # --- TODO : ---------------------------------------------------------------------------------
@@ -26,6 +28,8 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 
 from .report_settings import Reports_Settings
 from .report_utils    import sanitize_filename, update_filename, get_current_datetime, get_clean_HTML_code
+from .report_utils    import claim_unique_file_name, clear_file_index_cache
+from .report_minify   import minify_html
 
 # ============================================================================================
 #                                PACKAGE DESCRIPTION:
@@ -44,6 +48,12 @@ Modules:
 2. report_utils.py:
     - Provides utility functions such as filename sanitization, generating the current date 
         and time, updating filenames, and cleaning HTML code to reduce file size.
+    - Claims unique report file names (`claim_unique_file_name`), `clear_file_index_cache` 
+        resets its per-folder index cache.
+
+3. report_minify.py:
+    - Single pass, streaming html minifier keeping the pre / code / script / textarea content,
+        used by `ReportHTML.save(minify = True)`.
 
 Usage:
 ------
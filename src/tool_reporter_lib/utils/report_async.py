@@ -0,0 +1,128 @@
+# ============================================================================================
+#                        Reporter - Async Helpers (executor offloading, cancellation)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Reporter - Async Helpers'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+#                     : Added run_into_future (results joined synchronously on save)
+# --------------------------------------------------------------------------------------------
+
+# --- TODO : ---------------------------------------------------------------------------------
+# - Cooperative cancellation of the element builders (DataFrame tables) running in a thread.
+# ============================================================================================
+
+import asyncio
+import threading
+
+from concurrent.futures import CancelledError, Executor, Future
+from typing import Any, Callable, Optional, TextIO
+
+# --------------------------------------------------------------------------------------------
+#                                  ASYNC FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+async def run_cancellable(  func        : Callable[..., Any],
+                            *args,
+                            executor    : Optional[Executor]        = None,
+                            cancel_event: Optional[threading.Event] = None,
+                                ) -> Any:
+    """
+    Runs `func(*args)` in the executor without blocking the event loop, and returns its result.
+
+    A running thread can not be interrupted: when the awaiting task is cancelled, the
+    `cancel_event` is set, the worker is expected to check it and stop (raising
+    `concurrent.futures.CancelledError`, see `CancellableStream`). The coroutine waits for the
+    worker to stop, so its clean-up is done when the `asyncio.CancelledError` is raised.
+
+    Parameters
+    ----------
+    func : Callable
+        The blocking function.
+    *args
+        The function arguments.
+    executor : concurrent.futures.Executor, optional
+        The executor, None for the event loop default thread pool (default is `None`).
+    cancel_event : threading.Event, optional
+        The event set on cancellation, None if the function can not be stopped: it runs to the
+        end in the background and its result is dropped (default is `None`).
+
+    Returns
+    -------
+    Any
+        The function result.
+    """
+    future = asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    if cancel_event is None:
+        return await future
+
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        cancel_event.set()
+        try:
+            await future
+        except Exception:       # stopped (CancelledError) or failed, the task is cancelled anyway
+            pass
+        raise
+
+# --------------------------------------------------------------------------------------------
+
+def run_into_future(future: Future, func: Callable[..., Any], *args) -> Any:
+    """
+    Runs `func(*args)` and sets its result (or exception) on the future too, so the result can
+    be joined from another thread (e.g. by a save) before the awaiting coroutine resumes.
+
+    Returns
+    -------
+    Any
+        The function result.
+    """
+    try:
+        result = func(*args)
+    except BaseException as error:
+        future.set_exception(error)
+        raise
+
+    future.set_result(result)
+    return result
+
+# --------------------------------------------------------------------------------------------
+#                                  CANCELLABLE STREAM:
+# --------------------------------------------------------------------------------------------
+
+class CancellableStream:
+    """
+    Text stream forwarding the writes to the target stream, until the cancel event is set.
+
+    Methods
+    -------
+    write(text) -> int
+        Writes the text, raises `concurrent.futures.CancelledError` if the event is set.
+    """
+
+    def __init__(self, stream: TextIO, cancel_event: threading.Event) -> None:
+        self._stream      : TextIO          = stream
+        self._cancel_event: threading.Event = cancel_event
+
+    # --------------------------------------------------------------------------------------------
+
+    def write(self, text: str) -> int:
+        """
+        Writes the text to the target stream.
+
+        Raises
+        ------
+        concurrent.futures.CancelledError
+            If the cancel event is set.
+        """
+        if self._cancel_event.is_set():
+            raise CancelledError('Report save cancelled')
+        return self._stream.write(text)
+
+# ============================================================================================
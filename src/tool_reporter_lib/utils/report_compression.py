@@ -0,0 +1,189 @@
+# ============================================================================================
+#                        Reporter - Report Compression (gzip, self-extracting)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Reporter - Report Compression'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# --------------------------------------------------------------------------------------------
+
+# --- TODO : ---------------------------------------------------------------------------------
+# - Brotli, once `DecompressionStream` supports it in all major browsers.
+# ============================================================================================
+
+import base64
+import gzip
+import html
+import io
+import zlib
+
+from contextlib import contextmanager
+from typing import Iterator, Optional, TextIO
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+# 'gzip'            : `.html.gz` file, for servers sending it with `Content-Encoding: gzip`.
+# 'self_extracting' : `.html` file, the gzip payload is decompressed by the browser.
+REPORT_COMPRESSIONS: list[str] = ['gzip', 'self_extracting']
+
+REPORT_COMPRESS_LEVEL: int = 6          # zlib level, the base64 images are not compressible anyway
+
+# Bytes of compressed data encoded to base64 at once (multiple of 3, no padding in between):
+_BASE64_BLOCK_SIZE: int = 3 * 2**16
+
+# Decompresses the payload with the browser `DecompressionStream` and replaces the document:
+SELF_EXTRACTING_SCRIPT: str = """
+(async function () {
+    var data   = atob(document.getElementById('report-payload').textContent);
+    var bytes  = new Uint8Array(data.length);
+    for (var i = 0; i < data.length; i++) {
+        bytes[i] = data.charCodeAt(i);
+    }
+    var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    var report = await new Response(stream).text();
+    document.open();
+    document.write(report);
+    document.close();
+})();
+"""
+
+SELF_EXTRACTING_HEAD: str = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>{title}</title>
+</head>
+<body>
+<noscript>This report is compressed, it needs JavaScript to be displayed.</noscript>
+<script id="report-payload" type="application/octet-stream">"""
+
+SELF_EXTRACTING_TAIL: str = """</script>
+<script>{script}</script>
+</body>
+</html>
+"""
+
+# --------------------------------------------------------------------------------------------
+#                                  COMPRESSED STREAMS:
+# --------------------------------------------------------------------------------------------
+
+@contextmanager
+def open_report_stream( file_path  : str,
+                        compression: Optional[str] = None,
+                        title      : str           = '',
+                            ) -> Iterator[TextIO]:
+    """
+    Opens the report file for writing as a text stream, compressing on the fly: every chunk
+    written by `ReportHTML.write_to_stream()` is compressed right away, the uncompressed html is
+    never held in memory.
+
+    Parameters
+    ----------
+    file_path : str
+        The report file path.
+    compression : str, optional
+        None (plain html), 'gzip' or 'self_extracting' (default is `None`).
+    title : str, optional
+        The title of the self-extracting bootstrap page (default is `''`).
+
+    Yields
+    ------
+    TextIO: The writable text stream.
+
+    Raises
+    ------
+    ValueError
+        If the compression is not supported.
+    """
+    _check_report_compression(compression)
+
+    if compression is None:
+        with open(file_path, 'w', encoding = 'utf-8') as file:
+            yield file
+
+    elif compression == 'gzip':
+        # no file name and mtime 0 in the gzip header, the same report gives the same file:
+        with open(file_path, 'wb') as raw_file, \
+             gzip.GzipFile(filename = '', mode = 'wb', fileobj = raw_file,
+                           compresslevel = REPORT_COMPRESS_LEVEL, mtime = 0) as gzip_file, \
+             io.TextIOWrapper(gzip_file, encoding = 'utf-8') as file:
+            yield file
+
+    else:
+        with open(file_path, 'w', encoding = 'utf-8') as file:
+            file.write(SELF_EXTRACTING_HEAD.format(title = html.escape(title)))
+            payload = GzipBase64Writer(file)
+            yield payload
+            payload.close()
+            file.write(SELF_EXTRACTING_TAIL.format(script = SELF_EXTRACTING_SCRIPT))
+
+# --------------------------------------------------------------------------------------------
+
+class GzipBase64Writer:
+    """
+    Text stream compressing the written text (utf-8) to gzip and writing it base64 encoded to
+    the target stream, in blocks.
+
+    Methods
+    -------
+    write(text) -> int
+        Compresses the text, returns the number of characters written.
+    close() -> None
+        Writes the rest of the compressed data, the target stream stays open.
+    """
+
+    def __init__(self, stream: TextIO, compress_level: int = REPORT_COMPRESS_LEVEL) -> None:
+        self._stream    : TextIO    = stream
+        self._compressor            = zlib.compressobj(compress_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self._pending   : bytearray = bytearray()
+
+    # --------------------------------------------------------------------------------------------
+
+    def write(self, text: str) -> int:
+        """
+        Compresses the text, the complete base64 blocks are written to the target stream.
+        """
+        self._pending += self._compressor.compress(text.encode('utf-8'))
+
+        if len(self._pending) >= _BASE64_BLOCK_SIZE:
+            size = len(self._pending) - len(self._pending) % 3
+            self._stream.write(base64.b64encode(self._pending[:size]).decode('ascii'))
+            del self._pending[:size]
+
+        return len(text)
+
+    # --------------------------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        Flushes the compressor and writes the remaining data (with the base64 padding).
+        """
+        self._pending += self._compressor.flush()
+        self._stream.write(base64.b64encode(self._pending).decode('ascii'))
+        self._pending = bytearray()
+
+# --------------------------------------------------------------------------------------------
+#                                  SUPPORTING FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _check_report_compression(compression: Optional[str]) -> None:
+    """
+    Raises a ValueError if the report compression is not supported (None is plain html).
+    """
+    if compression is not None and compression not in REPORT_COMPRESSIONS:
+        raise ValueError(f"Invalid report compression: '{compression}'. "
+                         f"Supported compressions: {REPORT_COMPRESSIONS} or None")
+
+# --------------------------------------------------------------------------------------------
+
+def get_report_file_format(file_format: str, compression: Optional[str] = None) -> str:
+    """
+    Returns the file format (extension) of the saved report: `.html.gz` for 'gzip'.
+    """
+    return file_format + '.gz' if compression == 'gzip' else file_format
+
+# ============================================================================================
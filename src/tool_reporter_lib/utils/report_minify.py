@@ -0,0 +1,298 @@
+# ============================================================================================
+#                        Reporter - HTML Minifier (streaming, single pass)
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Reporter - HTML Minifier'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# --------------------------------------------------------------------------------------------
+
+# --- TODO : ---------------------------------------------------------------------------------
+# - Minify the CSS of the style element (comments, spaces around `{};:`).
+# ============================================================================================
+
+import re
+
+from typing import Optional, TextIO
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+# Elements whose content is copied unchanged (whitespace is significant or not html):
+MINIFY_RAW_TAGS: tuple[str, ...] = ('pre', 'code', 'script', 'textarea')
+
+# The html whitespace characters (not the non-breaking space):
+_HTML_SPACE: str = ' \t\n\r\f'
+
+# A comment, the start of a raw element, or of an element with a `white-space: pre` style
+# (`pre-wrap`, `pre-line`, `break-spaces`), e.g. the text and console text elements:
+_SPECIAL_PATTERN = re.compile(r'<!--'
+                              r'|<(?P<raw>' + '|'.join(MINIFY_RAW_TAGS) + r')(?=[\s/>])'
+                              r'|<(?P<styled>[a-zA-Z][a-zA-Z0-9]*)(?=[\s/])[^>]*?white-space\s*:\s*(?:pre|break-spaces)', 
+                              re.IGNORECASE)
+
+# A complete start tag (quoted attribute values may contain '>'):
+_TAG_PATTERN = re.compile(r'''<[a-zA-Z][^>"']*(?:(?:"[^"]*"|'[^']*')[^>"']*)*>''')
+
+# The end tag of each raw element:
+_RAW_END_PATTERNS: dict[str, re.Pattern] = {tag: re.compile(rf'</{tag}[\s/>]', re.IGNORECASE) for tag in MINIFY_RAW_TAGS}
+
+# The start and end tags of the styled elements (nested ones are counted), by tag name:
+_STYLED_TAG_PATTERNS: dict[str, re.Pattern] = {}
+
+# Whitespace runs with a line break become one line break, other runs one space:
+_NEWLINE_SPACE_PATTERN = re.compile(r'[ \t\r\f]*\n[ \t\n\r\f]*')
+_SPACE_RUN_PATTERN     = re.compile(r'[ \t\r\f]{2,}')
+
+# A quoted attribute value with a whitespace run, kept unchanged:
+_QUOTED_SPACE_PATTERN  = re.compile(r'''=[ \t\n\r\f]*(?:"[^"]*?(?:\n|[ \t\r\f]{2})|'[^']*?(?:\n|[ \t\r\f]{2}))''')
+
+# Both in one pass, the quoted attribute values are matched first and kept (template r'\1\2\3'):
+_MINIFY_PATTERN  = re.compile(r'''(=[ \t\n\r\f]*"[^"]*"|=[ \t\n\r\f]*'[^']*')'''
+                              r'|[ \t\r\f]*(\n)[ \t\n\r\f]*'
+                              r'|([ \t\r\f])[ \t\r\f]+')
+_MINIFY_TEMPLATE: str = r'\1\2\3'
+
+# ============================================================================================
+#                                HTML MINIFIER CLASS
+# ============================================================================================
+
+class HtmlMinifier:
+    """
+    Streaming html minifier: `feed()` takes the document chunk by chunk and returns the
+    minified html that is complete so far, `close()` returns the rest. The result does not
+    depend on how the document is split into chunks.
+
+    In one pass over the text, every whitespace run becomes one line break (if it has one) or
+    one space, and the comments are removed. The content of the `MINIFY_RAW_TAGS` elements
+    (code blocks, scripts), of the elements styled `white-space: pre` (text and console text)
+    and the quoted attribute values are copied unchanged.
+    Only an unfinished tag, comment or whitespace run at the end of a chunk is kept for the
+    next one, so the memory is bounded by the largest tag, not by the document.
+
+    Methods
+    -------
+    feed(chunk) -> str
+        Minifies the chunk, returns the complete part of the output.
+    close() -> str
+        Returns the rest of the output, at the end of the document.
+    """
+
+    def __init__(self) -> None:
+        self._buffer : str           = ''       # the unfinished end of the last chunk
+        self._raw_tag: Optional[str] = None     # the raw element the buffer is inside of
+        self._depth  : int           = 0        # open styled elements, 0 in a raw tag element
+
+    # --------------------------------------------------------------------------------------------
+
+    def feed(self, chunk: str) -> str:
+        """
+        Minifies the next chunk of the document.
+
+        Returns
+        -------
+        str
+            The minified html that is complete so far (may be empty).
+        """
+        self._buffer += chunk
+        return self._minify(final = False)
+
+    # --------------------------------------------------------------------------------------------
+
+    def close(self) -> str:
+        """
+        Minifies what is left at the end of the document (an unfinished tag or comment is
+        copied unchanged).
+        """
+        res = self._minify(final = True)
+        self._raw_tag = None
+        self._depth   = 0
+        return res
+
+    # --------------------------------------------------------------------------------------------
+
+    def _minify(self, final: bool) -> str:
+        """
+        Minifies the buffer up to the last complete token and keeps the rest in the buffer.
+        """
+        buffer: str       = self._buffer
+        parts : list[str] = []
+        pos   : int       = 0
+
+        while pos < len(buffer):
+            # Raw element content, copied up to its end tag:
+            if self._raw_tag is not None:
+                end, found = self._find_raw_end(buffer, pos, final)
+                if not found:
+                    parts.append(buffer[pos:end])
+                    pos = end
+                    break
+
+                parts.append(buffer[pos:end])
+                pos           = end
+                self._raw_tag = None
+                continue
+
+            # Text and tags up to the next comment or raw element:
+            match = _SPECIAL_PATTERN.search(buffer, pos)
+            
+            if match is not None and match.lastgroup is None:
+                comment_end = buffer.find('-->', match.end())
+                if comment_end < 0 and not final:
+                    break
+                if comment_end >= 0:
+                    # cut out, the whitespace around it is one run:
+                    buffer = buffer[:match.start()] + buffer[comment_end + 3:]
+                    continue
+            
+            end = match.start() if match is not None else len(buffer)
+
+            if match is None and not final:
+                # keep the last tag (it may be unfinished, or a comment) and the whitespace before it:
+                end = buffer.rfind('<', pos)
+                end = end if end >= 0 else len(buffer)
+                while end > pos and buffer[end - 1] in _HTML_SPACE:
+                    end -= 1
+
+            parts.append(_minify_text(buffer[pos:end]))
+            pos = end
+
+            if match is None:
+                break
+
+            tag = _TAG_PATTERN.match(buffer, pos)
+            if tag is None:
+                break
+
+            parts.append(_minify_text(tag.group()))
+            pos = tag.end()
+            
+            if match.group('raw') is not None:
+                self._raw_tag = match.group('raw').lower()
+            else:
+                self._raw_tag = match.group('styled').lower()
+                self._depth   = 1
+
+        if final:
+            # an unfinished comment or tag at the end of the document:
+            parts.append(buffer[pos:])
+            pos = len(buffer)
+
+        self._buffer = buffer[pos:]
+        return ''.join(parts)
+
+    # --------------------------------------------------------------------------------------------
+
+    def _find_raw_end(self, buffer: str, pos: int, final: bool) -> tuple[int, bool]:
+        """
+        Finds the end tag of the raw element, in a styled element the nested elements of the
+        same tag are counted.
+
+        Returns
+        -------
+        tuple[int, bool]
+            The position of the end tag and True, or (not in the buffer) the end of the content
+            that can be copied (not what may be the start of a tag, not before a counted tag) and False.
+        """
+        copy_end: int = len(buffer) if final else max(pos, len(buffer) - len(self._raw_tag) - 2)
+
+        if self._depth == 0:
+            match = _RAW_END_PATTERNS[self._raw_tag].search(buffer, pos)
+            return (match.start(), True) if match is not None else (copy_end, False)
+
+        pattern = _STYLED_TAG_PATTERNS.get(self._raw_tag)
+        if pattern is None:
+            pattern = re.compile(rf'<(/?){self._raw_tag}(?=[\s/>])', re.IGNORECASE)
+            _STYLED_TAG_PATTERNS[self._raw_tag] = pattern
+
+        for match in pattern.finditer(buffer, pos):
+            self._depth += -1 if match.group(1) else 1
+            if self._depth == 0:
+                return match.start(), True
+            copy_end = max(copy_end, match.end())
+
+        return copy_end, False
+
+# ============================================================================================
+#                                MINIFYING STREAM
+# ============================================================================================
+
+class MinifyingStream:
+    """
+    Text stream minifying the html written to it (`HtmlMinifier`) into the target stream.
+    `finish()` must be called after the last write, it does not close the target stream.
+
+    Methods
+    -------
+    write(text) -> int
+        Minifies the text into the target stream, returns the number of characters taken.
+    finish() -> None
+        Writes the rest of the minified html.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream  : TextIO       = stream
+        self._minifier: HtmlMinifier = HtmlMinifier()
+
+    # --------------------------------------------------------------------------------------------
+
+    def write(self, text: str) -> int:
+        """
+        Minifies the text into the target stream.
+        """
+        minified = self._minifier.feed(text)
+        if minified:
+            self._stream.write(minified)
+        return len(text)
+
+    # --------------------------------------------------------------------------------------------
+
+    def finish(self) -> None:
+        """
+        Writes the rest of the minified html to the target stream.
+        """
+        minified = self._minifier.close()
+        if minified:
+            self._stream.write(minified)
+
+# --------------------------------------------------------------------------------------------
+#                                  MINIFY FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _minify_text(text: str) -> str:
+    """
+    Collapses the whitespace runs of html text and tags. The literal replacements run in C,
+    the template one (a Python call per match) only for text with quoted values to keep.
+    """
+    if _QUOTED_SPACE_PATTERN.search(text) is not None:
+        return _MINIFY_PATTERN.sub(_MINIFY_TEMPLATE, text)
+    return _SPACE_RUN_PATTERN.sub(' ', _NEWLINE_SPACE_PATTERN.sub('\n', text))
+
+# --------------------------------------------------------------------------------------------
+
+def minify_html(html_code: str) -> str:
+    """
+    Minifies a whole html document, see `HtmlMinifier`.
+
+    Parameters
+    ----------
+    html_code : str
+        The html code.
+
+    Returns
+    -------
+    str
+        The minified html code.
+
+    Example
+    -------
+    >>> minify_html('<div>\\n    <p>My  Text</p>\\n</div><!-- note --><pre>  a\\n  b</pre>')
+    '<div>\\n<p>My Text</p>\\n</div><pre>  a\\n  b</pre>'
+    """
+    minifier = HtmlMinifier()
+    return minifier.feed(html_code) + minifier.close()
+
+# ============================================================================================
@@ -0,0 +1,218 @@
+# ============================================================================================
+#                                  Reporter - Report Profiler
+# ============================================================================================
+
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
+_name_:           str = 'Reporter - Report Profiler'
+VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
+
+# --- VERSION HISTORY: -----------------------------------------------------------------------
+# v0.1.0 @ 2026-10-16 : Initial Release
+# --------------------------------------------------------------------------------------------
+
+# --- TODO : ---------------------------------------------------------------------------------
+# - Memory (tracemalloc) per element, optional.
+# ============================================================================================
+
+import time
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, TextIO
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from ..elements.report_element import ReportElement, ReportElementTypes
+
+# --- CONSTANTS: -----------------------------------------------------------------------------
+
+# Save phases, in the order they run ('chart_pool_join' is a part of 'html_assembly'):
+SAVE_PHASES: list[str] = ['collision_resolution', 'chart_pool_join', 'html_assembly', 'write', 'browser_open']
+
+# ============================================================================================
+#                                 REPORT PROFILER CLASS
+# ============================================================================================
+
+class ReportProfiler:
+    """
+    Records the build time and rendered size of every report element and the duration of the
+    save phases of one report. Used by `ReportHTML` when `Reports_Settings.use_profiling` is on,
+    without a profiler the report has no timing code in its path.
+
+    - Elements are timed when they are built: on `add_*` or, for deferred (lazy) elements and the
+      header, when they are rendered during the save (then also included in `html_assembly`).
+    - `html_assembly` is the time spent producing the html chunks, `write` the time spent in
+      `stream.write()`. Waiting for the charts of the render pool is also shown separately as
+      `chart_pool_join`.
+
+    Attributes
+    ----------
+    element_records : list[dict]
+        One record per built element: `type`, `seconds`, `bytes` (utf-8 size of body and style).
+    phase_seconds : dict[str, float]
+        Accumulated seconds per save phase.
+
+    Methods
+    -------
+    timed_builder(element_type, builder) -> Callable
+        Wraps an element builder, recording its time and output size.
+    phase(name)
+        Context manager accumulating the duration of a save phase.
+    write_chunks(chunks, stream) -> int
+        Writes the chunks to the stream, timing the chunk production and the writes separately.
+    summary() -> dict
+        Structured summary: per element type totals and the save phases.
+    to_dataframe() -> pd.DataFrame
+        All element records and phases as a DataFrame.
+    get_pv_data() -> dict
+        The summary as parameter-value pairs, for `add_param_value_table`.
+    """
+
+    def __init__(self) -> None:
+        self.element_records: list[dict]       = []
+        self.phase_seconds  : dict[str, float] = {}
+
+    # --------------------------------------------------------------------------------------------
+
+    def timed_builder(  self,
+                        element_type: 'ReportElementTypes',
+                        builder     : Callable[..., 'ReportElement'],
+                            ) -> Callable[..., 'ReportElement']:
+        """
+        Returns a builder with the same signature that records the build time and the size of
+        the built element.
+        """
+        def _timed_builder(*args, **kwargs) -> 'ReportElement':
+            t_start = time.perf_counter()
+            element = builder(*args, **kwargs)
+            seconds = time.perf_counter() - t_start
+            self.record_element(element_type, seconds, element)
+            return element
+
+        return _timed_builder
+
+    # --------------------------------------------------------------------------------------------
+
+    def record_element( self,
+                        element_type: 'ReportElementTypes',
+                        seconds     : float,
+                        element     : 'ReportElement',
+                            ) -> None:
+        """
+        Records one built element.
+        """
+        size = len(element.body_content.encode('utf-8')) + len(element.style_content.encode('utf-8'))
+        self.element_records.append({'type': element_type.name, 'seconds': seconds, 'bytes': size})
+
+    # --------------------------------------------------------------------------------------------
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Context manager adding the duration of the block to the save phase `name`.
+        """
+        t_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_phase_seconds(name, time.perf_counter() - t_start)
+
+    # --------------------------------------------------------------------------------------------
+
+    def write_chunks(self, chunks: Iterator[str], stream: TextIO) -> int:
+        """
+        Writes the chunks to the stream, timing the chunk production (`html_assembly`) and the
+        writes (`write`) separately.
+
+        Returns
+        -------
+        int: The number of characters written.
+        """
+        written: int   = 0
+        t_write: float = 0.0
+        t_start: float = time.perf_counter()
+
+        for chunk in chunks:
+            t_chunk  = time.perf_counter()
+            stream.write(chunk)
+            t_write += time.perf_counter() - t_chunk
+            written += len(chunk)
+
+        self._add_phase_seconds('html_assembly', time.perf_counter() - t_start - t_write)
+        self._add_phase_seconds('write', t_write)
+
+        return written
+
+    # --------------------------------------------------------------------------------------------
+
+    def summary(self) -> dict:
+        """
+        Returns the structured summary of the recorded data.
+
+        Returns
+        -------
+        dict
+            - `elements`: per element type `count`, `seconds` and `bytes`, in first build order.
+            - `phases`  : seconds per save phase (only the phases that ran).
+            - `elements_seconds`, `elements_bytes`, `phases_seconds`: totals (`phases_seconds`
+              without `chart_pool_join`, it is included in `html_assembly`).
+        """
+        elements: dict[str, dict] = {}
+
+        for record in self.element_records:
+            totals = elements.setdefault(record['type'], {'count': 0, 'seconds': 0.0, 'bytes': 0})
+            totals['count']   += 1
+            totals['seconds'] += record['seconds']
+            totals['bytes']   += record['bytes']
+
+        phases = {name: self.phase_seconds[name] for name in SAVE_PHASES if name in self.phase_seconds}
+
+        return {
+            'elements'        : elements,
+            'phases'          : phases,
+            'elements_seconds': sum(totals['seconds'] for totals in elements.values()),
+            'elements_bytes'  : sum(totals['bytes']   for totals in elements.values()),
+            'phases_seconds'  : sum(seconds for name, seconds in phases.items() if name != 'chart_pool_join'),
+        }
+
+    # --------------------------------------------------------------------------------------------
+
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """
+        Returns one row per element record (`stage` = 'element') and per save phase
+        (`stage` = 'save'), with the columns `stage`, `name`, `seconds` and `bytes`.
+        """
+        import pandas as pd
+
+        rows  = [{'stage': 'element', 'name': r['type'], 'seconds': r['seconds'], 'bytes': r['bytes']}
+                 for r in self.element_records]
+        rows += [{'stage': 'save', 'name': name, 'seconds': seconds, 'bytes': None}
+                 for name, seconds in self.summary()['phases'].items()]
+
+        return pd.DataFrame(rows, columns = ['stage', 'name', 'seconds', 'bytes'])
+
+    # --------------------------------------------------------------------------------------------
+
+    def get_pv_data(self) -> dict[str, str]:
+        """
+        Returns the summary as parameter-value pairs (time in ms, size in KB).
+        """
+        summary = self.summary()
+        res     = {}
+
+        for element_type, totals in summary['elements'].items():
+            res[f'{element_type} (x{totals["count"]})'] = (f'{totals["seconds"] * 1000:.1f} ms, '
+                                                           f'{totals["bytes"] / 1024:.1f} KB')
+        for name, seconds in summary['phases'].items():
+            res[f'save: {name}'] = f'{seconds * 1000:.1f} ms'
+
+        res['Elements total'] = f'{summary["elements_seconds"] * 1000:.1f} ms, {summary["elements_bytes"] / 1024:.1f} KB'
+        return res
+
+    # --------------------------------------------------------------------------------------------
+
+    def _add_phase_seconds(self, name: str, seconds: float) -> None:
+        """Accumulates the seconds of a save phase."""
+        self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + seconds
+
+# ============================================================================================
@@ -2,8 +2,8 @@
 #                                  Reporter - Reporter Settings
 # ============================================================================================
 
-__version__:      str = '0.0.6'
-__version_date__: str = '2024-08-21'
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_:           str = 'Reporter - Reporter Settings'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
@@ -11,6 +11,22 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 # v0.0.2 @ 2024-08-13 : Initial Release
 # v0.0.4 @ 2024-08-20 : Added annotations and improved documentation.
 # v0.0.6 @ 2024-08-21 : Updated heatmap settings and introduced header title background options.
+# v0.1.0 @ 2026-10-16 : Added parallel chart rendering settings.
+#                     : Added lazy element rendering setting.
+#                     : keyring is imported on first use, the default report path is activated on
+#                     : the first save (get_folder_path) instead of at package import.
+#                     : Added profiling setting.
+#                     : Added DataFrame table engine setting.
+#                     : Added DataFrame table size policy settings.
+#                     : Added chart format settings.
+#                     : Added image deduplication setting.
+#                     : Added report compression setting.
+#                     : Added offline code highlighting setting.
+#                     : Added CSS / JS tree shaking setting.
+#                     : Added element memory budget (disk-spilled element store) settings.
+#                     : Added html minification setting.
+#                     : The chart render executor defaults to 'process' ('thread' gives little speedup).
+#                     : Removed the chart render executor setting, charts are rendered in processes.
 # --------------------------------------------------------------------------------------------
 
 # --- TODO : ---------------------------------------------------------------------------------
@@ -18,9 +34,11 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 # - Handle various plot sizes and dynamic headers more efficiently.
 # ============================================================================================
 
-import keyring
 from typing import Optional
 
+# keyring (and its system backend) is imported on first use, see `_get_keyring()`:
+keyring = None
+
 # ============================================================================================
 #                                REPORT SETTINGS CLASS
 # ============================================================================================
@@ -51,10 +69,54 @@ class Reports_Settings:
         Percentage of the colormap to be used in heatmaps.
     df_min_col_amount_for_full_width : int
         Minimum column amount required for full-width tables.
+    df_table_engine : str
+        DataFrame table html renderer: 'fast' (default) or 'styler' (pandas Styler).
+    df_table_max_rows : Optional[int]
+        Maximum number of rows of a DataFrame table, `None` for no limit (default).
+    df_table_max_cells : Optional[int]
+        Maximum number of cells of a DataFrame table, `None` for no limit (default).
+    df_table_truncate_strategy : str
+        Rows shown above the limits: 'head_tail' (default), 'sample' or 'top_k'.
+    df_table_top_k_column : Optional[str]
+        Column sorting the rows of the 'top_k' strategy.
+    df_table_top_k_ascending : bool
+        'top_k' shows the smallest values instead of the largest.
     use_open_saved_file : bool
         Boolean flag to determine if the report file should be automatically opened after being saved.
     use_header_title_on_background : bool
         Boolean flag to determine if the header title should be displayed on a background.
+    use_lazy_elements : bool
+        Boolean flag to defer rendering of report elements until the report is saved.
+    chart_render_workers : int
+        Number of workers rendering charts in parallel, `0` renders charts immediately (serial).
+    chart_format : str
+        Default chart format: 'png' (default), 'jpeg', 'webp', 'svg' or 'auto'.
+    chart_png_compress_level : Optional[int]
+        PNG zlib compression level 0-9, `None` for the matplotlib default.
+    chart_png_palette_colors : Optional[int]
+        Number of PNG palette colors (2-256), `None` for RGBA PNGs (default).
+    chart_quality : int
+        JPEG and WebP quality 1-100.
+    chart_svg_simplify_threshold : Optional[float]
+        SVG path simplification threshold (0-1 pixels), `None` for the matplotlib default.
+    chart_size_budget : Optional[int]
+        Maximum chart size in bytes for the 'auto' format, `None` for the smallest encoding.
+    use_profiling : bool
+        Boolean flag to record element build times, sizes and save phases of new reports.
+    use_image_dedup : bool
+        Boolean flag to store repeated chart images of new reports once (asset table).
+    report_compression : Optional[str]
+        Compression of new saved reports: `None` (plain html, default), 'gzip' or 'self_extracting'.
+    use_offline_code_highlighting : bool
+        Boolean flag to highlight the code blocks of new reports in Python (no highlight.js CDN).
+    use_tree_shaking : bool
+        Boolean flag to emit only the CSS rules and scripts used by the element types of new reports.
+    use_minify_html : bool
+        Boolean flag to minify the html of new saved reports (preformatted content is kept).
+    element_memory_budget : Optional[int]
+        Characters of element bodies new reports keep in memory before spilling them to a temporary file, `None` keeps all (default).
+    element_spill_dir : Optional[str]
+        Folder of the temporary element file, `None` for the system temporary folder.
 
     Static Methods
     --------------
@@ -64,6 +126,8 @@ class Reports_Settings:
         Retrieve the default report folder path from the system keyring.
     activate_default_report_path() -> None
         Activate and set the default folder path for reports from the system keyring.
+    get_folder_path() -> str
+        Get the report folder path, activating the default path from the keyring on the first call.
     reset_default_report_path() -> None
         Reset the default report folder path by removing it from the system keyring.
     set_folder_path(folder_path: str) -> None
@@ -78,6 +142,46 @@ class Reports_Settings:
         Disable the use of a background for the report header title.
     enable_header_title_on_background() -> None
         Enable the use of a background for the report header title.
+    enable_lazy_elements() -> None
+        Defer rendering of report elements (except charts) until the report is saved.
+    disable_lazy_elements() -> None
+        Render report elements immediately when they are added (default).
+    enable_parallel_chart_rendering(workers: int = 4) -> None
+        Render charts in a pool of worker processes, the results are joined on save.
+    disable_parallel_chart_rendering() -> None
+        Render charts immediately when they are added (default).
+    set_chart_format(chart_format = 'png', png_compress_level = None, png_palette_colors = None, quality = 85, svg_simplify_threshold = None, size_budget = None) -> None
+        Set the default chart format and its encoding options.
+    set_df_table_engine(engine: str) -> None
+        Set the DataFrame table html renderer: 'fast' or 'styler'.
+    set_df_table_size_policy(max_rows = None, max_cells = None, strategy = 'head_tail', top_k_column = None, top_k_ascending = False) -> None
+        Limit the size of DataFrame tables, the omitted rows are noted in the table caption.
+    disable_df_table_size_policy() -> None
+        Show all rows of DataFrame tables (default).
+    enable_profiling() -> None
+        Record element build times, sizes and save phases of new reports.
+    disable_profiling() -> None
+        Disable the profiling of new reports (default).
+    enable_image_dedup() -> None
+        Store repeated chart images of new reports once, referenced by the `<img>` elements.
+    disable_image_dedup() -> None
+        Embed every chart image in its `<img>` element (default).
+    enable_offline_code_highlighting() -> None
+        Highlight the code blocks of new reports in Python, at build time (default).
+    disable_offline_code_highlighting() -> None
+        Highlight the code blocks of new reports with highlight.js from the CDN.
+    enable_tree_shaking() -> None
+        Emit only the CSS rules and scripts used by the element types of new reports (default).
+    disable_tree_shaking() -> None
+        Emit the whole stylesheet and the show / hide script in every new report.
+    enable_minify_html() -> None
+        Minify the html of new saved reports in one pass while it is written.
+    disable_minify_html() -> None
+        Save the html of new reports as it is rendered (default).
+    set_element_memory_budget(memory_budget: Optional[int] = None, spill_dir: Optional[str] = None) -> None
+        Spill the rendered element bodies of new reports to a temporary file over the memory budget.
+    set_report_compression(compression: Optional[str] = None) -> None
+        Set the compression of new saved reports: None, 'gzip' or 'self_extracting'.
     info() -> None
         Print the current configuration of report settings.
     """
@@ -87,6 +191,9 @@ class Reports_Settings:
     _report_file_name : str = 'report'
     _file_format      : str = '.html'
 
+    # The default report path is looked up in the keyring once, on the first save:
+    _default_report_path_activated: bool = False
+
     # Keyring service details for storing report folder path
     __SERVICE_NAME      : str = 'info_tool_lib'
     __REPORTS_FOLDER_KEY: str = 'reports_folder_keyring'
@@ -98,10 +205,42 @@ class Reports_Settings:
     df_heatmap_colormap_name         : str           = 'coolwarm'
     df_heatmap_used_clr_pcnt         : float         = 0.6
     df_min_col_amount_for_full_width : int           = 8
+    df_table_engine                  : str           = 'fast'
+
+    # DataFrame table size policy (None = no limit)
+    df_table_max_rows         : Optional[int] = None
+    df_table_max_cells        : Optional[int] = None
+    df_table_truncate_strategy: str           = 'head_tail'
+    df_table_top_k_column     : Optional[str] = None
+    df_table_top_k_ascending  : bool          = False
 
     # Boolean settings for report behavior
     use_open_saved_file           : bool = True
     use_header_title_on_background: bool = True
+    use_lazy_elements             : bool = False
+    use_profiling                 : bool = False
+    use_image_dedup               : bool = False
+    use_offline_code_highlighting : bool = True
+    use_tree_shaking              : bool = True
+    use_minify_html               : bool = False
+
+    # Saved report compression (None = plain html)
+    report_compression: Optional[str] = None
+
+    # Rendered element bodies kept in memory before spilling to a temporary file (None = all)
+    element_memory_budget: Optional[int] = None
+    element_spill_dir    : Optional[str] = None
+
+    # Parallel chart rendering (0 workers = serial)
+    chart_render_workers: int = 0
+
+    # Chart format and encoding options
+    chart_format                : str             = 'png'
+    chart_png_compress_level    : Optional[int]   = None
+    chart_png_palette_colors    : Optional[int]   = None
+    chart_quality               : int             = 85
+    chart_svg_simplify_threshold: Optional[float] = None
+    chart_size_budget           : Optional[int]   = None
 
     # --------------------------------------------------------------------------------------------
     #                                PATH SETTING METHODS
@@ -120,7 +259,8 @@ class Reports_Settings:
         if not folder_path.endswith('\\'):
             folder_path += '\\'
         Reports_Settings._folder_path = folder_path
-        keyring.set_password(Reports_Settings.__SERVICE_NAME, Reports_Settings.__REPORTS_FOLDER_KEY, folder_path)
+        Reports_Settings._default_report_path_activated = True
+        _get_keyring().set_password(Reports_Settings.__SERVICE_NAME, Reports_Settings.__REPORTS_FOLDER_KEY, folder_path)
 
     # --------------------------------------------------------------------------------------------
 
@@ -134,7 +274,7 @@ class Reports_Settings:
         str
             The default folder path, or an empty string if not set.
         """
-        folder_path = keyring.get_password(Reports_Settings.__SERVICE_NAME, Reports_Settings.__REPORTS_FOLDER_KEY)
+        folder_path = _get_keyring().get_password(Reports_Settings.__SERVICE_NAME, Reports_Settings.__REPORTS_FOLDER_KEY)
         return folder_path if folder_path is not None else ''
 
     # --------------------------------------------------------------------------------------------
@@ -144,6 +284,7 @@ class Reports_Settings:
         """
         Activate the default folder path by setting it from the value stored in the system keyring.
         """
+        Reports_Settings._default_report_path_activated = True
         try:
             new_path = Reports_Settings.get_default_report_path()
             if new_path:
@@ -158,7 +299,7 @@ class Reports_Settings:
         """
         Reset the default folder path by removing it from the system keyring.
         """
-        keyring.delete_password(Reports_Settings.__SERVICE_NAME, Reports_Settings.__REPORTS_FOLDER_KEY)
+        _get_keyring().delete_password(Reports_Settings.__SERVICE_NAME, Reports_Settings.__REPORTS_FOLDER_KEY)
 
     # --------------------------------------------------------------------------------------------
 
@@ -173,6 +314,24 @@ class Reports_Settings:
             The folder path to be used for saving reports.
         """
         Reports_Settings._folder_path = folder_path
+        Reports_Settings._default_report_path_activated = True
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def get_folder_path() -> str:
+        """
+        Get the folder path for saving reports. On the first call the default folder path is
+        activated from the system keyring (unless a folder path was set before).
+        
+        Returns
+        -------
+        str
+            The folder path for saving reports.
+        """
+        if not Reports_Settings._default_report_path_activated:
+            Reports_Settings.activate_default_report_path()
+        return Reports_Settings._folder_path
 
     # --------------------------------------------------------------------------------------------
 
@@ -228,6 +387,370 @@ class Reports_Settings:
         """
         Reports_Settings.use_header_title_on_background = True
 
+    # --------------------------------------------------------------------------------------------
+    #                              LAZY ELEMENT RENDERING SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def enable_lazy_elements() -> None:
+        """
+        Defer rendering of report elements until the report is saved. Elements removed from 
+        the report before saving are never rendered. Charts are always rendered when added.
+
+        ⚠️ The element inputs (DataFrames, dicts, lists) are kept by reference until the report
+        is saved, so they should not be modified in the meantime.
+        """
+        Reports_Settings.use_lazy_elements = True
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def disable_lazy_elements() -> None:
+        """
+        Render report elements immediately when they are added to the report (default).
+        """
+        Reports_Settings.use_lazy_elements = False
+
+    # --------------------------------------------------------------------------------------------
+    #                            PARALLEL CHART RENDERING SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def enable_parallel_chart_rendering(workers: int = 4) -> None:
+        """
+        Render charts in a pool of worker processes. `add_chart` pickles the figure (it can be
+        reused right away), the PNG rasterization runs in the pool on several CPU cores and the
+        results are joined in document order on save.
+        
+        Parameters
+        ----------
+        workers : int, optional
+            Number of workers (default is `4`).
+        """
+        Reports_Settings.chart_render_workers = workers
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def disable_parallel_chart_rendering() -> None:
+        """
+        Render charts immediately when they are added to the report (default).
+        """
+        Reports_Settings.chart_render_workers = 0
+
+    # --------------------------------------------------------------------------------------------
+    #                                  CHART FORMAT SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def set_chart_format(   chart_format          : str             = 'png',
+                            png_compress_level    : Optional[int]   = None,
+                            png_palette_colors    : Optional[int]   = None,
+                            quality               : int             = 85,
+                            svg_simplify_threshold: Optional[float] = None,
+                            size_budget           : Optional[int]   = None,
+                                ) -> None:
+        """
+        Set the default format of the charts added by `add_chart` / `add_plot` and its encoding
+        options (the defaults restore the PNG charts).
+        
+        Parameters
+        ----------
+        chart_format : str, optional
+            'png'  - lossless (default).
+            'jpeg' - lossy, no transparency.
+            'webp' - lossy with transparency.
+            'svg'  - vector, inlined in the html. Small for line charts, large for dense scatter plots.
+            'auto' - the first of svg, png, webp, jpeg within `size_budget`, else the smallest one.
+        png_compress_level : int, optional
+            PNG zlib compression level 0-9 (default is `None`, matplotlib default).
+        png_palette_colors : int, optional
+            Quantize PNGs to a palette of 2-256 colors (default is `None`, RGBA).
+        quality : int, optional
+            JPEG and WebP quality 1-100 (default is `85`).
+        svg_simplify_threshold : float, optional
+            SVG path simplification threshold, 0-1 pixels (default is `None`, matplotlib default).
+        size_budget : int, optional
+            Maximum chart size in bytes for 'auto' (default is `None`, the smallest encoding).
+            
+        Raises
+        ------
+        ValueError
+            If the format or an option is not supported.
+        
+        Example
+        -------
+        >>> Reports_Settings.set_chart_format('auto', png_palette_colors = 64, size_budget = 100_000)
+        """
+        from ..elements.report_element_chart import _check_chart_format_options
+        
+        _check_chart_format_options(chart_format, png_compress_level, png_palette_colors, quality, 
+                                    svg_simplify_threshold, size_budget)
+        
+        Reports_Settings.chart_format                 = chart_format
+        Reports_Settings.chart_png_compress_level     = png_compress_level
+        Reports_Settings.chart_png_palette_colors     = png_palette_colors
+        Reports_Settings.chart_quality                = quality
+        Reports_Settings.chart_svg_simplify_threshold = svg_simplify_threshold
+        Reports_Settings.chart_size_budget            = size_budget
+
+    # --------------------------------------------------------------------------------------------
+    #                                DATAFRAME TABLE SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def set_df_table_engine(engine: str) -> None:
+        """
+        Set the html renderer of the DataFrame tables.
+        
+        Parameters
+        ----------
+        engine : str
+            'fast'   - the table markup is written directly, heatmap colors as inline styles (default).
+            'styler' - pandas `Styler`, one css rule per highlighted cell (slow for large tables).
+            
+        Raises
+        ------
+        ValueError
+            If the engine is not supported.
+        """
+        from ..elements.report_element_table_df import DF_TABLE_ENGINES
+        
+        if engine not in DF_TABLE_ENGINES:
+            raise ValueError(f"Invalid DataFrame table engine: '{engine}'. Supported engines: {DF_TABLE_ENGINES}")
+        Reports_Settings.df_table_engine = engine
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def set_df_table_size_policy(   max_rows       : Optional[int] = None,
+                                    max_cells      : Optional[int] = None,
+                                    strategy       : str           = 'head_tail',
+                                    top_k_column   : Optional[str] = None,
+                                    top_k_ascending: bool          = False,
+                                        ) -> None:
+        """
+        Limit the size of the DataFrame tables added by `add_dataframe_table`. Tables above the
+        limits show only the rows selected by the strategy, the heatmap range is still computed
+        on the full columns and the table caption shows the number of omitted rows.
+        
+        Parameters
+        ----------
+        max_rows : int, optional
+            Maximum number of rows (default is `None`, no limit).
+        max_cells : int, optional
+            Maximum number of cells, rows x columns (default is `None`, no limit).
+        strategy : str, optional
+            'head_tail' - the first and the last rows (default).
+            'sample'    - a uniform random sample (fixed seed), in the original order.
+            'top_k'     - the top rows by `top_k_column`.
+        top_k_column : str, optional
+            Column sorting the rows of the 'top_k' strategy (default is `None`).
+        top_k_ascending : bool, optional
+            'top_k' shows the smallest values instead of the largest (default is `False`).
+            
+        Raises
+        ------
+        ValueError
+            If the strategy is not supported, or 'top_k' has no column.
+        
+        Example
+        -------
+        >>> Reports_Settings.set_df_table_size_policy(max_rows = 1000, max_cells = 50_000)
+        """
+        from ..elements.report_element_table_df import _check_truncate_strategy
+        
+        _check_truncate_strategy(strategy, top_k_column)
+        
+        Reports_Settings.df_table_max_rows          = max_rows
+        Reports_Settings.df_table_max_cells         = max_cells
+        Reports_Settings.df_table_truncate_strategy = strategy
+        Reports_Settings.df_table_top_k_column      = top_k_column
+        Reports_Settings.df_table_top_k_ascending   = top_k_ascending
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def disable_df_table_size_policy() -> None:
+        """
+        Show all rows of the DataFrame tables (default).
+        """
+        Reports_Settings.df_table_max_rows  = None
+        Reports_Settings.df_table_max_cells = None
+
+    # --------------------------------------------------------------------------------------------
+    #                                  PROFILING SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def enable_profiling() -> None:
+        """
+        Record the element build times, rendered sizes and save phases of the reports created
+        afterwards, see `ReportHTML.get_profile_summary()` and `ReportHTML.add_profile_table()`.
+        """
+        Reports_Settings.use_profiling = True
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def disable_profiling() -> None:
+        """
+        Disable the profiling of the reports created afterwards (default).
+        """
+        Reports_Settings.use_profiling = False
+
+    # --------------------------------------------------------------------------------------------
+    #                               IMAGE DEDUPLICATION SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def enable_image_dedup() -> None:
+        """
+        Store every unique chart image of the reports created afterwards once: the images are
+        hashed when added, repeated images are written once to an asset table at the end of the
+        document and their `<img>` elements get the source from it (requires JavaScript to view).
+        Images used once are embedded as before. Inline SVG charts are not deduplicated.
+        """
+        Reports_Settings.use_image_dedup = True
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def disable_image_dedup() -> None:
+        """
+        Embed every chart image in its own `<img>` element (default).
+        """
+        Reports_Settings.use_image_dedup = False
+
+    # --------------------------------------------------------------------------------------------
+    #                                 CODE HIGHLIGHTING SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def enable_offline_code_highlighting() -> None:
+        """
+        Highlight the code blocks of the reports created afterwards when they are added, in Python
+        (default): the report opens without network access and without JavaScript.
+        """
+        Reports_Settings.use_offline_code_highlighting = True
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def disable_offline_code_highlighting() -> None:
+        """
+        Highlight the code blocks of the reports created afterwards in the browser, with
+        highlight.js loaded from the CDN (only reports with code blocks load it).
+        """
+        Reports_Settings.use_offline_code_highlighting = False
+
+    # --------------------------------------------------------------------------------------------
+    #                                  TREE SHAKING SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def enable_tree_shaking() -> None:
+        """
+        Emit only the CSS rule groups and the scripts used by the element types of the reports
+        created afterwards (default), see `report_style.ELEMENT_CSS_GROUPS`. Reports with `OTHER`
+        elements get the whole stylesheet.
+        """
+        Reports_Settings.use_tree_shaking = True
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def disable_tree_shaking() -> None:
+        """
+        Emit the whole stylesheet and the show / hide script in the reports created afterwards,
+        e.g. for custom html using the report CSS classes.
+        """
+        Reports_Settings.use_tree_shaking = False
+
+    # --------------------------------------------------------------------------------------------
+    #                                  HTML MINIFY SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def enable_minify_html() -> None:
+        """
+        Minify the html of the reports created afterwards while it is saved: whitespace runs
+        become one space or line break and comments are removed, in one streaming pass. The
+        content of pre, code, script, textarea and `white-space: pre` styled elements (text,
+        console text) and the attribute values is kept.
+        """
+        Reports_Settings.use_minify_html = True
+
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def disable_minify_html() -> None:
+        """
+        Save the html of the reports created afterwards as it is rendered (default).
+        """
+        Reports_Settings.use_minify_html = False
+
+    # --------------------------------------------------------------------------------------------
+    #                                ELEMENT MEMORY SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def set_element_memory_budget(  memory_budget: Optional[int] = None,
+                                    spill_dir    : Optional[str] = None,
+                                        ) -> None:
+        """
+        Set the memory budget of the element bodies of the reports created afterwards, for
+        reports growing over a long run: once the bodies added since the last spill exceed the
+        budget, the rendered elements are moved to an anonymous temporary file and read back
+        sequentially when the report is saved, see `report_element_store.ElementSpillStore`.
+
+        Parameters
+        ----------
+        memory_budget : int, optional
+            Characters of element bodies kept in memory, e.g. `64 * 2**20`. None keeps all
+            elements in memory (default).
+        spill_dir : str, optional
+            Folder of the temporary file (default is `None`, the system temporary folder).
+
+        Raises
+        ------
+        ValueError
+            If the memory budget is negative.
+        """
+        if memory_budget is not None and memory_budget < 0:
+            raise ValueError(f"Invalid element memory budget: {memory_budget}. Must be >= 0 or None")
+
+        Reports_Settings.element_memory_budget = memory_budget
+        Reports_Settings.element_spill_dir     = spill_dir
+
+    # --------------------------------------------------------------------------------------------
+    #                                REPORT COMPRESSION SETTINGS
+    # --------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def set_report_compression(compression: Optional[str] = None) -> None:
+        """
+        Set the compression of the reports created afterwards, used by `save()`.
+        
+        Parameters
+        ----------
+        compression : str, optional
+            None              - plain html (default).
+            'gzip'            - `.html.gz` file, for web servers sending it with `Content-Encoding: gzip`.
+            'self_extracting' - one `.html` file with the gzip compressed report, decompressed by the
+                                browser (`DecompressionStream`, needs JavaScript). For sharing by mail
+                                or chat, where the file size is limited.
+            
+        Raises
+        ------
+        ValueError
+            If the compression is not supported.
+        """
+        from .report_compression import _check_report_compression
+        
+        _check_report_compression(compression)
+        Reports_Settings.report_compression = compression
+
     # --------------------------------------------------------------------------------------------
     #                                   REPORT INFO METHOD
     # --------------------------------------------------------------------------------------------
@@ -245,5 +768,31 @@ class Reports_Settings:
         print(f'+ File Format:         {Reports_Settings._file_format}')
         print(f'+ Use Open Saved File: {Reports_Settings.use_open_saved_file}')
         print(f'+ Use Header Title:    {Reports_Settings.use_header_title_on_background}')
+        print(f'+ Use Lazy Elements:   {Reports_Settings.use_lazy_elements}')
+        print(f'+ Chart Workers:       {Reports_Settings.chart_render_workers}')
+        print(f'+ Chart Format:        {Reports_Settings.chart_format} (size budget: {Reports_Settings.chart_size_budget})')
+        print(f'+ Use Profiling:       {Reports_Settings.use_profiling}')
+        print(f'+ Use Image Dedup:     {Reports_Settings.use_image_dedup}')
+        print(f'+ Report Compression:  {Reports_Settings.report_compression}')
+        print(f'+ Offline Code Style:  {Reports_Settings.use_offline_code_highlighting}')
+        print(f'+ Use Tree Shaking:    {Reports_Settings.use_tree_shaking}')
+        print(f'+ Use Minify HTML:     {Reports_Settings.use_minify_html}')
+        print(f'+ Element Memory:      {Reports_Settings.element_memory_budget} (spill dir: {Reports_Settings.element_spill_dir})')
+        print(f'+ DF Table Engine:     {Reports_Settings.df_table_engine}')
+        print(f'+ DF Table Max Rows:   {Reports_Settings.df_table_max_rows} '
+              f'(max cells: {Reports_Settings.df_table_max_cells}, {Reports_Settings.df_table_truncate_strategy})')
+
+# --------------------------------------------------------------------------------------------
+#                                  SUPPORTING FUNCTIONS:
+# --------------------------------------------------------------------------------------------
+
+def _get_keyring():
+    """
+    Returns the `keyring` module, importing it on the first call (slow, loads the system backend).
+    """
+    global keyring
+    if keyring is None:
+        import keyring
+    return keyring
 
 # ============================================================================================
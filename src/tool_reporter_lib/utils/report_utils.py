@@ -2,8 +2,8 @@
 #                                  Reporter - Utils Functions
 # ============================================================================================
 
-__version__:      str = '0.0.9'
-__version_date__: str = '2024-10-20'
+__version__:      str = '0.1.0'
+__version_date__: str = '2026-10-16'
 _name_:           str = 'Reporter - Utils Functions'
 VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date__}'
 
@@ -11,14 +11,26 @@ VERSION:          str = f'{_name_:<20} VERSION: {__version__} @ {__version_date_
 # v0.0.2 @ 2024-08-13 : Initial Release
 # v0.0.3 @ 2024-08-21 : Added utility functions for filename sanitization and date-time retrieval.
 # v0.0.9 @ 2024-10-20 : Added HTML code cleaner to minimize file size by removing comments, tabs, and excess spaces.
+# v0.1.0 @ 2026-10-16 : Added claim_unique_file_name(): one folder scan and atomic exclusive create
+#                     : instead of one os.path.exists() per taken (NNNN) index.
+#                     : get_clean_HTML_code() refers to the streaming minifier (report_minify) for reports.
+#                     : Added clear_file_index_cache() (indexes of files deleted outside the process).
 # --------------------------------------------------------------------------------------------
 
 # --- TODO : ---------------------------------------------------------------------------------
-# - Need to fix get clean HTML code function to handle script tags and other special cases.
+# - get_clean_HTML_code() changes script and pre content, reports use report_minify.minify_html().
 # ============================================================================================
 
+import os
 import re
+import threading
 from datetime import datetime
+from typing import Optional
+
+# --- FILENAME INDEX CACHE: ------------------------------------------------------------------
+# Highest claimed (NNNN) index per (folder, name prefix, file format), shared by the process:
+_file_index_cache: dict[tuple[str, str, str], int] = {}
+_file_index_cache_lock: threading.Lock = threading.Lock()
 
 # --------------------------------------------------------------------------------------------
 #                                   UTILITY FUNCTIONS:
@@ -86,6 +98,117 @@ def update_filename(filename_old: str) -> str:
 
 # --------------------------------------------------------------------------------------------
 
+def claim_unique_file_name( folder_path: str,
+                            file_name  : str,
+                            file_format: str = '.html',
+                                ) -> str:
+    """
+    Finds a free file name in the folder and claims it by creating the (empty) file atomically,
+    so concurrent writers (threads or processes) never get the same file.
+
+    The names follow `update_filename()`: `file_name` if it is free, otherwise `file_name_(NNNN)`
+    (or the next index, if `file_name` already ends with `(NNNN)`). The folder is scanned once for the
+    highest used index, later calls continue from a per-folder index cache, so the cost does not
+    grow with the amount of reports in the folder. Unlike the step by step search, gaps left by
+    deleted files are not reused (until `clear_file_index_cache()`).
+
+    Parameters
+    ----------
+    folder_path : str
+        The folder of the file, it must exist.
+    file_name : str
+        The wanted file name, without the file format.
+    file_format : str, optional
+        The file format (extension), default is `'.html'`.
+
+    Returns
+    -------
+    str
+        The claimed file name, without the file format. The file exists (empty) on return.
+    
+    Example
+    -------
+    >>> claim_unique_file_name('C:/Reports', 'report')   # 'report.html' and 'report_(0007).html' exist
+    'report_(0008)'
+    """
+    if _create_file_exclusive(os.path.join(folder_path, file_name + file_format)):
+        return file_name
+
+    match = re.search(r"\((\d{4,})\)$", file_name)
+    if match:
+        prefix, index = file_name[:match.start()], int(match.group(1)) + 1
+    else:
+        prefix, index = f"{file_name}_", 1
+
+    key = (os.path.abspath(folder_path), prefix, file_format)
+
+    with _file_index_cache_lock:
+        if key not in _file_index_cache:
+            _file_index_cache[key] = _scan_highest_file_index(folder_path, prefix, file_format)
+        index = max(index, _file_index_cache[key] + 1)
+
+    # Normally the first attempt succeeds, only files created by other processes are skipped:
+    while not _create_file_exclusive(os.path.join(folder_path, f"{prefix}({index:04d}){file_format}")):
+        index += 1
+
+    with _file_index_cache_lock:
+        _file_index_cache[key] = max(_file_index_cache.get(key, 0), index)
+
+    return f"{prefix}({index:04d})"
+
+# --------------------------------------------------------------------------------------------
+
+def _scan_highest_file_index(folder_path: str, prefix: str, file_format: str) -> int:
+    """Returns the highest NNNN of the `prefix(NNNN)file_format` files in the folder, 0 if none."""
+    pattern = re.compile(rf"{re.escape(prefix)}\((\d{{4,}})\){re.escape(file_format)}")
+    highest = 0
+
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            match = pattern.fullmatch(entry.name)
+            if match:
+                highest = max(highest, int(match.group(1)))
+
+    return highest
+
+# --------------------------------------------------------------------------------------------
+
+def _create_file_exclusive(file_path: str) -> bool:
+    """Creates an empty file, returns False if it already exists (atomic, O_EXCL)."""
+    try:
+        os.close(os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+    return True
+
+# --------------------------------------------------------------------------------------------
+
+def clear_file_index_cache(folder_path: Optional[str] = None) -> None:
+    """
+    Removes the cached highest (NNNN) indexes of `claim_unique_file_name()`, of one folder or of
+    all folders (None). The next claim scans the folder again, so the indexes of files deleted
+    outside the process are used again.
+
+    Parameters
+    ----------
+    folder_path : str, optional
+        The folder, None for all folders (default is `None`).
+
+    Example
+    -------
+    >>> clear_file_index_cache('C:/Reports')     # after cleaning up the folder
+    """
+    with _file_index_cache_lock:
+        if folder_path is None:
+            _file_index_cache.clear()
+            return
+
+        folder_path = os.path.abspath(folder_path)
+        for key in [key for key in _file_index_cache if key[0] == folder_path]:
+            del _file_index_cache[key]
+
+# --------------------------------------------------------------------------------------------
+
 def get_current_datetime() -> str:
     """
     Get the current date and time formatted as a string with milliseconds.
@@ -109,6 +232,10 @@ def get_clean_HTML_code(html_code: str) -> str:
     Cleans and minifies the given HTML code by removing unnecessary comments, spaces, tabs, and 
     newlines to reduce the size of the final HTML file.
 
+    The content of `<script>` and `<pre>` elements is changed too, and the spaces around tags
+    are removed. For reports use `report_minify.minify_html()` (single pass, streaming, keeps
+    pre / code / script / textarea content), or `save(minify = True)`.
+
     Parameters
     ----------
     html_code : str
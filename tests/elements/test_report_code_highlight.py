@@ -0,0 +1,50 @@
+import unittest
+from tool_reporter_lib.elements import report_code_highlight
+from tool_reporter_lib.elements.report_code_highlight import highlight_python_code, clear_code_highlight_cache
+
+class TestHighlightPythonCode(unittest.TestCase):
+
+    def setUp(self):
+        clear_code_highlight_cache()
+
+    def test_tokens(self):
+        code: str = ('@functools.cache\n'
+                     'def f(a = 1):\n'
+                     '    return len("x")  # comment\n'
+                     'class A: value = None\n')
+        res = highlight_python_code(code)
+        
+        self.assertIn('<span class="hljs-meta">@</span><span class="hljs-meta">functools</span>', res)
+        self.assertIn('<span class="hljs-keyword">def</span> <span class="hljs-title function_">f</span>', res)
+        self.assertIn('<span class="hljs-number">1</span>', res)
+        self.assertIn('<span class="hljs-built_in">len</span>(<span class="hljs-string">"x"</span>)', res)
+        self.assertIn('<span class="hljs-comment"># comment</span>', res)
+        self.assertIn('<span class="hljs-title class_">A</span>', res)
+        self.assertIn('<span class="hljs-literal">None</span>', res)
+
+    def test_text_is_unchanged(self):
+        code: str = 'x = [a @ b for a in c]  \\\n    + "<&>"\n\n'
+        res = highlight_python_code(code)
+        
+        self.assertNotIn('hljs-meta', res)  # matrix multiplication, not a decorator
+        text = res.replace('</span>', '')
+        while '<span' in text:
+            start = text.index('<span')
+            text  = text[:start] + text[text.index('>', start) + 1:]
+        self.assertEqual(text, code.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;'))
+
+    def test_invalid_code_is_escaped(self):
+        code: str = 'def broken(:\n  "<b>'
+        self.assertEqual(highlight_python_code(code), 'def broken(:\n  "&lt;b&gt;')
+
+    def test_cache(self):
+        code: str = 'x = 1'
+        res = highlight_python_code(code)
+        self.assertIs(highlight_python_code(code), res)
+        self.assertEqual(len(report_code_highlight._code_highlight_cache), 1)
+        
+        clear_code_highlight_cache()
+        self.assertEqual(len(report_code_highlight._code_highlight_cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -57,6 +57,12 @@ class TestReportElement(unittest.TestCase):
         self.assertEqual(element.body_content, '')
         self.assertEqual(element.style_content, '')
 
+    def test_slots_no_instance_dict(self):
+        element = ReportElement()
+        self.assertFalse(hasattr(element, '__dict__'))
+        with self.assertRaises(AttributeError):
+            element.unknown_attribute = 1
+
     def test_str_representation(self):
         element = ReportElement()
         self.assertEqual(str(element), 'ReportElement: \tnone')
@@ -75,5 +81,55 @@ class TestReportElement(unittest.TestCase):
         element.body_content = 'body content'
         self.assertEqual(element.get_body_str(), 'body content')
 
+class TestDeferredReportElement(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+
+    def _builder(self, text, suffix=''):
+        self.calls += 1
+        element = ReportElement()
+        element.type = ReportElementTypes.TEXT
+        element.body_content = text + suffix
+        element.style_content = 'style'
+        return element
+
+    def test_not_rendered_until_used(self):
+        element = ReportElement.deferred(ReportElementTypes.TEXT, self._builder, 'body', suffix='!')
+        self.assertFalse(element.is_rendered)
+        self.assertEqual(element.type, ReportElementTypes.TEXT)
+        self.assertEqual(self.calls, 0)
+        self.assertEqual(element.get_body_str(), 'body!')
+        self.assertTrue(element.is_rendered)
+
+    def test_rendered_once(self):
+        element = ReportElement.deferred(ReportElementTypes.TEXT, self._builder, 'body')
+        element.get_style_str()
+        element.get_body_str()
+        element.render()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(element.get_style_str(), 'style')
+
+    def test_set_body_on_deferred(self):
+        element = ReportElement.deferred(ReportElementTypes.TEXT, self._builder, 'body')
+        element.body_content = 'new body'
+        self.assertEqual(element.get_body_str(), 'new body')
+        self.assertEqual(element.get_style_str(), 'style')
+
+    def test_transient_body_not_kept(self):
+        element = ReportElement.deferred(ReportElementTypes.TEXT, self._builder, 'body')
+        self.assertEqual(element.get_style_str(), '')
+        self.assertEqual(element.get_transient_body_str(), 'body')
+        self.assertEqual(element.get_transient_body_str(), 'body')
+        self.assertFalse(element.is_rendered)
+        self.assertEqual(self.calls, 2)
+
+    def test_transient_body_of_styled_type(self):
+        element = ReportElement.deferred(ReportElementTypes.HEAD_TITLE_ON_BACKGROUND, self._builder, 'body')
+        self.assertEqual(element.get_transient_body_str(), 'body')
+        self.assertTrue(element.is_rendered)
+        self.assertEqual(element.get_style_str(), 'style')
+        self.assertEqual(self.calls, 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,8 +1,19 @@
+import base64
+import io
+import re
 import unittest
-from tool_reporter_lib.elements.report_element_chart import get_chart_element
+from tool_reporter_lib.elements.report_element_chart import (
+    get_chart_base64,
+    get_chart_element,
+    get_chart_element_from_asset,
+    get_chart_image,
+    get_chart_image_bytes,
+)
 from tool_reporter_lib.elements.report_element import ReportElement, ReportElementTypes
 
 import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
 
 class TestGetChartElement(unittest.TestCase):
 
@@ -33,5 +44,105 @@ class TestGetChartElement(unittest.TestCase):
         element = get_chart_element(self.fig, use_transparent_plots=False)
         self.assertIn('data:image/png;base64,', element.body_content)
 
+class TestGetChartImage(unittest.TestCase):
+
+    def setUp(self):
+        self.fig, self.ax = plt.subplots()
+        self.ax.plot(np.cumsum(np.random.default_rng(0).normal(size=2000)))
+
+    def tearDown(self):
+        plt.close('all')
+
+    def _open(self, data):
+        return Image.open(io.BytesIO(base64.b64decode(data)))
+
+    def test_default_png_matches_base64(self):
+        self.assertEqual(get_chart_image(self.fig), ('png', get_chart_base64(self.fig)))
+
+    def test_png_compress_level(self):
+        _, level_0 = get_chart_image(self.fig, png_compress_level=0)
+        _, level_9 = get_chart_image(self.fig, png_compress_level=9)
+        self.assertLess(len(level_9), len(level_0))
+        self.assertEqual(self._open(level_0).tobytes(), self._open(level_9).tobytes())
+
+    def test_png_palette(self):
+        image_format, data = get_chart_image(self.fig, png_palette_colors=16)
+        image = self._open(data)
+        self.assertEqual(image_format, 'png')
+        self.assertEqual(image.mode, 'P')
+        self.assertIn('transparency', image.info)
+        self.assertLessEqual(len(image.getcolors()), 16)
+
+    def test_jpeg_and_webp(self):
+        for chart_format, pil_format in [('jpeg', 'JPEG'), ('webp', 'WEBP')]:
+            low  = self._open(get_chart_image(self.fig, chart_format=chart_format, quality=20)[1])
+            high = get_chart_image(self.fig, chart_format=chart_format, quality=95)[1]
+            self.assertEqual(low.format, pil_format)
+            self.assertEqual(low.size, self._open(get_chart_base64(self.fig)).size)
+            self.assertLess(len(get_chart_image(self.fig, chart_format=chart_format, quality=20)[1]), len(high))
+
+    def test_svg_simplification(self):
+        image_format, svg = get_chart_image(self.fig, chart_format='svg')
+        _, simplified     = get_chart_image(self.fig, chart_format='svg', svg_simplify_threshold=1.0)
+        self.assertEqual(image_format, 'svg')
+        self.assertTrue(svg.startswith('<svg'))
+        self.assertNotIn('<dc:date>', svg)
+        self.assertLess(len(simplified), len(svg))
+        self.assertEqual(plt.rcParams['path.simplify_threshold'], plt.rcParamsDefault['path.simplify_threshold'])
+
+    def test_svg_ids(self):
+        svg   = get_chart_image(self.fig, chart_format='svg')[1]
+        other = plt.figure()
+        plt.plot([1, 0])
+        other_svg = get_chart_image(other, chart_format='svg')[1]
+        plt.close(other)
+        ids = set(re.findall(r'\bid="([^"]+)"', svg))
+        self.assertEqual(svg, get_chart_image(self.fig, chart_format='svg')[1])
+        self.assertTrue(set(re.findall(r'(?:url\(#|href="#)([^")]+)', svg)) <= ids)
+        self.assertFalse(ids & set(re.findall(r'\bid="([^"]+)"', other_svg)))
+
+    def test_auto_size_budget(self):
+        sizes = {chart_format: len(get_chart_image(self.fig, chart_format=chart_format)[1])
+                 for chart_format in ['svg', 'png', 'webp', 'jpeg']}
+        self.assertEqual(get_chart_image(self.fig, chart_format='auto')[0], min(sizes, key=sizes.get))
+        self.assertEqual(get_chart_image(self.fig, chart_format='auto', size_budget=10**9)[0], 'svg')
+        self.assertEqual(get_chart_image(self.fig, chart_format='auto', size_budget=sizes['png'])[0], 'png')
+        self.assertEqual(get_chart_image(self.fig, chart_format='auto', size_budget=1)[0], min(sizes, key=sizes.get))
+
+    def test_invalid_options(self):
+        for kwargs in [{'chart_format': 'gif'}, {'png_compress_level': 10}, {'png_palette_colors': 1},
+                       {'quality': 0}, {'svg_simplify_threshold': 2.0}, {'size_budget': 0}]:
+            with self.assertRaises(ValueError):
+                get_chart_image(self.fig, **kwargs)
+
+    def test_element_formats(self):
+        element = get_chart_element(self.fig, chart_format='webp')
+        self.assertIn('data:image/webp;base64,', element.body_content)
+        element = get_chart_element(self.fig, chart_format='jpeg')
+        self.assertIn('data:image/jpeg;base64,', element.body_content)
+
+    def test_image_bytes(self):
+        for chart_format in ['png', 'webp', 'auto']:
+            image_format, data = get_chart_image(self.fig, chart_format=chart_format)
+            self.assertEqual(get_chart_image_bytes(self.fig, chart_format=chart_format),
+                             (image_format, base64.b64decode(data)))
+        self.assertEqual(get_chart_image_bytes(self.fig, chart_format='svg')[1][:4], b'<svg')
+
+    def test_element_from_asset(self):
+        element = get_chart_element_from_asset('abc123', use_fullwidth=True, width=300)
+        self.assertEqual(element.type, ReportElementTypes.CHART)
+        self.assertIn('data-asset="abc123"', element.body_content)
+        self.assertIn('width="300"', element.body_content)
+        self.assertNotIn('src=', element.body_content)
+
+    def test_element_inline_svg(self):
+        element = get_chart_element(self.fig, chart_format='svg', heigth=400, width=600)
+        root_tag = element.body_content[element.body_content.index('<svg'):].split('>', 1)[0]
+        self.assertNotIn('<img', element.body_content)
+        self.assertIn('class="graph-item"', root_tag)
+        self.assertIn('width="600"', root_tag)
+        self.assertIn('height="400"', root_tag)
+        self.assertNotIn('pt"', root_tag)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -31,5 +31,13 @@ class TestGetCodeElement(unittest.TestCase):
         self.assertTrue(element.body_content.startswith('<div class="grid_12">'))
         self.assertTrue(element.body_content.endswith('</div>'))
 
+    def test_code_with_highlighting(self):
+        code: str = 'if a < b: pass'
+        element = get_code_element(code, use_highlighting=True)
+        
+        self.assertEqual(element.type, ReportElementTypes.CODE)
+        self.assertIn('<pre><code class="python hljs"><span class="hljs-keyword">if</span> a &lt; b: '
+                      '<span class="hljs-keyword">pass</span></code></pre>', element.body_content)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
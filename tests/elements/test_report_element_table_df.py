@@ -1,4 +1,6 @@
+import re
 import unittest
+import numpy as np
 import pandas as pd
 from tool_reporter_lib.elements.report_element_table_df import get_table_dataframe_element
 from tool_reporter_lib.elements.report_element import ReportElement, ReportElementTypes
@@ -70,10 +72,160 @@ class TestReportElementTableDF(unittest.TestCase):
             "grid_12 div should not be added.",
         )
 
+    def test_invalid_engine(self):
+        """Test if an unsupported engine raises a ValueError."""
+        with self.assertRaises(ValueError):
+            get_table_dataframe_element(self.df, engine="unknown")
+
+
+class TestReportElementTableDFFastEngine(unittest.TestCase):
+    """
+    Unit tests for the 'fast' engine of `get_table_dataframe_element`, compared with the 'styler' engine.
+    """
+
+    def setUp(self):
+        """Set up a DataFrame with float, int, str and NaN values."""
+        self.df = pd.DataFrame(
+            {
+                "A": [0.123456, -1.5, 2.25, np.nan, 4.0],
+                "B": [1, 2, 3, 4, 5],
+                "C": ["x", "y", "z", "w", "v"],
+                "D": [5.5, np.nan, 3.25, 2.0, 1.0],
+            }
+        )
+
+    @staticmethod
+    def _cell_texts(html):
+        return re.findall(r"<t[dh][^>]*>([^<]*)</t[dh]>", html)
+
+    @staticmethod
+    def _fast_cell_colors(html):
+        return re.findall(r'<td style="background-color: (#\w+)">', html)
+
+    @staticmethod
+    def _styler_cell_colors(html):
+        colors = {}
+        for selectors, color in re.findall(r"([^{}]+)\{\s*background-color: (#\w+);", html):
+            for selector in selectors.split(","):
+                match = re.search(r"row(\d+)_col(\d+)", selector)
+                colors[(int(match[1]), int(match[2]))] = color
+        return [colors[key] for key in sorted(colors)]
+
+    def test_default_engine_is_fast(self):
+        """Test if the default engine does not use the Styler (no per-cell ids)."""
+        html = get_table_dataframe_element(self.df).body_content
+        self.assertIn('<table class="minimalistic-style-table">', html)
+        self.assertNotIn("<style", html)
+
+    def test_cell_texts_equal_styler(self):
+        """Test if both engines produce the same header, index and cell texts."""
+        for round_digits in (-1, 0, 2):
+            fast   = get_table_dataframe_element(self.df, round=round_digits, engine="fast").body_content
+            styler = get_table_dataframe_element(self.df, round=round_digits, engine="styler").body_content
+            self.assertEqual(self._cell_texts(fast), self._cell_texts(styler))
+
+    def test_rounding_and_na_rep(self):
+        """Test if rounded float columns use the given digits and '-' for NaN."""
+        html = get_table_dataframe_element(self.df, round=2, engine="fast").body_content
+        self.assertIn("<td>0.12</td>", html)
+        self.assertIn("<td>-</td>", html)
+        self.assertIn("<td>3</td>", html)
+
+    def test_named_axes_equal_styler(self):
+        """Test if the index and columns names are rendered like the Styler."""
+        df = self.df.copy()
+        df.index.name = "idx"
+        df.columns.name = "cols"
+        fast   = get_table_dataframe_element(df, engine="fast").body_content
+        styler = get_table_dataframe_element(df, engine="styler").body_content
+        self.assertEqual(self._cell_texts(fast), self._cell_texts(styler))
+
+    def test_heatmap_colors_equal_styler(self):
+        """Test if the inline heatmap colors are the Styler cell colors."""
+        fast   = get_table_dataframe_element(self.df, highlight_columns=["A", "D"], round=2, engine="fast").body_content
+        styler = get_table_dataframe_element(self.df, highlight_columns=["A", "D"], round=2, engine="styler").body_content
+        self.assertEqual(len(self._fast_cell_colors(fast)), 10)
+        self.assertEqual(self._fast_cell_colors(fast), self._styler_cell_colors(styler))
+
+    def test_multiindex_falls_back_to_styler(self):
+        """Test if a DataFrame with a MultiIndex is rendered by the Styler."""
+        df = self.df.copy()
+        df.index = pd.MultiIndex.from_tuples([("a", i) for i in range(len(df))])
+        html = get_table_dataframe_element(df, engine="fast").body_content
+        self.assertIn('<table id="T_', html)
+
 
 
     
 
 
+class TestReportElementTableDFSizePolicy(unittest.TestCase):
+    """
+    Unit tests for the size policy (max_rows / max_cells) of `get_table_dataframe_element`.
+    """
+
+    def setUp(self):
+        """Set up a DataFrame of 100 rows."""
+        self.df = pd.DataFrame({"A": np.arange(100.0), "B": np.arange(100)[::-1] % 7})
+
+    @staticmethod
+    def _row_labels(html):
+        return [int(label) for label in re.findall(r'row_heading level0[^>]*>\s*(\d+)', html)]
+
+    def test_no_limit_by_default(self):
+        """Test if all rows are shown without a limit, with no caption."""
+        html = get_table_dataframe_element(self.df).body_content
+        self.assertEqual(len(self._row_labels(html)), 100)
+        self.assertNotIn("<caption>", html)
+
+    def test_head_tail(self):
+        """Test if 'head_tail' shows the first and the last rows, and notes the omitted rows."""
+        for engine in ("fast", "styler"):
+            html = get_table_dataframe_element(self.df, max_rows=5, engine=engine).body_content
+            self.assertEqual(self._row_labels(html), [0, 1, 2, 98, 99])
+            self.assertIn("95 rows omitted", html)
+
+    def test_max_cells(self):
+        """Test if max_cells limits the rows to max_cells // columns."""
+        html = get_table_dataframe_element(self.df, max_cells=20).body_content
+        self.assertEqual(len(self._row_labels(html)), 10)
+        self.assertIn("90 rows omitted", html)
+
+    def test_sample_is_reproducible_and_ordered(self):
+        """Test if 'sample' shows the same sorted rows on every call."""
+        first = get_table_dataframe_element(self.df, max_rows=10, truncate_strategy="sample").body_content
+        second = get_table_dataframe_element(self.df, max_rows=10, truncate_strategy="sample").body_content
+        labels = self._row_labels(first)
+        self.assertEqual(first, second)
+        self.assertEqual(len(labels), 10)
+        self.assertEqual(labels, sorted(labels))
+
+    def test_top_k(self):
+        """Test if 'top_k' shows the rows with the largest (or smallest) values of the column."""
+        html = get_table_dataframe_element(self.df, max_rows=3, truncate_strategy="top_k", top_k_column="A").body_content
+        self.assertEqual(self._row_labels(html), [99, 98, 97])
+
+        html = get_table_dataframe_element(
+            self.df, max_rows=3, truncate_strategy="top_k", top_k_column="A", top_k_ascending=True
+        ).body_content
+        self.assertEqual(self._row_labels(html), [0, 1, 2])
+
+    def test_heatmap_range_of_full_column(self):
+        """Test if the heatmap colors of the shown rows use the min / max of the full column."""
+        full = get_table_dataframe_element(self.df, highlight_columns=["A"]).body_content
+        head_tail = get_table_dataframe_element(self.df, highlight_columns=["A"], max_rows=4).body_content
+        colors = re.findall(r"background-color: (#\w+)", full)
+        self.assertEqual(re.findall(r"background-color: (#\w+)", head_tail), colors[:2] + colors[-2:])
+
+    def test_invalid_strategy(self):
+        """Test if an unsupported strategy, or 'top_k' without a valid column, raises a ValueError."""
+        with self.assertRaises(ValueError):
+            get_table_dataframe_element(self.df, max_rows=5, truncate_strategy="unknown")
+        with self.assertRaises(ValueError):
+            get_table_dataframe_element(self.df, max_rows=5, truncate_strategy="top_k")
+        with self.assertRaises(ValueError):
+            get_table_dataframe_element(self.df, max_rows=5, truncate_strategy="top_k", top_k_column="Z")
+
+
 if __name__ == "__main__":
     unittest.main()
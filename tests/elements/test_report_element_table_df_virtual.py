@@ -0,0 +1,154 @@
+import json
+import re
+import shutil
+import subprocess
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from tool_reporter_lib.elements.report_element import ReportElement, ReportElementTypes
+from tool_reporter_lib.elements.report_element_table_df import get_table_dataframe_element
+from tool_reporter_lib.elements.report_element_table_df_virtual import (
+    VIRTUAL_TABLE_SCRIPT,
+    get_table_dataframe_virtual_element,
+)
+
+# Runs VIRTUAL_TABLE_SCRIPT on one table with a minimal DOM, prints the rendered rows and spacers:
+_NODE_HARNESS = """
+const input  = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+const spacer = () => ({ rows: [{ cells: [{ style: {} }] }] });
+const bodies = [spacer(), { innerHTML: '', rows: [] }, spacer()];
+const box    = {
+    scrollTop: input.scroll_top, clientHeight: input.client_height,
+    querySelector: () => ({ textContent: input.json }),
+    querySelectorAll: () => bodies,
+    addEventListener: () => {},
+};
+global.window   = { requestAnimationFrame: () => 0 };
+global.document = { querySelectorAll: () => [box] };
+eval(input.script);
+console.log(JSON.stringify({ rows: bodies[1].innerHTML, top: bodies[0].rows[0].cells[0].style.height,
+                             bottom: bodies[2].rows[0].cells[0].style.height }));
+"""
+
+
+def _get_json_data(html):
+    return re.search(r'<script type="application/json">(.*?)</script>', html, re.S).group(1)
+
+
+def _get_fast_rows(html):
+    return re.findall(r"<tr><th class=\"row_heading level0\">.*?</tr>", html)
+
+
+class TestReportElementTableDFVirtual(unittest.TestCase):
+    """
+    Unit tests for the `get_table_dataframe_virtual_element` function.
+    """
+
+    def setUp(self):
+        """Set up a DataFrame with float, int, str, bool and NaN values."""
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame(
+            {
+                "A": rng.normal(size=100),
+                "B": np.arange(100),
+                "C": [f"text {i}" for i in range(100)],
+                "D": rng.normal(size=100) * 1000,
+                "E": [i % 2 == 0 for i in range(100)],
+            }
+        )
+        self.df.loc[3, "A"] = np.nan
+        self.df.loc[5, "D"] = -0.0001
+
+    def test_report_element_type(self):
+        """Test if the element type is DFTABLE_VIRTUAL."""
+        element = get_table_dataframe_virtual_element(self.df)
+        self.assertIsInstance(element, ReportElement)
+        self.assertEqual(element.type, ReportElementTypes.DFTABLE_VIRTUAL)
+
+    def test_columnar_json(self):
+        """Test if the data is embedded as columnar JSON, with rounded numbers and RangeIndex as start / step."""
+        element = get_table_dataframe_virtual_element(self.df, highlight_columns=["A"], round=2)
+        data = json.loads(_get_json_data(element.body_content))
+
+        self.assertEqual(data["rows"], 100)
+        self.assertEqual((data["index_start"], data["index_step"]), (0, 1))
+        self.assertNotIn("index", data)
+        self.assertEqual(data["columns"][0]["digits"], 2)
+        self.assertIsNone(data["columns"][0]["values"][3])
+        self.assertEqual(data["columns"][0]["na"], "-")
+        self.assertEqual(data["columns"][1]["values"][:3], [0, 1, 2])
+        self.assertEqual(data["columns"][2]["texts"][0], "text 0")
+        self.assertEqual(len(data["columns"][0]["heat"]), 2)
+        self.assertIn("lut", data)
+        self.assertNotIn("row_heading", element.body_content)
+
+    def test_script_close_tag_is_escaped(self):
+        """Test if cell texts can not close the JSON script element."""
+        df = pd.DataFrame({"A": ["</script><b>x</b>"]})
+        html = get_table_dataframe_virtual_element(df).body_content
+        self.assertEqual(html.count("</script>"), 1)
+        self.assertEqual(json.loads(_get_json_data(html))["columns"][0]["texts"][0], "</script><b>x</b>")
+
+    def test_multiindex_falls_back_to_static_table(self):
+        """Test if a DataFrame with a MultiIndex is rendered as a static table."""
+        df = self.df.copy()
+        df.index = pd.MultiIndex.from_tuples([("a", i) for i in range(len(df))])
+        element = get_table_dataframe_virtual_element(df)
+        self.assertEqual(element.type, ReportElementTypes.DFTABLE)
+
+    @unittest.skipUnless(shutil.which("node"), "node is not installed")
+    def test_rendered_rows_equal_fast_engine(self):
+        """Test if the browser-rendered rows are the 'fast' engine rows (texts and heatmap colors)."""
+        for round_digits in (-1, 2):
+            virtual = get_table_dataframe_virtual_element(self.df, ["A", "B", "D"], round=round_digits).body_content
+            fast = get_table_dataframe_element(self.df, ["A", "B", "D"], round=round_digits, engine="fast").body_content
+
+            rendered = self._render(virtual, scroll_top=0, client_height=25 * 42)
+            rows = _get_fast_rows(rendered["rows"])
+
+            self.assertEqual(len(rows), 45)
+            self.assertEqual(rows, _get_fast_rows(fast)[:45])
+            self.assertEqual(rendered["top"], "0px")
+
+    @unittest.skipUnless(shutil.which("node"), "node is not installed")
+    def test_rendered_window_follows_scroll(self):
+        """Test if only the rows of the scrolled window are rendered, starting on an even row."""
+        virtual = get_table_dataframe_virtual_element(self.df).body_content
+        fast = get_table_dataframe_element(self.df, engine="fast").body_content
+
+        rendered = self._render(virtual, scroll_top=50 * 42, client_height=10 * 42)
+        rows = _get_fast_rows(rendered["rows"])
+
+        self.assertEqual(rows, _get_fast_rows(fast)[40:85])
+        self.assertEqual(rendered["top"], f"{40 * 42}px")
+        self.assertEqual(rendered["bottom"], f"{15 * 42}px")
+
+    @unittest.skipUnless(shutil.which("node"), "node is not installed")
+    def test_scaled_scroll_reaches_last_row(self):
+        """Test if tables taller than the browser limit map the scroll position to the row index."""
+        rows = 250_000
+        virtual = get_table_dataframe_virtual_element(pd.DataFrame({"A": np.arange(rows)})).body_content
+
+        rendered = self._render(virtual, scroll_top=8_000_000 - 10 * 42, client_height=10 * 42)
+        labels = re.findall(r'<th class="row_heading level0">(\d+)</th>', rendered["rows"])
+
+        self.assertEqual(labels[-1], str(rows - 1))
+        self.assertEqual(int(labels[0]) % 2, 0)
+
+    def _render(self, html, scroll_top, client_height):
+        payload = json.dumps(
+            {
+                "script": VIRTUAL_TABLE_SCRIPT,
+                "json": _get_json_data(html),
+                "scroll_top": scroll_top,
+                "client_height": client_height,
+            }
+        )
+        res = subprocess.run(["node", "-e", _NODE_HARNESS], input=payload, capture_output=True, text=True, check=True)
+        return json.loads(res.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
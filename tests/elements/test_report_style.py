@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import patch, mock_open
 import os
 from tool_reporter_lib.elements.report_style import get_css_file_path, clean_css_content, get_css_content, validate_css_structure
+from tool_reporter_lib.elements.report_style import ELEMENT_CSS_GROUPS, _split_css_groups
+from tool_reporter_lib.elements.report_element import ReportElementTypes
 
 class TestReportStyle(unittest.TestCase):
     
@@ -35,5 +37,28 @@ class TestReportStyle(unittest.TestCase):
         self.assertTrue(validate_css_structure(valid_css_content))
         self.assertFalse(validate_css_structure(invalid_css_content))
 
+    def test_split_css_groups(self):
+        css_content = """
+        body { margin: 0; }
+        /* @group chart */
+        .graph { width: 100%; }
+        /* @group base */
+        img { border: 0; }
+        """
+        segments = _split_css_groups(css_content)
+        self.assertEqual(segments, [('base', 'body {margin: 0;}'), ('chart', '.graph {width: 100%;}'), ('base', 'img {border: 0;}')])
+        self.assertEqual(''.join(rules for _, rules in segments), clean_css_content(css_content))
+
+    def test_get_css_content_for_element_types(self):
+        full_css = get_css_content()
+        text_css = get_css_content([ReportElementTypes.STYLE, ReportElementTypes.TEXT])
+        
+        self.assertEqual(get_css_content(ELEMENT_CSS_GROUPS.keys()), full_css)
+        self.assertIn('.grid_12', text_css)
+        self.assertNotIn('.graph-item', text_css)
+        self.assertNotIn('.minimalistic-style-table', text_css)
+        self.assertIn('.graph-item', get_css_content([ReportElementTypes.TEXT, ReportElementTypes.CHART]))
+        self.assertEqual(get_css_content([ReportElementTypes.OTHER]), full_css)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+from tool_reporter_lib.elements.report_template_cache import (
+    ReportTemplate,
+    get_cached_template,
+    get_cached_file_content,
+    clear_template_cache,
+    get_template_cache_info,
+)
+from tool_reporter_lib.elements.report_element_header_title import clean_css_content
+from tool_reporter_lib.elements.report_style import clean_css_content as clean_report_css_content
+
+
+class TestReportTemplate(unittest.TestCase):
+
+    def test_render(self):
+        template = ReportTemplate('a {{x}} b {{y}} c')
+        self.assertEqual(template.render({'x': 1, 'y': 'two'}), 'a 1 b two c')
+
+    def test_render_keeps_unknown_placeholders(self):
+        template = ReportTemplate('{{x}} and {{unknown}}')
+        self.assertEqual(template.render({'x': 'value'}), 'value and {{unknown}}')
+
+    def test_render_with_clean_func_equals_clean_after_render(self):
+        content = '<h1 class="title">{{title}}</h1>\n\t<div>{{sub}}</div>'
+        params  = {'title': 'Main Title', 'sub': '<h2 class="subtitle">Sub Title</h2>'}
+
+        expected = content
+        for key, value in params.items():
+            expected = expected.replace(f'{{{{{key}}}}}', value)
+        expected = clean_css_content(expected)
+
+        self.assertEqual(ReportTemplate(content, clean_css_content).render(params), expected)
+
+
+class TestTemplateCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_template_cache()
+        handle, self.file_path = tempfile.mkstemp(suffix = '.css')
+        with os.fdopen(handle, 'w') as file:
+            file.write('body {  color: {{color}}; }')
+
+    def tearDown(self):
+        os.remove(self.file_path)
+        clear_template_cache()
+
+    def test_file_read_once(self):
+        first  = get_cached_template(self.file_path)
+        second = get_cached_template(self.file_path)
+
+        self.assertIs(first, second)
+        info = get_template_cache_info()
+        self.assertEqual(info['misses'], 1)
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['size'], 1)
+
+    def test_clean_func_is_part_of_key(self):
+        raw     = get_cached_file_content(self.file_path)
+        cleaned = get_cached_file_content(self.file_path, clean_report_css_content)
+
+        self.assertEqual(raw, 'body {  color: {{color}}; }')
+        self.assertEqual(cleaned, 'body {color: {{color}};}')
+        self.assertEqual(get_template_cache_info()['size'], 2)
+
+    def test_invalidated_on_file_change(self):
+        self.assertIn('color', get_cached_file_content(self.file_path))
+
+        with open(self.file_path, 'w') as file:
+            file.write('p { margin: 0; }')
+        stat = os.stat(self.file_path)
+        os.utime(self.file_path, ns = (stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(get_cached_file_content(self.file_path), 'p { margin: 0; }')
+        self.assertEqual(get_template_cache_info()['misses'], 2)
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            get_cached_template(self.file_path + '.missing')
+
+if __name__ == '__main__':
+    unittest.main()
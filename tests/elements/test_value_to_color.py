@@ -1,8 +1,12 @@
 import unittest
+import unittest.mock
 import numpy as np
 from matplotlib.colors import Colormap
 from matplotlib import pyplot as plt
-from tool_reporter_lib.elements.value_to_color import generate_hex_colors_list, value_to_color, VIRIDIS_COLOR_MAP
+from tool_reporter_lib.elements import value_to_color as value_to_color_module
+from tool_reporter_lib.elements.value_to_color import (
+    generate_hex_colors_list, value_to_color, values_to_colors, VIRIDIS_COLOR_MAP,
+    get_colormap_lut, prewarm_colormap_luts, clear_colormap_lut_cache, get_colormap_lut_cache_info)
 
 class TestValueToColorFunctions(unittest.TestCase):
 
@@ -48,5 +52,57 @@ class TestValueToColorFunctions(unittest.TestCase):
         color = value_to_color(1, 0, 1)
         self.assertTrue(isinstance(color, str) and color.startswith('#'))
 
+    def test_values_to_colors_matches_value_to_color(self):
+        values = np.array([-1.0, 0.0, 0.13, 0.5, 0.77, 1.0, 2.0, np.nan])
+        colors = values_to_colors(values, 0, 1, colormap_name='coolwarm', nan_color='#00ff00', used_palette_part=0.6)
+        expected = [value_to_color(v, 0, 1, 'coolwarm', '#00ff00', 0.6) for v in values]
+        self.assertEqual(list(colors), expected)
+
+    def test_values_to_colors_int_values(self):
+        colors = values_to_colors(np.arange(5), 0, 4)
+        self.assertEqual(list(colors), [value_to_color(v, 0, 4) for v in range(5)])
+
+    def test_values_to_colors_equal_min_max(self):
+        with np.errstate(all='raise'):
+            colors = values_to_colors(np.array([2.0, 2.0, np.nan]), 2.0, 2.0, nan_color='#00ff00')
+        self.assertEqual(list(colors), ['#00ff00'] * 3)
+        self.assertEqual(value_to_color(2.0, 2.0, 2.0, nan_color='#00ff00'), '#00ff00')
+        self.assertEqual(value_to_color(3.0, 2.0, 2.0), value_to_color(1.0, 0, 1))
+
+class TestColormapLUTCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_colormap_lut_cache()
+
+    def test_lut_is_cached(self):
+        lut = get_colormap_lut('coolwarm', 0.6)
+        self.assertIs(get_colormap_lut('coolwarm', 0.6), lut)
+        info = get_colormap_lut_cache_info()
+        self.assertEqual((info['hits'], info['misses'], info['size']), (1, 1, 1))
+
+    def test_lut_matches_colormap(self):
+        lut = get_colormap_lut('viridis', 1.0)
+        self.assertEqual(lut.lookup_value(0.5), value_to_color(0.5, 0, 1, 'viridis', used_palette_part=1.0))
+        self.assertEqual(len(lut.hex_colors), VIRIDIS_COLOR_MAP.N)
+
+    def test_lut_resolution(self):
+        lut = get_colormap_lut('viridis', 1.0, resolution=16)
+        self.assertEqual(lut.resolution, 16)
+        self.assertEqual(len(lut.hex_colors), 16)
+
+    def test_prewarm(self):
+        prewarm_colormap_luts(['coolwarm', 'viridis'], [0.6])
+        self.assertEqual(get_colormap_lut_cache_info()['size'], 2)
+        value_to_color(0.5, 0, 1, 'coolwarm', used_palette_part=0.6)
+        self.assertEqual(get_colormap_lut_cache_info()['misses'], 2)
+
+    def test_bounded_eviction(self):
+        with unittest.mock.patch.object(value_to_color_module, 'COLORMAP_LUT_CACHE_MAX_SIZE', 2):
+            first = get_colormap_lut('viridis', 0.2)
+            get_colormap_lut('viridis', 0.3)
+            get_colormap_lut('viridis', 0.4)
+            self.assertEqual(get_colormap_lut_cache_info()['size'], 2)
+            self.assertIsNot(get_colormap_lut('viridis', 0.2), first)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,9 +1,22 @@
+import base64
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open
 from tool_reporter_lib.report_favicon.fav_icon import _get_base64_favicon, FALLBACK_FAVICON_BASE64, FAVICON_BASE64_PATH
+from tool_reporter_lib.report_favicon.fav_icon import set_custom_favicon, reset_favicon, FAVICON_BASE64_PREFIX
+
+# Smallest valid PNG (1x1 transparent), reused from the fallback favicon:
+PNG_BYTES = base64.b64decode(FALLBACK_FAVICON_BASE64[len(FAVICON_BASE64_PREFIX):])
 
 class TestFavIcon(unittest.TestCase):
 
+    def setUp(self):
+        reset_favicon()
+
+    def tearDown(self):
+        reset_favicon()
+
     @patch('builtins.open', new_callable=mock_open, read_data='data:image/png;base64,example_base64_data')
     def test_get_base64_favicon_file_exists(self, mock_file):
         # Test when the favicon file exists and contains data
@@ -18,5 +31,35 @@ class TestFavIcon(unittest.TestCase):
         self.assertEqual(result, FALLBACK_FAVICON_BASE64)
         mock_file.assert_called_once_with(FAVICON_BASE64_PATH, 'r')
 
+    @patch('builtins.open', new_callable=mock_open, read_data='data:image/png;base64,example_base64_data')
+    def test_get_base64_favicon_memoized(self, mock_file):
+        # The file is read only on the first call
+        self.assertEqual(_get_base64_favicon(), _get_base64_favicon())
+        mock_file.assert_called_once_with(FAVICON_BASE64_PATH, 'r')
+
+    def test_set_custom_favicon_from_bytes(self):
+        set_custom_favicon(PNG_BYTES)
+        self.assertEqual(_get_base64_favicon(), FALLBACK_FAVICON_BASE64)
+
+    def test_set_custom_favicon_from_path(self):
+        handle, file_path = tempfile.mkstemp(suffix = '.png')
+        with os.fdopen(handle, 'wb') as file:
+            file.write(PNG_BYTES)
+        try:
+            set_custom_favicon(file_path)
+        finally:
+            os.remove(file_path)
+        self.assertEqual(_get_base64_favicon(), FALLBACK_FAVICON_BASE64)
+
+    def test_set_custom_favicon_invalid(self):
+        with self.assertRaises(ValueError):
+            set_custom_favicon(b'not a png image')
+
+    def test_reset_favicon(self):
+        default = _get_base64_favicon()
+        set_custom_favicon(PNG_BYTES)
+        reset_favicon()
+        self.assertEqual(_get_base64_favicon(), default)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import tool_reporter_lib
+
+SRC_PATH = os.path.dirname(os.path.dirname(os.path.abspath(tool_reporter_lib.__file__)))
+
+class TestLazyImports(unittest.TestCase):
+
+    def _loaded_modules_after(self, code):
+        env = {**os.environ, 'PYTHONPATH': SRC_PATH + os.pathsep + os.environ.get('PYTHONPATH', '')}
+        res = subprocess.run([sys.executable, '-c', code + '\nimport sys\nprint(" ".join(sys.modules))'],
+                             env = env, capture_output = True, text = True, check = True)
+        return set(res.stdout.split())
+
+    def test_import_does_not_load_heavy_modules(self):
+        loaded = self._loaded_modules_after('import tool_reporter_lib')
+        for module in ['matplotlib', 'pandas', 'numpy', 'keyring', 'webbrowser']:
+            self.assertNotIn(module, loaded)
+
+    def test_text_report_does_not_load_heavy_modules(self):
+        loaded = self._loaded_modules_after(
+            'from tool_reporter_lib import ReportHTML\n'
+            'report = ReportHTML("Title")\n'
+            'report.add_text("text")\n'
+            'report.add_param_value_table({"a": 1})\n'
+            'report._get_html_str()')
+        for module in ['matplotlib', 'pandas', 'numpy', 'keyring']:
+            self.assertNotIn(module, loaded)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from functools import partial
+from tool_reporter_lib import ReportHTML
+from tool_reporter_lib.report_batch import ReportBatch, generate_reports, build_report_from_spec, _get_settings_snapshot
+from tool_reporter_lib.utils.report_settings import Reports_Settings
+
+def build_entity_report(entity_id: int) -> ReportHTML:
+    report = ReportHTML(title = 'Entity', sub_title = 'Batch')
+    report.add_text(f'Entity {entity_id} is OK.')
+    return report
+
+def build_failing_report() -> ReportHTML:
+    raise RuntimeError('no data')
+
+class TestReportBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.folder_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder_path)
+
+    def _read(self, file_path):
+        with open(file_path, encoding='utf-8') as file:
+            return file.read()
+
+    def test_generate_processes(self):
+        jobs = [partial(build_entity_report, i) for i in range(6)]
+        jobs.append({'title': 'Entity', 'elements': [('add_text', ('Spec report.',))]})
+        
+        with ReportBatch(max_workers=2) as batch:
+            paths = batch.generate(jobs, folder_path=self.folder_path)
+        
+        self.assertEqual(len(set(paths)), 7)   # same title, collision-safe names
+        for i in range(6):
+            self.assertIn(f'Entity {i} is OK.', self._read(paths[i]))
+        self.assertIn('Spec report.', self._read(paths[6]))
+        self.assertEqual(len(os.listdir(self.folder_path)), 7)
+
+    def test_generate_serial_and_exceptions(self):
+        paths = generate_reports([partial(build_entity_report, 1), build_failing_report], max_workers=0, 
+                                 folder_path=self.folder_path, return_exceptions=True)
+        self.assertTrue(os.path.exists(paths[0]))
+        self.assertIsInstance(paths[1], RuntimeError)
+        
+        with self.assertRaises(RuntimeError):
+            generate_reports([build_failing_report], max_workers=0, folder_path=self.folder_path)
+
+    def test_generate_compressed(self):
+        paths = generate_reports([partial(build_entity_report, 1)], max_workers=1, 
+                                 compression='gzip', folder_path=self.folder_path)
+        self.assertTrue(paths[0].endswith('.html.gz'))
+        with self.assertRaises(ValueError):
+            generate_reports([], compression='brotli', folder_path=self.folder_path)
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            ReportBatch(max_workers=-1)
+
+    def test_build_report_from_spec(self):
+        report = build_report_from_spec({'title'   : 'Spec',
+                                         'elements': [('add_title', ('Summary',), {'h_level': 3}),
+                                                      ('add_param_value_table', ({'Rows': 10},))]})
+        self.assertEqual(report.title, 'Spec')
+        self.assertEqual(len(report.elements_list), 4)  # style, header, title and table
+        with self.assertRaises(ValueError):
+            build_report_from_spec({'elements': [('save', ())]})
+
+    def test_settings_snapshot(self):
+        settings = _get_settings_snapshot()
+        self.assertEqual(settings['chart_render_workers'], 0)
+        self.assertFalse(settings['use_open_saved_file'])
+        self.assertEqual(settings['df_table_engine'], Reports_Settings.df_table_engine)
+        self.assertNotIn('info', settings)
+
+if __name__ == '__main__':
+    unittest.main()
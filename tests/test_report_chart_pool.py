@@ -0,0 +1,48 @@
+import base64
+import unittest
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from tool_reporter_lib.report_chart_pool import ChartRenderPool
+from tool_reporter_lib.elements.report_element_chart import get_chart_base64, get_chart_image
+
+class TestChartRenderPool(unittest.TestCase):
+
+    def setUp(self):
+        self.figure = plt.figure()
+        plt.plot([1, 2, 3, 4])
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_process_pool_matches_serial(self):
+        pool = ChartRenderPool(max_workers=1)
+        future = pool.submit(self.figure)
+        self.assertEqual(future.result(), get_chart_base64(self.figure))
+        pool.shutdown()
+
+    def test_submit_image_matches_serial(self):
+        pool = ChartRenderPool(max_workers=1)
+        future = pool.submit_image(self.figure, chart_format='webp', quality=50)
+        self.assertEqual(future.result(), get_chart_image(self.figure, chart_format='webp', quality=50))
+        pool.shutdown()
+
+    def test_figure_changed_after_submit(self):
+        expected = get_chart_base64(self.figure)
+        pool = ChartRenderPool(max_workers=1)
+        future = pool.submit(self.figure)
+        plt.plot([4, 3, 2, 1])
+        self.assertEqual(future.result(), expected)
+        pool.shutdown()
+
+    def test_same_figure_submitted_repeatedly(self):
+        pool = ChartRenderPool(max_workers=4)
+        futures = [pool.submit_image(self.figure, as_bytes=True) for _ in range(8)]
+        results = {future.result() for future in futures}
+        pool.shutdown()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results.pop()[1], base64.b64decode(get_chart_base64(self.figure)))
+
+if __name__ == '__main__':
+    unittest.main()
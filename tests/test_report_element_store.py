@@ -0,0 +1,72 @@
+import unittest
+
+from tool_reporter_lib.elements.report_element import ReportElement, ReportElementTypes
+from tool_reporter_lib.report_element_store import ElementSpillStore, SpilledReportElement
+
+
+def _text_element(text):
+    element = ReportElement()
+    element.type = ReportElementTypes.TEXT
+    element.body_content = text
+    element.style_content = '.text {}'
+    return element
+
+
+class TestElementSpillStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ElementSpillStore(memory_budget=10)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_invalid_budget(self):
+        with self.assertRaises(ValueError):
+            ElementSpillStore(memory_budget=-1)
+
+    def test_within_budget_stays_in_memory(self):
+        elements = [_text_element('12345')]
+        self.store.add(elements[0], elements)
+        self.assertIs(type(elements[0]), ReportElement)
+        self.assertEqual(self.store.spilled_size, 0)
+
+    def test_spill_over_budget(self):
+        elements = []
+        for text in ['first €', 'second', 'third']:
+            elements.append(_text_element(text))
+            self.store.add(elements[-1], elements)
+
+        self.assertTrue(all(isinstance(element, SpilledReportElement) for element in elements[:2]))
+        self.assertIs(type(elements[2]), ReportElement)
+        self.assertEqual([element.get_body_str() for element in elements], ['first €', 'second', 'third'])
+        self.assertEqual(elements[0].get_style_str(), '.text {}')
+        self.assertEqual(elements[0].type, ReportElementTypes.TEXT)
+        self.assertEqual(self.store.spilled_size, len('first €'.encode('utf-8')) + len('second'))
+
+    def test_skips_deferred_and_empty_elements(self):
+        placeholder = ReportElement()
+        deferred = ReportElement.deferred(ReportElementTypes.TEXT, _text_element, 'deferred')
+        elements = [placeholder, deferred, _text_element('x' * 20)]
+        self.store.add(elements[-1], elements)
+
+        self.assertIs(elements[0], placeholder)
+        self.assertIs(elements[1], deferred)
+        self.assertFalse(deferred.is_rendered)
+        self.assertIsInstance(elements[2], SpilledReportElement)
+
+    def test_set_body_keeps_it_in_memory(self):
+        elements = [_text_element('x' * 20)]
+        self.store.add(elements[0], elements)
+        elements[0].body_content = 'replaced'
+        self.assertEqual(elements[0].get_body_str(), 'replaced')
+
+    def test_read_after_close(self):
+        elements = [_text_element('x' * 20)]
+        self.store.add(elements[0], elements)
+        self.store.close()
+        with self.assertRaises(ValueError):
+            elements[0].get_body_str()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,16 @@
 import unittest
+import asyncio
 import os
+import threading
+from concurrent.futures import CancelledError
+import io
+import tempfile
+import gzip
 import pandas as pd
 from unittest.mock import patch, MagicMock
 from tool_reporter_lib.report_generator import ReportHTML
+from tool_reporter_lib.utils.report_settings import Reports_Settings
+from tool_reporter_lib.utils.report_minify import minify_html
 
 import matplotlib.pyplot as plt
 
@@ -38,6 +46,241 @@ class TestReportHTML(unittest.TestCase):
         self.report.add_chart(plt)
         self.assertEqual(len(self.report.elements_list), 3)  # style, header, and chart elements
 
+    def test_add_chart_parallel(self):
+        plt.figure()
+        plt.plot([1, 2, 3, 4])
+        self.report.add_chart(plt)
+        serial_body = self.report.elements_list[-1].get_body_str()
+
+        self.report.chart_render_workers = 2
+        self.report.add_chart(plt)
+        plt.close('all')
+        self.assertEqual(len(self.report.elements_list), 4)  # style, header, and two chart elements
+        self.report._get_html_str()
+        self.assertEqual(self.report.elements_list[3].get_body_str(), serial_body)
+
+    def test_add_chart_format(self):
+        plt.figure()
+        plt.plot([1, 2, 3, 4])
+        self.report.add_chart(plt, chart_format='svg')
+        self.assertIn('<svg', self.report.elements_list[-1].get_body_str())
+        with self.assertRaises(ValueError):
+            self.report.add_plot(plt, chart_format='gif')
+
+        self.report.chart_render_workers = 2
+        self.report.add_plot(plt, chart_format='jpeg')
+        plt.close('all')
+        self.report._get_html_str()
+        self.assertIn('data:image/jpeg;base64,', self.report.elements_list[3].get_body_str())
+
+    def test_image_dedup(self):
+        self.report.use_image_dedup = True
+        plt.figure()
+        plt.plot([1, 2, 3, 4])
+        for _ in range(3):
+            self.report.add_chart(plt)
+        self.report.chart_render_workers = 2
+        self.report.add_chart(plt)
+        plt.close('all')
+        plt.figure()
+        plt.plot([4, 3, 2, 1])
+        self.report.add_chart(plt)
+        plt.close('all')
+
+        html = self.report._get_html_str()
+        self.assertEqual(html.count('data-asset='), 4)
+        self.assertEqual(html.count('src="data:image/png;base64,'), 1)  # the single image
+        self.assertEqual(html.count('": "data:image/png;base64,'), 1)   # the shared image, in the asset table
+        self.assertIn('id="report-image-assets"', html)
+
+    def test_image_dedup_without_repeats_is_unchanged(self):
+        plt.figure()
+        plt.plot([1, 2, 3, 4])
+        self.report.add_chart(plt)
+        plain_body = self.report.elements_list[-1].get_body_str()
+
+        self.report.use_image_dedup = True
+        self.report.add_chart(plt, height=100)
+        plt.close('all')
+        self.report._get_html_str()
+        self.assertEqual(self.report.elements_list[3].get_body_str(), plain_body.replace('height=""', 'height="100"'))
+        self.assertEqual(self.report._image_assets.get_script(), '')
+
+    def test_add_code_offline_highlighting(self):
+        def code_sample():
+            return None
+        html = self.report._get_html_str()
+        self.assertNotIn('highlight.js', html)
+        self.assertNotIn('.hljs-keyword', html)
+
+        self.report.add_code(code_sample)
+        html = self.report._get_html_str()
+        self.assertIn('<span class="hljs-keyword">def</span>', html)
+        self.assertIn('.hljs-keyword', html)
+        self.assertNotIn('highlight.js', html)
+
+    def test_add_code_highlight_js(self):
+        def code_sample():
+            return None
+        self.report.use_offline_code_highlighting = False
+        self.report.add_code(code_sample)
+        html = self.report._get_html_str()
+        self.assertIn('<code class="python">        def code_sample():', html)
+        self.assertIn('highlight.js', html)
+        self.assertNotIn('.hljs-keyword', html)
+
+    def test_tree_shaking(self):
+        self.report.add_text("Status: OK")
+        html = self.report._get_html_str()
+        self.assertNotIn('.minimalistic-style-table', html)
+        self.assertNotIn('.toggle-button', html)
+        self.assertNotIn('function toggleContent', html)
+
+        self.report.add_showhide_region_open('Details')
+        self.report.add_dataframe_table(pd.DataFrame({'A': [1, 2]}))
+        self.report.add_showhide_region_close()
+        html = self.report._get_html_str()
+        self.assertIn('.minimalistic-style-table', html)
+        self.assertIn('.toggle-button', html)
+        self.assertEqual(html.count('function toggleContent'), 1)
+        self.assertNotIn('.alert-box', html)
+
+    def test_tree_shaking_disabled(self):
+        self.report.use_tree_shaking = False
+        self.report.add_text("Status: OK")
+        html = self.report._get_html_str()
+        self.assertIn('.minimalistic-style-table', html)
+        self.assertIn('function toggleContent', html)
+
+    def test_element_memory_budget(self):
+        Reports_Settings.set_element_memory_budget(100)
+        try:
+            report = ReportHTML(title="Spilled Report", sub_title="Now", use_title_background=False)
+        finally:
+            Reports_Settings.set_element_memory_budget()
+        reference = ReportHTML(title="Spilled Report", sub_title="Now", use_title_background=False)
+
+        for item in [report, reference]:
+            for i in range(20):
+                item.add_text(f"Spilled text {i}.")
+            item.add_dataframe_table(pd.DataFrame({'A': range(10)}))
+
+        self.assertEqual(report.elements_list[-1].__class__.__name__, 'SpilledReportElement')
+        self.assertGreater(report._element_store.spilled_size, 0)
+        self.assertIsNone(reference._element_store)
+        self.assertEqual(report._get_html_str(), reference._get_html_str())
+
+    def test_save_twice_with_element_memory_budget(self):
+        Reports_Settings.set_element_memory_budget(10)
+        try:
+            report = ReportHTML(title="Spilled Report", file_name="spilled_report", open_saved_file=False)
+        finally:
+            Reports_Settings.set_element_memory_budget()
+        report.add_text("Spilled text one.")
+        report.add_text("Spilled text two.")
+        file_paths = []
+        try:
+            for text in ["Spilled text three.", "Spilled text four."]:
+                report.save_to_file()
+                file_paths.append(report._file_path)
+                report.add_text(text)
+            with open(file_paths[-1], encoding='utf-8') as file:
+                html = file.read()
+        finally:
+            for file_path in file_paths:
+                os.remove(file_path)
+        self.assertIn("Spilled text one.", html)
+        self.assertIn("Spilled text three.", html)
+
+        store = report._element_store
+        self.assertIsNotNone(store._file)
+        del report
+        self.assertIsNone(store._file)
+
+    def _new_live_report(self, folder):
+        report = ReportHTML(title="Live Report", sub_title="Now", use_title_background=False, open_saved_file=False)
+        report.folder_path = folder
+        report._use_default_folder_path = False
+        return report
+
+    def test_flush_live(self):
+        with tempfile.TemporaryDirectory() as folder:
+            report = self._new_live_report(folder)
+            report.add_text("LiveFirst")
+            self.assertTrue(report.flush_live(refresh_seconds=5))
+            file_path = report._file_path
+            report.add_text("LiveSecond")
+            self.assertFalse(report.flush_live(min_interval=3600))
+            self.assertTrue(report.flush_live(refresh_seconds=5))
+
+            with open(file_path, encoding='utf-8') as file:
+                html = file.read()
+            self.assertEqual(report._file_path, file_path)
+            self.assertEqual(os.listdir(folder), [os.path.basename(file_path)])
+            self.assertLess(html.index("LiveFirst"), html.index("LiveSecond"))
+            self.assertIn('<meta http-equiv="refresh" content="5">', html)
+            self.assertTrue(html.endswith('</html> \n'))
+            self.assertEqual(len(report.elements_list), 4)  # style, header and text elements, no footer
+
+            report.add_text("LiveLast")
+            report.save()
+            with open(file_path, encoding='utf-8') as file:
+                final_html = file.read()
+            self.assertEqual(os.listdir(folder), [os.path.basename(file_path)])
+            self.assertIsNone(report._live_file)
+
+            reference = self._new_live_report(folder)
+            for text in ["LiveFirst", "LiveSecond", "LiveLast"]:
+                reference.add_text(text)
+            self.assertEqual(final_html, reference._get_html_str())
+
+    def test_flush_live_removed_element(self):
+        with tempfile.TemporaryDirectory() as folder:
+            report = self._new_live_report(folder)
+            report.add_text("LiveMoved")
+            report.flush_live()
+            report.move_element_to_bottom()
+            report.add_text("LiveTop")
+            report.flush_live()
+            with open(report._file_path, encoding='utf-8') as file:
+                html = file.read()
+            self.assertEqual(html.count("LiveMoved"), 1)
+            self.assertLess(html.index("LiveTop"), html.index("LiveMoved"))
+
+            with self.assertRaises(ValueError):
+                report.save(compression='gzip')
+
+    def test_flush_live_opens_browser_once(self):
+        with tempfile.TemporaryDirectory() as folder:
+            report = self._new_live_report(folder)
+            report.use_open_saved_file = True
+            with patch('webbrowser.open_new_tab') as mock_open:
+                report.flush_live()
+                report.flush_live()
+                report.save()
+                mock_open.assert_called_once_with(report._file_path)
+
+    def test_lazy_elements(self):
+        self.report.use_lazy_elements = True
+        self.report.add_text("Lazy text.")
+        self.report.add_param_value_table({'DroppedParam': 'DroppedValue'})
+        self.assertFalse(self.report.elements_list[2].is_rendered)
+        self.report.elements_list.pop()  # dropped before save, never rendered
+        html = self.report._get_html_str()
+        self.assertIn("Lazy text.", html)
+        self.assertNotIn("DroppedValue", html)
+
+    def test_lazy_elements_not_kept_rendered(self):
+        self.report.use_lazy_elements = True
+        self.report.add_text("Lazy text.")
+        self.report.add_dataframe_table(pd.DataFrame({'LazyColumn': [1, 2]}))
+        lazy_elements = self.report.elements_list[2:]
+        html = self.report._get_html_str()
+        self.assertIn("Lazy text.", html)
+        self.assertIn("LazyColumn", html)
+        self.assertFalse(any(element.is_rendered for element in lazy_elements))
+        self.assertTrue(self.report.elements_list[1].is_rendered)  # header, has a style
+
     def test_add_dataframe_table(self):
         df = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]})
         self.report.add_dataframe_table(df)
@@ -49,6 +292,198 @@ class TestReportHTML(unittest.TestCase):
             self.assertTrue(os.path.exists(self.report._file_path))
             mock_open.assert_called_once_with(self.report._file_path)
 
+    def test_save_async(self):
+        self.report.add_text("Async text.")
+        with patch('webbrowser.open_new_tab') as mock_open:
+            asyncio.run(self.report.save_async())
+            mock_open.assert_called_once_with(self.report._file_path)
+        with open(self.report._file_path, encoding='utf-8') as file:
+            self.assertIn("Async text.", file.read())
+
+    def test_save_async_minified(self):
+        self.report.add_text("Async  minified   text.")
+        with patch('webbrowser.open_new_tab'):
+            asyncio.run(self.report.save_async(minify=True))
+        with open(self.report._file_path, encoding='utf-8') as file:
+            html = file.read()
+        self.assertIn("Async  minified   text.", html)
+        self.assertEqual(html, minify_html(html))
+        self.assertLess(html.count('  '), 20)
+
+    def test_save_cancelled_removes_file(self):
+        cancel_event = threading.Event()
+        cancel_event.set()
+        with self.assertRaises(CancelledError):
+            self.report._write_report_file(cancel_event=cancel_event)
+        self.assertFalse(os.path.exists(self.report._file_path))
+
+    def test_save_failed_removes_file(self):
+        self.report.use_lazy_elements = True
+        self.report._add_element(self.report.elements_list[0].type, lambda: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            self.report.save_to_file()
+        self.assertFalse(os.path.exists(self.report._file_path))
+
+    def test_add_async_keeps_document_order(self):
+        df = pd.DataFrame({'A': [1.5, 2.5]})
+        fig = plt.figure()
+        plt.plot([1, 2, 3])
+
+        async def build():
+            self.report.add_text("AsyncFirst")
+            await asyncio.gather(self.report.add_dataframe_table_async(df, highlight_columns=['A']),
+                                 self.report.add_chart_async(fig, chart_format='svg'))
+            self.report.add_text("AsyncLast")
+
+        asyncio.run(build())
+        plt.close('all')
+        html = self.report._get_html_str()
+        self.assertLess(html.index("AsyncFirst"), html.index('minimalistic-style-table"'))
+        self.assertLess(html.index('minimalistic-style-table"'), html.index('<svg'))
+        self.assertLess(html.index('<svg'), html.index("AsyncLast"))
+
+    def test_add_async_cancelled(self):
+        df = pd.DataFrame({'A': [1.5, 2.5]})
+
+        async def build():
+            task = asyncio.create_task(self.report.add_dataframe_table_async(df))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(build())
+        self.assertEqual(len(self.report.elements_list), 2)  # style and header only
+
+    def test_save_waits_for_async_table(self):
+        df = pd.DataFrame({'PendingColumn': [1.5, 2.5]})
+
+        async def build():
+            task = asyncio.create_task(self.report.add_dataframe_table_async(df))
+            await asyncio.sleep(0)
+            self.report.add_text("AfterTable")
+            with patch('webbrowser.open_new_tab'):
+                self.report.save_to_file()
+            await task
+
+        asyncio.run(build())
+        with open(self.report._file_path, encoding='utf-8') as file:
+            html = file.read()
+        self.assertIn("PendingColumn", html)
+        self.assertLess(html.index("PendingColumn"), html.index("AfterTable"))
+
+    def test_save_async_waits_for_async_table(self):
+        df = pd.DataFrame({'PendingColumn': [1.5, 2.5]})
+
+        async def build():
+            task = asyncio.create_task(self.report.add_dataframe_table_async(df))
+            await asyncio.sleep(0)
+            with patch('webbrowser.open_new_tab'):
+                await self.report.save_async()
+            await task
+
+        asyncio.run(build())
+        with open(self.report._file_path, encoding='utf-8') as file:
+            html = file.read()
+        self.assertIn("PendingColumn", html)
+        self.assertEqual(self.report._pending_tables, [])
+
+    def test_add_async_table_lazy(self):
+        self.report.use_lazy_elements = True
+        asyncio.run(self.report.add_dataframe_table_async(pd.DataFrame({'A': [1.5]})))
+        self.assertFalse(self.report.elements_list[-1].is_rendered)
+        self.assertIn('minimalistic-style-table"', self.report._get_html_str())
+
+    def test_save_compressed(self):
+        self.report.add_text("Compressed text.")
+        with patch('webbrowser.open_new_tab') as mock_open:
+            self.report.save(compression='gzip')
+            mock_open.assert_not_called()
+        self.assertTrue(self.report._file_path.endswith('.html.gz'))
+        with gzip.open(self.report._file_path, 'rt', encoding='utf-8') as file:
+            self.assertIn("Compressed text.", file.read())
+
+        with self.assertRaises(ValueError):
+            self.report.save(compression='brotli')
+
+    def test_save_minified(self):
+        self.report.use_open_saved_file = False
+        self.report.add_text_console("Console   text\n    indented")
+        self.report.add_showhide_region_open("Region")
+        self.report.add_showhide_region_close()
+        html = self.report._get_html_str()
+        self.report.elements_list.pop()  # the footer added by _get_html_str
+        self.report.save(minify=True)
+        with open(self.report._file_path, encoding='utf-8') as file:
+            minified = file.read()
+        self.assertLess(len(minified), len(html))
+        self.assertIn("Console   text\n    indented", minified)
+        self.assertIn('function toggleContent(regionId, btn, regionName) {\n    var content', minified)
+        self.assertNotIn('\n\n', minified)
+
+    def test_save_self_extracting(self):
+        self.report.report_compression = 'self_extracting'
+        self.report.use_open_saved_file = False
+        self.report.save()
+        self.assertTrue(self.report._file_path.endswith('.html'))
+        with open(self.report._file_path, encoding='utf-8') as file:
+            html = file.read()
+        self.assertIn('DecompressionStream', html)
+        self.assertNotIn('Test Subtitle', html)
+
+    def test_write_to_stream(self):
+        self.report.add_text("Streamed text.")
+        stream  = io.StringIO()
+        written = self.report.write_to_stream(stream)
+        html    = stream.getvalue()
+        self.assertEqual(written, len(html))
+        self.assertTrue(html.startswith('<!DOCTYPE html>'))
+        self.assertTrue(html.rstrip().endswith('</html>'))
+        self.assertIn("Streamed text.", html)
+
+    def test_profiling(self):
+        self.assertIsNone(self.report.get_profile_summary())
+
+        Reports_Settings.enable_profiling()
+        try:
+            report = ReportHTML(title="Profiled Report", file_name="test_report_profiled", open_saved_file=False)
+        finally:
+            Reports_Settings.disable_profiling()
+
+        report.add_text("Profiled text.")
+        report.add_profile_table()
+        report.save_to_file()
+        os.remove(report._file_path)
+
+        summary = report.get_profile_summary()
+        self.assertEqual(summary['elements']['TEXT']['count'], 1)
+        self.assertGreater(summary['elements']['TEXT']['bytes'], 0)
+        self.assertIn('STYLE', summary['elements'])
+        self.assertIn('HEAD_TITLE_ON_BACKGROUND', summary['elements'])
+        self.assertEqual(list(summary['phases']), ['collision_resolution', 'html_assembly', 'write'])
+
+        df = report.get_profile_summary(as_dataframe=True)
+        self.assertEqual(list(df.columns), ['stage', 'name', 'seconds', 'bytes'])
+
+    def test_add_dataframe_table_virtual(self):
+        from tool_reporter_lib.elements.report_element_table_df_virtual import VIRTUAL_TABLE_SCRIPT
+
+        self.assertNotIn(VIRTUAL_TABLE_SCRIPT, self.report._get_html_str())
+
+        report = ReportHTML(title="Test Report", file_name="test_report_virtual")
+        report.add_dataframe_table_virtual(pd.DataFrame({'A': range(1000)}), highlight_columns=['A'])
+        html = report._get_html_str()
+        self.assertEqual(html.count(VIRTUAL_TABLE_SCRIPT), 1)
+        self.assertIn('class="virtual-table-scroll"', html)
+
+    def test_dataframe_table_size_policy(self):
+        Reports_Settings.set_df_table_size_policy(max_rows=10)
+        try:
+            self.report.add_dataframe_table(pd.DataFrame({'A': range(1000)}))
+        finally:
+            Reports_Settings.disable_df_table_size_policy()
+        self.assertIn('990 rows omitted', self.report.elements_list[-1].body_content)
+
     def test_update_header_title(self):
         self.report.update_header_title(title="Updated Title", subtitle="Updated Subtitle", use_title_background=False)
         self.assertEqual(self.report.title, "Updated Title")
@@ -0,0 +1,69 @@
+import base64
+import json
+import re
+import shutil
+import subprocess
+import unittest
+
+from tool_reporter_lib.report_image_assets import IMAGE_ASSET_SCRIPT, ImageAssetTable
+
+# Runs IMAGE_ASSET_SCRIPT with a minimal DOM, prints the image sources:
+_NODE_HARNESS = """
+const input  = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+const images = input.ids.map(id => ({ src: '', getAttribute: () => id }));
+global.document = {
+    getElementById: () => ({ textContent: input.json }),
+    querySelectorAll: () => images,
+};
+eval(input.script);
+console.log(JSON.stringify(images.map(image => image.src)));
+"""
+
+
+class TestImageAssetTable(unittest.TestCase):
+
+    def setUp(self):
+        self.assets = ImageAssetTable()
+
+    def test_same_bytes_same_id(self):
+        first = self.assets.add('png', b'image')
+        self.assertEqual(self.assets.add('png', b'image'), first)
+        self.assertNotEqual(self.assets.add('png', b'other'), first)
+        self.assertNotEqual(self.assets.add('webp', b'image'), first)
+        self.assertEqual(self.assets.assets[first]['count'], 2)
+        self.assertEqual(self.assets.assets[first]['base64'], base64.b64encode(b'image').decode())
+
+    def test_single_use_is_embedded(self):
+        asset_id = self.assets.add('png', b'image')
+        body = self.assets.get_chart_element(asset_id, width=100).body_content
+        self.assertIn('src="data:image/png;base64,aW1hZ2U="', body)
+        self.assertIn('width="100"', body)
+        self.assertEqual(self.assets.get_script(), '')
+
+    def test_shared_image_is_referenced(self):
+        asset_id = self.assets.add('jpeg', b'image')
+        self.assets.add('jpeg', b'image')
+        self.assets.add('png', b'single')
+        body = self.assets.get_chart_element(asset_id).body_content
+        self.assertIn(f'data-asset="{asset_id}"', body)
+        self.assertNotIn('src=', body)
+
+        script = self.assets.get_script()
+        table = json.loads(re.search(r'<script type="application/json"[^>]*>(.*?)</script>', script).group(1))
+        self.assertEqual(table, {asset_id: 'data:image/jpeg;base64,aW1hZ2U='})
+
+    @unittest.skipUnless(shutil.which("node"), "node is not installed")
+    def test_script_sets_sources(self):
+        first, second = [self.assets.add('png', image) for image in [b'first', b'second', b'first', b'second']][:2]
+        table = re.search(r'<script type="application/json"[^>]*>(.*?)</script>', self.assets.get_script()).group(1)
+
+        payload = json.dumps({'script': IMAGE_ASSET_SCRIPT, 'json': table, 'ids': [second, first, second]})
+        res = subprocess.run(['node', '-e', _NODE_HARNESS], input=payload, capture_output=True, text=True, check=True)
+
+        sources = json.loads(res.stdout)
+        self.assertEqual(sources, ['data:image/png;base64,c2Vjb25k', 'data:image/png;base64,Zmlyc3Q=',
+                                   'data:image/png;base64,c2Vjb25k'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from tool_reporter_lib.elements.report_element import ReportElement, ReportElementTypes
+from tool_reporter_lib.report_live import LiveReportFile
+
+
+def _text_element(text):
+    element = ReportElement()
+    element.type = ReportElementTypes.TEXT
+    element.body_content = text
+    element.style_content = f'.{text} {{}}'
+    return element
+
+
+class TestLiveReportFile(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.folder.name, 'live.html')
+        self.live = LiveReportFile(self.file_path)
+
+    def tearDown(self):
+        self.live.close()
+        self.folder.cleanup()
+
+    def _write_segments(self, file):
+        file.write(''.join(self.live.iter_styles()) + '|' + ''.join(self.live.iter_bodies()))
+
+    def test_append_and_replace(self):
+        self.assertTrue(self.live.is_due(60))
+        self.live.append([_text_element('first'), _text_element('second')])
+        self.live.replace(self._write_segments)
+        self.live.append([_text_element('third')])
+        self.live.replace(self._write_segments)
+
+        with open(self.file_path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), '.first {}.second {}.third {}|firstsecondthird')
+        self.assertEqual(self.live.flushed_count, 3)
+        self.assertEqual(self.live.element_types, {ReportElementTypes.TEXT})
+        self.assertEqual(os.listdir(self.folder.name), ['live.html'])
+        self.assertFalse(self.live.is_due(60))
+        self.assertTrue(self.live.is_due(0))
+
+    def test_failed_write_keeps_target(self):
+        self.live.append([_text_element('kept')])
+        self.live.replace(self._write_segments)
+
+        def failing_write(file):
+            file.write('partial')
+            raise RuntimeError('failed')
+
+        with self.assertRaises(RuntimeError):
+            self.live.replace(failing_write)
+        with open(self.file_path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), '.kept {}|kept')
+        self.assertEqual(os.listdir(self.folder.name), ['live.html'])
+
+    def test_reset(self):
+        self.live.append([_text_element('dropped')])
+        self.live.reset()
+        self.live.append([_text_element('new')])
+        self.live.replace(self._write_segments)
+        with open(self.file_path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), '.new {}|new')
+        self.assertEqual(self.live.flushed_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import asyncio
+import io
+import threading
+import unittest
+
+from concurrent.futures import CancelledError
+from tool_reporter_lib.utils.report_async import run_cancellable, CancellableStream
+
+class TestRunCancellable(unittest.TestCase):
+
+    def test_result(self):
+        self.assertEqual(asyncio.run(run_cancellable(sum, [1, 2, 3])), 6)
+
+    def test_cancel_waits_for_worker(self):
+        cancel_event = threading.Event()
+        started      = threading.Event()
+        stopped      = threading.Event()
+
+        def work():
+            started.set()
+            cancel_event.wait(5)
+            stopped.set()
+            raise CancelledError()
+
+        async def main():
+            task = asyncio.create_task(run_cancellable(work, cancel_event=cancel_event))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assertTrue(stopped.is_set())  # the worker stopped before the task returned
+
+        asyncio.run(main())
+        self.assertTrue(cancel_event.is_set())
+
+class TestCancellableStream(unittest.TestCase):
+
+    def test_write(self):
+        cancel_event = threading.Event()
+        target       = io.StringIO()
+        stream       = CancellableStream(target, cancel_event)
+        
+        self.assertEqual(stream.write('abc'), 3)
+        cancel_event.set()
+        with self.assertRaises(CancelledError):
+            stream.write('def')
+        self.assertEqual(target.getvalue(), 'abc')
+
+if __name__ == '__main__':
+    unittest.main()
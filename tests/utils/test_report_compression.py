@@ -0,0 +1,104 @@
+import base64
+import gzip
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from tool_reporter_lib.utils.report_compression import (
+    SELF_EXTRACTING_SCRIPT,
+    GzipBase64Writer,
+    get_report_file_format,
+    open_report_stream,
+)
+
+# Runs SELF_EXTRACTING_SCRIPT on the payload, prints the document written by the script:
+_NODE_HARNESS = """
+const input = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+let written = '';
+global.document = {
+    getElementById: () => ({ textContent: input.payload }),
+    open: () => {}, write: (text) => { written += text; },
+    close: () => console.log(JSON.stringify(written)),
+};
+eval(input.script);
+"""
+
+_HTML = '<!DOCTYPE html><html><body>' + ''.join(f'<p>Paragraph {i} ✓</p>' for i in range(20000)) + '</body></html>'
+
+
+def _get_payload(html):
+    return re.search(r'<script id="report-payload" type="application/octet-stream">(.*?)</script>', html, re.S).group(1)
+
+
+class TestReportCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def _write(self, compression, chunks, title='Report'):
+        file_path = os.path.join(self.folder.name, 'report' + get_report_file_format('.html', compression))
+        with open_report_stream(file_path, compression, title) as stream:
+            for chunk in chunks:
+                stream.write(chunk)
+        return file_path
+
+    def _chunks(self):
+        return [_HTML[i:i + 1000] for i in range(0, len(_HTML), 1000)]
+
+    def test_plain(self):
+        file_path = self._write(None, self._chunks())
+        with open(file_path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), _HTML)
+
+    def test_gzip(self):
+        file_path = self._write('gzip', self._chunks())
+        self.assertTrue(file_path.endswith('.html.gz'))
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        self.assertEqual(gzip.decompress(data).decode('utf-8'), _HTML)
+        self.assertLess(len(data), len(_HTML) / 5)
+        with open(self._write('gzip', [_HTML]), 'rb') as file:
+            self.assertEqual(file.read(), data)  # reproducible (no file name, mtime 0)
+
+    def test_self_extracting(self):
+        file_path = self._write('self_extracting', self._chunks(), title='A <b> & c')
+        with open(file_path, encoding='utf-8') as file:
+            html = file.read()
+        self.assertTrue(file_path.endswith('.html'))
+        self.assertIn('<title>A &lt;b&gt; &amp; c</title>', html)
+        self.assertEqual(gzip.decompress(base64.b64decode(_get_payload(html))).decode('utf-8'), _HTML)
+        self.assertLess(len(html), len(_HTML) / 3)
+
+    def test_base64_blocks(self):
+        stream = io.StringIO()
+        writer = GzipBase64Writer(stream, compress_level=0)
+        for chunk in self._chunks():
+            writer.write(chunk)
+        self.assertGreater(len(stream.getvalue()), 0)  # written in blocks before close()
+        self.assertNotIn('=', stream.getvalue())
+        writer.close()
+        self.assertEqual(gzip.decompress(base64.b64decode(stream.getvalue())).decode('utf-8'), _HTML)
+
+    def test_invalid_compression(self):
+        with self.assertRaises(ValueError):
+            self._write('brotli', [])
+
+    @unittest.skipUnless(shutil.which('node'), 'node is not installed')
+    def test_browser_extracts_report(self):
+        with open(self._write('self_extracting', self._chunks()), encoding='utf-8') as file:
+            payload = _get_payload(file.read())
+        res = subprocess.run(['node', '-e', _NODE_HARNESS], capture_output=True, text=True, check=True,
+                             input=json.dumps({'script': SELF_EXTRACTING_SCRIPT, 'payload': payload}))
+        self.assertEqual(json.loads(res.stdout), _HTML)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import io
+import unittest
+
+from tool_reporter_lib.utils.report_minify import HtmlMinifier, MinifyingStream, minify_html
+
+HTML_CODE = ('<html>\n  <head>  <script>  var a = "x   y";\n  if (a<b) {}</script>\n'
+             '<style> pre  code {color:  red} </style></head>\n'
+             '<body class="a  b"   id=x>\n\n  <pre class="p">  keep\n   this </PRE>  <code>  c  </code>'
+             ' <textarea> t  </textarea>  <!-- comment\n -->  end\xa0\xa0  x'
+             ' <img alt="a > b   c"\n   src=\'y  z\'> <b>a</b>   <i>b</i>'
+             '<div style="font-family: monospace; white-space: pre;">\n  <div>  a  </div>  b\n</div>   <div>  c </div>'
+             '</body></html>')
+
+EXPECTED = ('<html>\n<head> <script>  var a = "x   y";\n  if (a<b) {}</script>\n'
+            '<style> pre code {color: red} </style></head>\n'
+            '<body class="a  b" id=x>\n<pre class="p">  keep\n   this </PRE> <code>  c  </code>'
+            ' <textarea> t  </textarea> end\xa0\xa0 x'
+            ' <img alt="a > b   c"\nsrc=\'y  z\'> <b>a</b> <i>b</i>'
+            '<div style="font-family: monospace; white-space: pre;">\n  <div>  a  </div>  b\n</div> <div> c </div>'
+            '</body></html>')
+
+
+class TestHtmlMinifier(unittest.TestCase):
+
+    def test_minify_html(self):
+        self.assertEqual(minify_html(HTML_CODE), EXPECTED)
+
+    def test_idempotent(self):
+        self.assertEqual(minify_html(EXPECTED), EXPECTED)
+
+    def test_chunks_give_same_result(self):
+        for size in [1, 2, 3, 5, 8, 13]:
+            minifier = HtmlMinifier()
+            chunks = [minifier.feed(HTML_CODE[i:i + size]) for i in range(0, len(HTML_CODE), size)]
+            self.assertEqual(''.join(chunks) + minifier.close(), EXPECTED, size)
+
+    def test_styled_element_is_not_buffered(self):
+        minifier = HtmlMinifier()
+        self.assertEqual(minifier.feed('<div style="white-space: pre;">a  b</div>  <p>x</p>'),
+                         '<div style="white-space: pre;">a  b</div> <p>x')
+        self.assertEqual(minifier.close(), '</p>')
+
+    def test_quoted_values_are_kept(self):
+        self.assertEqual(minify_html('<img alt = "a  b"   title=\'c\n d\'>  x'), '<img alt = "a  b" title=\'c\n d\'> x')
+
+    def test_unfinished_comment_is_kept(self):
+        self.assertEqual(minify_html('<p>a</p>   <!-- open  end'), '<p>a</p> <!-- open  end')
+
+    def test_minifying_stream(self):
+        target = io.StringIO()
+        stream = MinifyingStream(target)
+        self.assertEqual(stream.write(HTML_CODE[:40]), 40)
+        stream.write(HTML_CODE[40:])
+        stream.finish()
+        self.assertEqual(target.getvalue(), EXPECTED)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import io
+import unittest
+
+from tool_reporter_lib.elements import ReportElementTypes, get_text_element
+from tool_reporter_lib.utils.report_profiler import ReportProfiler
+
+class TestReportProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = ReportProfiler()
+
+    def test_timed_builder(self):
+        builder = self.profiler.timed_builder(ReportElementTypes.TEXT, get_text_element)
+        element = builder('Some text')
+
+        self.assertEqual(element.type, ReportElementTypes.TEXT)
+        self.assertEqual(len(self.profiler.element_records), 1)
+        record = self.profiler.element_records[0]
+        self.assertEqual(record['type'], 'TEXT')
+        self.assertGreaterEqual(record['seconds'], 0)
+        self.assertEqual(record['bytes'], len(element.body_content.encode('utf-8')))
+
+    def test_phase(self):
+        with self.profiler.phase('collision_resolution'):
+            pass
+        with self.profiler.phase('collision_resolution'):
+            pass
+        self.assertIn('collision_resolution', self.profiler.summary()['phases'])
+
+    def test_write_chunks(self):
+        stream  = io.StringIO()
+        written = self.profiler.write_chunks(iter(['<html>', 'body', '</html>']), stream)
+
+        self.assertEqual(written, len('<html>body</html>'))
+        self.assertEqual(stream.getvalue(), '<html>body</html>')
+        self.assertEqual(list(self.profiler.summary()['phases']), ['html_assembly', 'write'])
+
+    def test_summary_and_pv_data(self):
+        builder = self.profiler.timed_builder(ReportElementTypes.TEXT, get_text_element)
+        builder('a')
+        builder('b')
+
+        summary = self.profiler.summary()
+        self.assertEqual(summary['elements']['TEXT']['count'], 2)
+        self.assertEqual(summary['elements_bytes'], summary['elements']['TEXT']['bytes'])
+        self.assertIn('TEXT (x2)', self.profiler.get_pv_data())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,21 @@ class TestReportsSettings(unittest.TestCase):
         Reports_Settings.activate_default_report_path()
         self.assertEqual(Reports_Settings._folder_path, 'C:\\Reports\\')
 
+    @patch('tool_reporter_lib.utils.report_settings.keyring')
+    def test_get_folder_path_activates_once(self, mock_keyring):
+        mock_keyring.get_password.return_value = 'C:\\Keyring\\'
+        with patch.object(Reports_Settings, '_default_report_path_activated', False):
+            self.assertEqual(Reports_Settings.get_folder_path(), 'C:\\Keyring\\')
+            Reports_Settings.get_folder_path()
+        mock_keyring.get_password.assert_called_once()
+
+    @patch('tool_reporter_lib.utils.report_settings.keyring')
+    def test_set_folder_path_skips_activation(self, mock_keyring):
+        with patch.object(Reports_Settings, '_default_report_path_activated', False):
+            Reports_Settings.set_folder_path('D:\\Explicit')
+            self.assertEqual(Reports_Settings.get_folder_path(), 'D:\\Explicit')
+        mock_keyring.get_password.assert_not_called()
+
     def test_set_folder_path(self):
         folder_path = 'D:\\CustomReports'
         Reports_Settings.set_folder_path(folder_path)
@@ -36,6 +51,81 @@ class TestReportsSettings(unittest.TestCase):
         Reports_Settings.enable_header_title_on_background()
         self.assertTrue(Reports_Settings.use_header_title_on_background)
 
+    def test_set_df_table_engine(self):
+        Reports_Settings.set_df_table_engine('styler')
+        self.assertEqual(Reports_Settings.df_table_engine, 'styler')
+        Reports_Settings.set_df_table_engine('fast')
+        self.assertEqual(Reports_Settings.df_table_engine, 'fast')
+        with self.assertRaises(ValueError):
+            Reports_Settings.set_df_table_engine('unknown')
+
+    def test_set_df_table_size_policy(self):
+        Reports_Settings.set_df_table_size_policy(max_rows = 1000, strategy = 'top_k', top_k_column = 'A')
+        self.assertEqual(Reports_Settings.df_table_max_rows, 1000)
+        self.assertEqual(Reports_Settings.df_table_truncate_strategy, 'top_k')
+        self.assertEqual(Reports_Settings.df_table_top_k_column, 'A')
+        with self.assertRaises(ValueError):
+            Reports_Settings.set_df_table_size_policy(max_rows = 10, strategy = 'top_k')
+        Reports_Settings.disable_df_table_size_policy()
+        self.assertIsNone(Reports_Settings.df_table_max_rows)
+        self.assertIsNone(Reports_Settings.df_table_max_cells)
+        Reports_Settings.set_df_table_size_policy()
+
+    def test_set_chart_format(self):
+        Reports_Settings.set_chart_format('auto', png_palette_colors = 64, size_budget = 100_000)
+        self.assertEqual(Reports_Settings.chart_format, 'auto')
+        self.assertEqual(Reports_Settings.chart_png_palette_colors, 64)
+        self.assertEqual(Reports_Settings.chart_size_budget, 100_000)
+        with self.assertRaises(ValueError):
+            Reports_Settings.set_chart_format('gif')
+        with self.assertRaises(ValueError):
+            Reports_Settings.set_chart_format('jpeg', quality = 101)
+        Reports_Settings.set_chart_format()
+        self.assertEqual(Reports_Settings.chart_format, 'png')
+        self.assertIsNone(Reports_Settings.chart_size_budget)
+
+    def test_image_dedup(self):
+        Reports_Settings.enable_image_dedup()
+        self.assertTrue(Reports_Settings.use_image_dedup)
+        Reports_Settings.disable_image_dedup()
+        self.assertFalse(Reports_Settings.use_image_dedup)
+
+    def test_offline_code_highlighting(self):
+        Reports_Settings.disable_offline_code_highlighting()
+        self.assertFalse(Reports_Settings.use_offline_code_highlighting)
+        Reports_Settings.enable_offline_code_highlighting()
+        self.assertTrue(Reports_Settings.use_offline_code_highlighting)
+
+    def test_tree_shaking(self):
+        Reports_Settings.disable_tree_shaking()
+        self.assertFalse(Reports_Settings.use_tree_shaking)
+        Reports_Settings.enable_tree_shaking()
+        self.assertTrue(Reports_Settings.use_tree_shaking)
+
+    def test_set_report_compression(self):
+        Reports_Settings.set_report_compression('self_extracting')
+        self.assertEqual(Reports_Settings.report_compression, 'self_extracting')
+        with self.assertRaises(ValueError):
+            Reports_Settings.set_report_compression('brotli')
+        Reports_Settings.set_report_compression()
+        self.assertIsNone(Reports_Settings.report_compression)
+
+    def test_minify_html(self):
+        Reports_Settings.enable_minify_html()
+        self.assertTrue(Reports_Settings.use_minify_html)
+        Reports_Settings.disable_minify_html()
+        self.assertFalse(Reports_Settings.use_minify_html)
+
+    def test_set_element_memory_budget(self):
+        Reports_Settings.set_element_memory_budget(1024, spill_dir='spill')
+        self.assertEqual(Reports_Settings.element_memory_budget, 1024)
+        self.assertEqual(Reports_Settings.element_spill_dir, 'spill')
+        with self.assertRaises(ValueError):
+            Reports_Settings.set_element_memory_budget(-1)
+        Reports_Settings.set_element_memory_budget()
+        self.assertIsNone(Reports_Settings.element_memory_budget)
+        self.assertIsNone(Reports_Settings.element_spill_dir)
+
     @patch('builtins.print')
     def test_info(self, mock_print):
         Reports_Settings.info()
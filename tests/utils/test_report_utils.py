@@ -1,8 +1,14 @@
+import os
+import tempfile
 import unittest
 
+from concurrent.futures import ThreadPoolExecutor
+
 from tool_reporter_lib.utils.report_utils import (
     sanitize_filename,
     update_filename,
+    claim_unique_file_name,
+    clear_file_index_cache,
     get_current_datetime,
     get_clean_HTML_code
 )
@@ -45,5 +51,61 @@ class TestReportUtils(unittest.TestCase):
         expected_clean_html_with_newlines = '<div><p>Line 1</p><p>Line 2</p></div>'
         self.assertEqual(get_clean_HTML_code(html_code_with_newlines), expected_clean_html_with_newlines)
 
+
+class TestClaimUniqueFileName(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder   = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _touch(self, file_name):
+        open(os.path.join(self.folder, file_name), 'w').close()
+
+    def test_free_name_is_kept(self):
+        self.assertEqual(claim_unique_file_name(self.folder, 'report'), 'report')
+        self.assertTrue(os.path.exists(os.path.join(self.folder, 'report.html')))
+
+    def test_sequence_same_as_update_filename(self):
+        names = [claim_unique_file_name(self.folder, 'report') for _ in range(4)]
+        self.assertEqual(names, ['report', 'report_(0001)', 'report_(0002)', 'report_(0003)'])
+
+    def test_continues_after_highest_index(self):
+        for file_name in ['report.html', 'report_(0002).html', 'report_(0041).html', 'other_(0099).html']:
+            self._touch(file_name)
+        self.assertEqual(claim_unique_file_name(self.folder, 'report'), 'report_(0042)')
+
+    def test_name_with_index(self):
+        self._touch('report_(0003).html')
+        self.assertEqual(claim_unique_file_name(self.folder, 'report_(0003)'), 'report_(0004)')
+
+    def test_index_above_9999(self):
+        for file_name in ['report.html', 'report_(9999).html']:
+            self._touch(file_name)
+        self.assertEqual(claim_unique_file_name(self.folder, 'report'), 'report_(10000)')
+
+    def test_skips_files_created_by_others(self):
+        self._touch('report.html')
+        self.assertEqual(claim_unique_file_name(self.folder, 'report'), 'report_(0001)')
+        self._touch('report_(0002).html')    # not seen by the cached index
+        self.assertEqual(claim_unique_file_name(self.folder, 'report'), 'report_(0003)')
+
+    def test_clear_file_index_cache(self):
+        names = [claim_unique_file_name(self.folder, 'report') for _ in range(3)]
+        for name in names[1:]:
+            os.remove(os.path.join(self.folder, name + '.html'))
+        self.assertEqual(claim_unique_file_name(self.folder, 'report'), 'report_(0003)')
+        os.remove(os.path.join(self.folder, 'report_(0003).html'))
+        clear_file_index_cache(self.folder)
+        self.assertEqual(claim_unique_file_name(self.folder, 'report'), 'report_(0001)')
+
+    def test_concurrent_claims_are_unique(self):
+        with ThreadPoolExecutor(max_workers = 8) as executor:
+            names = list(executor.map(lambda _: claim_unique_file_name(self.folder, 'report'), range(50)))
+        self.assertEqual(len(set(names)), 50)
+        self.assertEqual(len(os.listdir(self.folder)), 50)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file